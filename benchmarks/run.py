@@ -18,6 +18,7 @@ import json
 import os
 import sys
 import time
+import tracemalloc
 
 import json5
 
@@ -29,12 +30,21 @@ ALL_BENCHMARKS = (
 
 DEFAULT_ITERATIONS = 3
 
+# The longest string values that are interned by --memory.
+INTERN_STRINGS = 32
+
 THIS_DIR = os.path.abspath(os.path.dirname(__file__))
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--pure', action='store_true')
+    parser.add_argument(
+        '--memory',
+        action='store_true',
+        help='also report how much memory the decoded values use, '
+        'with and without interning keys and short strings',
+    )
     parser.add_argument(
         '-n', '--num-iterations', default=DEFAULT_ITERATIONS, type=int
     )
@@ -60,6 +70,10 @@ def main():
 
     maker = py_maker if args.pure else json.JSONDecoder
 
+    # Compare like with like: without --pure, json5 uses its C extension
+    # (if it has been built), just as json uses its own.
+    engine = 'scanner' if args.pure else None
+
     all_times = []
     for i, c in enumerate(file_contents):
         json_time = 0.0
@@ -68,7 +82,7 @@ def main():
             start = time.time()
             json_obj = json.loads(c, cls=maker)
             mid = time.time()
-            json5_obj = json5.loads(c)
+            json5_obj = json5.loads(c, engine=engine)
             end = time.time()
 
             json_time += mid - start
@@ -82,30 +96,60 @@ def main():
             if json5_time > json_time:
                 avg = json5_time / json_time
                 print(
-                    f'{fname:-%20s}: JSON was {avg:5.1f}x faster '
-                    f'({json_time:.6f} to {json5_time:.6fs}'
+                    f'{fname:20s}: JSON was {avg:5.1f}x faster '
+                    f'({json_time:.6f} to {json5_time:.6f})'
                 )
             else:
                 avg = json_time / json5_time
                 print(
-                    f'{fname:-%20s}: JSON5 was {avg:5.1f}x faster '
-                    f'({json5_time:.6f} to {json_time:.6fs}'
+                    f'{fname:20s}: JSON5 was {avg:5.1f}x faster '
+                    f'({json5_time:.6f} to {json_time:.6f})'
                 )
         elif json5_time:
             print(
-                f'{fname:-20s}: JSON5 took {json5_time:.6f} secs, '
+                f'{fname:20s}: JSON5 took {json5_time:.6f} secs, '
                 f'JSON was too fast to measure'
             )
         elif json_time:
             print(
-                f'{fname:-20s}: JSON took {json_time:.6f} secs, '
+                f'{fname:20s}: JSON took {json_time:.6f} secs, '
                 f'JSON5 was too fast to measure'
             )
         else:
-            print(f'{fname:-20s}: both were too fast to measure')
+            print(f'{fname:20s}: both were too fast to measure')
+
+    if args.memory:
+        print()
+        for i, c in enumerate(file_contents):
+            fname = os.path.basename(args.benchmarks[i])
+            plain = _memory_used(json5.loads, c, engine=engine)
+            interned = _memory_used(
+                json5.loads,
+                c,
+                engine=engine,
+                intern_keys=True,
+                intern_strings=INTERN_STRINGS,
+            )
+            print(
+                f'{fname:20s}: {plain / 1e6:6.2f} MB, '
+                f'{interned / 1e6:6.2f} MB with interning '
+                f'({100 * (1 - interned / plain):4.1f}% less)'
+            )
 
     return 0
 
 
+def _memory_used(decode, *args, **kwargs):
+    """Returns the number of bytes held by the result of `decode()`."""
+    tracemalloc.start()
+    try:
+        obj = decode(*args, **kwargs)
+        used, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del obj
+    return used
+
+
 if __name__ == '__main__':
     sys.exit(main())
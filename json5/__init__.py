@@ -12,20 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""A pure Python implementation of the JSON5 configuration language."""
+"""A Python implementation of the JSON5 configuration language.
 
-from json5.lib import JSON5Encoder, QuoteStyle, load, loads, parse, dump, dumps
+Decoding is sped up by an optional C extension, when it has been built.
+"""
+
+from json5.cache import Cache, load_cached
+from json5.lines import LineIndex, line_index
+from json5.lib import (
+    FrozenDict,
+    JSON5DecodeError,
+    JSON5Decoder,
+    JSON5Encoder,
+    QuoteStyle,
+    events,
+    iterload,
+    iterloads,
+    load,
+    load_path,
+    loads,
+    parse,
+    dump,
+    dumps,
+)
 from json5.version import __version__, VERSION
 
 
 __all__ = [
+    'Cache',
+    'FrozenDict',
+    'JSON5DecodeError',
+    'JSON5Decoder',
     'JSON5Encoder',
+    'LineIndex',
     'QuoteStyle',
     'VERSION',
     '__version__',
     'dump',
     'dumps',
+    'events',
+    'iterload',
+    'iterloads',
+    'line_index',
     'parse',
     'load',
+    'load_cached',
+    'load_path',
     'loads',
 ]
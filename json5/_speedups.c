@@ -0,0 +1,1063 @@
+/* Copyright 2026 Google Inc. All rights reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+/* An optional C implementation of the decoder in json5/scanner.py.
+ *
+ * This only handles documents that are valid. When it hits a syntax
+ * error, or something it doesn't handle itself (identifiers containing
+ * escapes or non-ASCII characters), it gives up and returns None, and
+ * the caller falls back to the Python scanner, which reports the error
+ * or decodes the document properly. Exceptions raised by the hooks are
+ * propagated as usual.
+ *
+ * `scan()` also accepts UTF-8 text in any object that supports the buffer
+ * protocol (bytes, memoryview, mmap, ...), so that the caller doesn't
+ * need to decode all of it first. In that case `data` points at the
+ * bytes, `CHAR()` reads one byte at a time, and positions are byte
+ * offsets. All of the syntax is ASCII, so only whitespace, comments and
+ * strings need to look at multi-byte characters (see `read_char()`).
+ * Invalid UTF-8 makes the scanner give up, so that the caller's decoding
+ * of the whole buffer reports the error.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+typedef struct {
+    PyObject *str;  /* NULL if `utf8` is set. */
+    int utf8;
+    int kind;
+    const void *data;
+    Py_ssize_t end;
+    int strict;
+    PyObject *dictify;
+    PyObject *parse_float;
+    PyObject *parse_int;
+    PyObject *parse_constant;
+    PyObject *listify;
+    PyObject *intern_table;
+    Py_ssize_t intern_strings;
+    int intern_keys;
+} Scanner;
+
+/* Returned (with no exception set) when the scanner gives up. */
+#define GIVE_UP NULL
+
+#define CHAR(s, i) PyUnicode_READ((s)->kind, (s)->data, (i))
+
+static PyObject *base_16_kwargs = NULL;
+
+/* Must match MAX_INTERNED in scanner.py. */
+#define MAX_INTERNED 65536
+
+static PyObject *scan_value(Scanner *s, Py_ssize_t pos, Py_ssize_t *next);
+
+/* Reads the character at `pos` into `*c`, returning its length, or -1 if
+ * it isn't valid UTF-8. */
+static int
+read_char(Scanner *s, Py_ssize_t pos, Py_UCS4 *c)
+{
+    Py_UCS4 value = CHAR(s, pos);
+    int len;
+    int i;
+
+    if (!s->utf8 || value < 0x80) {
+        *c = value;
+        return 1;
+    }
+    if (value >= 0xc2 && value <= 0xdf) {
+        len = 2;
+        value &= 0x1f;
+    }
+    else if (value >= 0xe0 && value <= 0xef) {
+        len = 3;
+        value &= 0x0f;
+    }
+    else if (value >= 0xf0 && value <= 0xf4) {
+        len = 4;
+        value &= 0x07;
+    }
+    else {
+        return -1;
+    }
+    if (pos + len > s->end) {
+        return -1;
+    }
+    for (i = 1; i < len; i++) {
+        Py_UCS4 byte = CHAR(s, pos + i);
+        if ((byte & 0xc0) != 0x80) {
+            return -1;
+        }
+        value = (value << 6) | (byte & 0x3f);
+    }
+    /* Overlong encodings, surrogates, and values past U+10FFFF. */
+    if ((len == 3 && value < 0x800) || (len == 4 && value < 0x10000) ||
+        value > 0x10ffff || (value >= 0xd800 && value <= 0xdfff)) {
+        return -1;
+    }
+    *c = value;
+    return len;
+}
+
+/* Returns `s[start:stop]`, decoding it if `s` holds UTF-8. */
+static PyObject *
+substring(Scanner *s, Py_ssize_t start, Py_ssize_t stop)
+{
+    if (s->utf8) {
+        return PyUnicode_DecodeUTF8((const char *)s->data + start,
+                                    stop - start, NULL);
+    }
+    return PyUnicode_Substring(s->str, start, stop);
+}
+
+static int
+is_ws(Py_UCS4 c)
+{
+    switch (c) {
+    case ' ': case '\t': case '\n': case '\v': case '\f': case '\r':
+    case 0xa0: case 0xfeff: case 0x2028: case 0x2029:
+    /* The rest of the characters in the Unicode 'Zs' category. */
+    case 0x1680: case 0x202f: case 0x205f: case 0x3000:
+        return 1;
+    default:
+        return c >= 0x2000 && c <= 0x200a;
+    }
+}
+
+static int
+is_eol(Py_UCS4 c)
+{
+    return c == '\n' || c == '\r' || c == 0x2028 || c == 0x2029;
+}
+
+static int
+is_digit(Py_UCS4 c)
+{
+    return c >= '0' && c <= '9';
+}
+
+static int
+hex_value(Py_UCS4 c)
+{
+    if (c >= '0' && c <= '9') {
+        return c - '0';
+    }
+    if (c >= 'a' && c <= 'f') {
+        return c - 'a' + 10;
+    }
+    if (c >= 'A' && c <= 'F') {
+        return c - 'A' + 10;
+    }
+    return -1;
+}
+
+static int
+is_ascii_id_start(Py_UCS4 c)
+{
+    return (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z') || c == '$' ||
+           c == '_';
+}
+
+static int
+is_ascii_id_continue(Py_UCS4 c)
+{
+    return is_ascii_id_start(c) || is_digit(c);
+}
+
+/* Returns the position of the first non-whitespace, non-comment
+ * character at or after `pos`, or -1 if a comment is unterminated (or
+ * isn't valid UTF-8). */
+static Py_ssize_t
+skip_ws(Scanner *s, Py_ssize_t pos)
+{
+    Py_ssize_t end = s->end;
+    Py_UCS4 c;
+    int len;
+
+    while (pos < end) {
+        c = CHAR(s, pos);
+        if (c == '/' && pos + 1 < end && CHAR(s, pos + 1) == '/') {
+            pos += 2;
+            while (pos < end) {
+                len = read_char(s, pos, &c);
+                if (len < 0) {
+                    return -1;
+                }
+                if (is_eol(c)) {
+                    break;
+                }
+                pos += len;
+            }
+        }
+        else if (c == '/' && pos + 1 < end && CHAR(s, pos + 1) == '*') {
+            pos += 2;
+            while (pos + 1 < end &&
+                   !(CHAR(s, pos) == '*' && CHAR(s, pos + 1) == '/')) {
+                len = read_char(s, pos, &c);
+                if (len < 0) {
+                    return -1;
+                }
+                pos += len;
+            }
+            if (pos + 1 >= end) {
+                return -1;
+            }
+            pos += 2;
+        }
+        else {
+            len = read_char(s, pos, &c);
+            if (len < 0 || !is_ws(c)) {
+                break;
+            }
+            pos += len;
+        }
+    }
+    return pos;
+}
+
+/* Returns whether the character at `pos` (which must be past the end of a
+ * number or an identifier) could continue an identifier, in which case
+ * the scanner leaves it to Python. */
+static int
+continues_id(Scanner *s, Py_ssize_t pos)
+{
+    Py_UCS4 c = CHAR(s, pos);
+    if (c == '\\' || is_ascii_id_continue(c)) {
+        return 1;
+    }
+    if (c > 0x7f) {
+        return read_char(s, pos, &c) < 0 || !is_ws(c);
+    }
+    return 0;
+}
+
+static PyObject *
+scan_keyword(Scanner *s, Py_ssize_t pos, const char *word, PyObject *value,
+             Py_ssize_t *next)
+{
+    Py_ssize_t i;
+    for (i = 0; word[i]; i++) {
+        if (pos + i >= s->end || CHAR(s, pos + i) != (Py_UCS4)word[i]) {
+            return GIVE_UP;
+        }
+    }
+    *next = pos + i;
+    Py_INCREF(value);
+    return value;
+}
+
+typedef struct {
+    Py_UCS4 *buf;
+    Py_ssize_t len;
+    Py_ssize_t cap;
+} CharBuffer;
+
+static int
+buffer_append(CharBuffer *b, Py_UCS4 c)
+{
+    if (b->len == b->cap) {
+        Py_ssize_t cap = b->cap ? b->cap * 2 : 64;
+        Py_UCS4 *buf = PyMem_Realloc(b->buf, cap * sizeof(Py_UCS4));
+        if (buf == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        b->buf = buf;
+        b->cap = cap;
+    }
+    b->buf[b->len++] = c;
+    return 0;
+}
+
+static int
+scan_hex(Scanner *s, Py_ssize_t pos, int ndigits, Py_UCS4 *result)
+{
+    Py_UCS4 value = 0;
+    int i;
+    for (i = 0; i < ndigits; i++) {
+        int digit;
+        if (pos + i >= s->end) {
+            return -1;
+        }
+        digit = hex_value(CHAR(s, pos + i));
+        if (digit < 0) {
+            return -1;
+        }
+        value = value * 16 + digit;
+    }
+    *result = value;
+    return 0;
+}
+
+/* `pos` is the position of the opening quote. */
+static PyObject *
+scan_string(Scanner *s, Py_ssize_t pos, Py_ssize_t *next)
+{
+    Py_ssize_t end = s->end;
+    Py_UCS4 quote = CHAR(s, pos);
+    Py_ssize_t i = pos + 1;
+    CharBuffer b = {NULL, 0, 0};
+    PyObject *result;
+
+    /* The common case: no escapes and no line terminators. */
+    while (i < end) {
+        Py_UCS4 c = CHAR(s, i);
+        if (c == quote || c == '\\' || is_eol(c)) {
+            break;
+        }
+        /* U+2028 and U+2029 in UTF-8. */
+        if (s->utf8 && c == 0xe2 && i + 2 < end && CHAR(s, i + 1) == 0x80 &&
+            (CHAR(s, i + 2) == 0xa8 || CHAR(s, i + 2) == 0xa9)) {
+            break;
+        }
+        i++;
+    }
+    if (i < end && CHAR(s, i) == quote) {
+        result = substring(s, pos + 1, i);
+        if (result == NULL && PyErr_ExceptionMatches(PyExc_UnicodeDecodeError)) {
+            PyErr_Clear();
+            return GIVE_UP;
+        }
+        *next = i + 1;
+        return result;
+    }
+
+    for (i = pos + 1; i < end; i++) {
+        Py_UCS4 c;
+        int len = read_char(s, i, &c);
+        if (len < 0) {
+            goto give_up;
+        }
+        i += len - 1;
+        if (c == quote) {
+            result = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, b.buf,
+                                               b.len);
+            PyMem_Free(b.buf);
+            *next = i + 1;
+            return result;
+        }
+        if (c == '\\') {
+            if (++i == end) {
+                break;
+            }
+            len = read_char(s, i, &c);
+            if (len < 0) {
+                goto give_up;
+            }
+            i += len - 1;
+            switch (c) {
+            case 'b': c = '\b'; break;
+            case 'f': c = '\f'; break;
+            case 'n': c = '\n'; break;
+            case 'r': c = '\r'; break;
+            case 't': c = '\t'; break;
+            case 'v': c = '\v'; break;
+            case 'x':
+                if (scan_hex(s, i + 1, 2, &c) < 0) {
+                    goto give_up;
+                }
+                i += 2;
+                break;
+            case 'u':
+                if (scan_hex(s, i + 1, 4, &c) < 0) {
+                    goto give_up;
+                }
+                i += 4;
+                break;
+            case '0':
+                if (i + 1 < end && is_digit(CHAR(s, i + 1))) {
+                    goto give_up;
+                }
+                c = '\0';
+                break;
+            case '1': case '2': case '3': case '4': case '5':
+            case '6': case '7': case '8': case '9':
+                goto give_up;
+            case '\r':
+                if (i + 1 < end && CHAR(s, i + 1) == '\n') {
+                    i++;
+                }
+                continue;
+            case '\n': case 0x2028: case 0x2029:
+                continue;
+            default:
+                /* Any other character stands for itself. */
+                break;
+            }
+        }
+        else if (c == 0x2028 || c == 0x2029 || (s->strict && is_eol(c))) {
+            goto give_up;
+        }
+        if (buffer_append(&b, c) < 0) {
+            PyMem_Free(b.buf);
+            return NULL;
+        }
+    }
+
+give_up:
+    PyMem_Free(b.buf);
+    return GIVE_UP;
+}
+
+static PyObject *
+scan_key(Scanner *s, Py_ssize_t pos, Py_ssize_t *next)
+{
+    Py_ssize_t i;
+    Py_UCS4 c;
+    if (pos == s->end) {
+        return GIVE_UP;
+    }
+    c = CHAR(s, pos);
+    if (c == '"' || c == '\'') {
+        return scan_string(s, pos, next);
+    }
+    if (!is_ascii_id_start(c)) {
+        return GIVE_UP;
+    }
+    for (i = pos + 1; i < s->end; i++) {
+        if (!is_ascii_id_continue(CHAR(s, i))) {
+            if (continues_id(s, i)) {
+                /* Leave escapes and Unicode identifiers to Python. */
+                return GIVE_UP;
+            }
+            break;
+        }
+    }
+    *next = i;
+    return substring(s, pos, i);
+}
+
+/* Returns the string in the intern table that is equal to `str`, adding
+ * `str` to the table if it isn't there and the table isn't full. Steals
+ * the reference to `str`, which may be NULL. */
+static PyObject *
+intern_str(Scanner *s, PyObject *str)
+{
+    PyObject *interned;
+
+    if (str == NULL || s->intern_table == Py_None) {
+        return str;
+    }
+    interned = PyDict_GetItemWithError(s->intern_table, str);
+    if (interned != NULL) {
+        Py_INCREF(interned);
+        Py_DECREF(str);
+        return interned;
+    }
+    if (PyErr_Occurred() ||
+        (PyDict_GET_SIZE(s->intern_table) < MAX_INTERNED &&
+         PyDict_SetItem(s->intern_table, str, str) < 0)) {
+        Py_DECREF(str);
+        return NULL;
+    }
+    return str;
+}
+
+static PyObject *
+scan_object(Scanner *s, Py_ssize_t pos, Py_ssize_t *next)
+{
+    Py_ssize_t end = s->end;
+    int use_dict = s->dictify == (PyObject *)&PyDict_Type;
+    PyObject *container = use_dict ? PyDict_New() : PyList_New(0);
+    PyObject *key = NULL;
+    PyObject *val = NULL;
+    PyObject *result;
+
+    if (container == NULL) {
+        return NULL;
+    }
+    pos = skip_ws(s, pos + 1);
+    if (pos < 0) {
+        goto error;
+    }
+    if (pos < end && CHAR(s, pos) == '}') {
+        goto done;
+    }
+    for (;;) {
+        key = scan_key(s, pos, &pos);
+        if (s->intern_keys) {
+            key = intern_str(s, key);
+        }
+        if (key == NULL) {
+            goto error;
+        }
+        pos = skip_ws(s, pos);
+        if (pos < 0 || pos == end || CHAR(s, pos) != ':') {
+            goto error;
+        }
+        pos = skip_ws(s, pos + 1);
+        if (pos < 0) {
+            goto error;
+        }
+        val = scan_value(s, pos, &pos);
+        if (val == NULL) {
+            goto error;
+        }
+        if (use_dict) {
+            if (PyDict_SetItem(container, key, val) < 0) {
+                goto error;
+            }
+        }
+        else {
+            PyObject *pair = PyTuple_Pack(2, key, val);
+            if (pair == NULL || PyList_Append(container, pair) < 0) {
+                Py_XDECREF(pair);
+                goto error;
+            }
+            Py_DECREF(pair);
+        }
+        Py_CLEAR(key);
+        Py_CLEAR(val);
+
+        pos = skip_ws(s, pos);
+        if (pos < 0 || pos == end) {
+            goto error;
+        }
+        if (CHAR(s, pos) == '}') {
+            break;
+        }
+        if (CHAR(s, pos) != ',') {
+            goto error;
+        }
+        pos = skip_ws(s, pos + 1);
+        if (pos < 0) {
+            goto error;
+        }
+        if (pos < end && CHAR(s, pos) == '}') {
+            break;
+        }
+    }
+
+done:
+    *next = pos + 1;
+    if (use_dict) {
+        return container;
+    }
+    result = PyObject_CallFunctionObjArgs(s->dictify, container, NULL);
+    Py_DECREF(container);
+    return result;
+
+error:
+    Py_XDECREF(key);
+    Py_XDECREF(val);
+    Py_DECREF(container);
+    return NULL;
+}
+
+/* Returns `values`, or the result of calling the `listify` hook on it.
+ * Steals the reference to `values`. */
+static PyObject *
+finish_array(Scanner *s, PyObject *values)
+{
+    PyObject *result;
+
+    if (s->listify == Py_None) {
+        return values;
+    }
+    result = PyObject_CallFunctionObjArgs(s->listify, values, NULL);
+    Py_DECREF(values);
+    return result;
+}
+
+static PyObject *
+scan_array(Scanner *s, Py_ssize_t pos, Py_ssize_t *next)
+{
+    Py_ssize_t end = s->end;
+    PyObject *values = PyList_New(0);
+    PyObject *val;
+
+    if (values == NULL) {
+        return NULL;
+    }
+    pos = skip_ws(s, pos + 1);
+    if (pos < 0) {
+        goto error;
+    }
+    if (pos < end && CHAR(s, pos) == ']') {
+        *next = pos + 1;
+        return finish_array(s, values);
+    }
+    for (;;) {
+        val = scan_value(s, pos, &pos);
+        if (val == NULL) {
+            goto error;
+        }
+        if (PyList_Append(values, val) < 0) {
+            Py_DECREF(val);
+            goto error;
+        }
+        Py_DECREF(val);
+
+        pos = skip_ws(s, pos);
+        if (pos < 0 || pos == end) {
+            goto error;
+        }
+        if (CHAR(s, pos) == ']') {
+            break;
+        }
+        if (CHAR(s, pos) != ',') {
+            goto error;
+        }
+        pos = skip_ws(s, pos + 1);
+        if (pos < 0) {
+            goto error;
+        }
+        if (pos < end && CHAR(s, pos) == ']') {
+            break;
+        }
+    }
+    *next = pos + 1;
+    return finish_array(s, values);
+
+error:
+    Py_DECREF(values);
+    return NULL;
+}
+
+/* Calls `hook` with the (ASCII) text of a number. */
+static PyObject *
+call_number_hook(PyObject *hook, const char *text, Py_ssize_t len,
+                 PyObject *kwargs)
+{
+    PyObject *str = PyUnicode_FromStringAndSize(text, len);
+    PyObject *args;
+    PyObject *result;
+    if (str == NULL) {
+        return NULL;
+    }
+    if (kwargs == NULL) {
+        result = PyObject_CallFunctionObjArgs(hook, str, NULL);
+        Py_DECREF(str);
+        return result;
+    }
+    args = PyTuple_Pack(1, str);
+    Py_DECREF(str);
+    if (args == NULL) {
+        return NULL;
+    }
+    result = PyObject_Call(hook, args, kwargs);
+    Py_DECREF(args);
+    return result;
+}
+
+static PyObject *
+make_number(Scanner *s, const char *text, Py_ssize_t len, char kind)
+{
+    if (kind == 'i') {
+        if (s->parse_int == (PyObject *)&PyLong_Type) {
+            if (len <= 18) {
+                long long value = 0;
+                Py_ssize_t i = text[0] == '-' ? 1 : 0;
+                for (; i < len; i++) {
+                    value = value * 10 + (text[i] - '0');
+                }
+                return PyLong_FromLongLong(text[0] == '-' ? -value : value);
+            }
+            return PyLong_FromString(text, NULL, 10);
+        }
+        return call_number_hook(s->parse_int, text, len, NULL);
+    }
+    if (kind == 'x') {
+        if (s->parse_int == (PyObject *)&PyLong_Type) {
+            return PyLong_FromString(text, NULL, 16);
+        }
+        return call_number_hook(s->parse_int, text, len, base_16_kwargs);
+    }
+    if (kind == 'f') {
+        if (s->parse_float == (PyObject *)&PyFloat_Type) {
+            char *endp;
+            double value = PyOS_string_to_double(text, &endp, NULL);
+            if (value == -1.0 && PyErr_Occurred()) {
+                PyErr_Clear();
+            }
+            else if (endp == text + len) {
+                return PyFloat_FromDouble(value);
+            }
+            /* Let float() report the error, e.g., for '1e' or '.'. */
+        }
+        return call_number_hook(s->parse_float, text, len, NULL);
+    }
+    return call_number_hook(s->parse_constant, text, len, NULL);
+}
+
+static PyObject *
+scan_number(Scanner *s, Py_ssize_t pos, Py_ssize_t *next)
+{
+    Py_ssize_t end = s->end;
+    Py_ssize_t start = pos;
+    char small[64];
+    char *text = small;
+    Py_ssize_t len = 0;
+    char kind;
+    Py_UCS4 c = CHAR(s, pos);
+    PyObject *result;
+    Py_ssize_t i;
+
+    if (c == '+' || c == '-') {
+        pos++;
+    }
+    if (pos == end) {
+        return GIVE_UP;
+    }
+    c = CHAR(s, pos);
+    if (c == '0' && pos + 1 < end &&
+        (CHAR(s, pos + 1) == 'x' || CHAR(s, pos + 1) == 'X')) {
+        pos += 2;
+        if (pos == end || hex_value(CHAR(s, pos)) < 0) {
+            return GIVE_UP;
+        }
+        while (pos < end && hex_value(CHAR(s, pos)) >= 0) {
+            pos++;
+        }
+        kind = 'x';
+    }
+    else if (c == 'I' || c == 'N') {
+        const char *word = c == 'I' ? "Infinity" : "NaN";
+        for (i = 0; word[i]; i++, pos++) {
+            if (pos == end || CHAR(s, pos) != (Py_UCS4)word[i]) {
+                return GIVE_UP;
+            }
+        }
+        kind = 'c';
+    }
+    else {
+        kind = 'i';
+        if (c == '0') {
+            pos++;
+            if (pos < end && is_digit(CHAR(s, pos))) {
+                return GIVE_UP;
+            }
+        }
+        else if (is_digit(c)) {
+            while (pos < end && is_digit(CHAR(s, pos))) {
+                pos++;
+            }
+        }
+        else if (c != '.') {
+            return GIVE_UP;
+        }
+        if (pos < end && CHAR(s, pos) == '.') {
+            kind = 'f';
+            pos++;
+            while (pos < end && is_digit(CHAR(s, pos))) {
+                pos++;
+            }
+        }
+        if (pos < end && (CHAR(s, pos) == 'e' || CHAR(s, pos) == 'E')) {
+            kind = 'f';
+            pos++;
+            if (pos < end && (CHAR(s, pos) == '+' || CHAR(s, pos) == '-')) {
+                pos++;
+            }
+            while (pos < end && is_digit(CHAR(s, pos))) {
+                pos++;
+            }
+        }
+        /* A decimal literal can't be followed by an identifier. */
+        if (pos < end && continues_id(s, pos)) {
+            return GIVE_UP;
+        }
+    }
+
+    /* Build the normalized text of the number: a leading '+' is dropped,
+     * and '0X' and 'E' are lower-cased. */
+    if (pos - start >= (Py_ssize_t)sizeof(small)) {
+        text = PyMem_Malloc(pos - start + 1);
+        if (text == NULL) {
+            return PyErr_NoMemory();
+        }
+    }
+    for (i = start; i < pos; i++) {
+        c = CHAR(s, i);
+        if (c == '+' && i == start) {
+            continue;
+        }
+        if ((kind == 'x' && c == 'X') || (kind == 'f' && c == 'E')) {
+            c = c - 'A' + 'a';
+        }
+        text[len++] = (char)c;
+    }
+    text[len] = '\0';
+
+    result = make_number(s, text, len, kind);
+    if (text != small) {
+        PyMem_Free(text);
+    }
+    *next = pos;
+    return result;
+}
+
+static PyObject *
+scan_value(Scanner *s, Py_ssize_t pos, Py_ssize_t *next)
+{
+    PyObject *result;
+    Py_UCS4 c;
+
+    if (pos == s->end) {
+        return GIVE_UP;
+    }
+    c = CHAR(s, pos);
+    switch (c) {
+    case '{':
+    case '[':
+        if (Py_EnterRecursiveCall(" while decoding a JSON5 document")) {
+            return NULL;
+        }
+        if (c == '{') {
+            result = scan_object(s, pos, next);
+        }
+        else {
+            result = scan_array(s, pos, next);
+        }
+        Py_LeaveRecursiveCall();
+        return result;
+    case '"':
+    case '\'':
+        result = scan_string(s, pos, next);
+        if (result != NULL &&
+            PyUnicode_GET_LENGTH(result) <= s->intern_strings) {
+            result = intern_str(s, result);
+        }
+        return result;
+    case 'n':
+        return scan_keyword(s, pos, "null", Py_None, next);
+    case 't':
+        return scan_keyword(s, pos, "true", Py_True, next);
+    case 'f':
+        return scan_keyword(s, pos, "false", Py_False, next);
+    default:
+        if (is_digit(c) || c == '.' || c == '+' || c == '-' || c == 'I' ||
+            c == 'N') {
+            return scan_number(s, pos, next);
+        }
+        return GIVE_UP;
+    }
+}
+
+#define MAX_SKIP_DEPTH 256
+
+/* Returns the position just past the array or object at `pos`, -2 if the
+ * input ends before it does, or -1 if it is nested too deeply or its
+ * brackets don't match. Like `Scanner._skip_value()`, this doesn't check
+ * anything other than brackets, strings, and comments. */
+static Py_ssize_t
+skip_container(Scanner *s, Py_ssize_t pos)
+{
+    Py_ssize_t end = s->end;
+    Py_UCS4 closers[MAX_SKIP_DEPTH];
+    int depth = 0;
+
+    while (pos < end) {
+        Py_UCS4 c = CHAR(s, pos);
+        if (c == '{' || c == '[') {
+            if (depth == MAX_SKIP_DEPTH) {
+                return -1;
+            }
+            closers[depth++] = c == '{' ? '}' : ']';
+            pos++;
+        }
+        else if (c == '}' || c == ']') {
+            if (depth == 0 || closers[--depth] != c) {
+                return -1;
+            }
+            pos++;
+            if (depth == 0) {
+                return pos;
+            }
+        }
+        else if (c == '"' || c == '\'') {
+            pos++;
+            while (pos < end) {
+                Py_UCS4 d = CHAR(s, pos);
+                if (d == c) {
+                    break;
+                }
+                pos += d == '\\' ? 2 : 1;
+            }
+            if (pos >= end) {
+                return -2;
+            }
+            pos++;
+        }
+        else if (c == '/') {
+            Py_ssize_t next = skip_ws(s, pos);
+            if (next < 0) {
+                return -2;
+            }
+            pos = next > pos ? next : pos + 1;
+        }
+        else {
+            pos++;
+        }
+    }
+    return -2;
+}
+
+PyDoc_STRVAR(skip_doc,
+"skip(s, pos)\n"
+"\n"
+"Returns the position just past the array or object in `s` at `pos`,\n"
+"only checking that its brackets are balanced and that its strings and\n"
+"comments are terminated. Returns -1 if `s` ends before the array or\n"
+"object does, or None if it is malformed or nested too deeply.");
+
+static PyObject *
+skip(PyObject *self, PyObject *args)
+{
+    Scanner s;
+    Py_ssize_t pos;
+
+    if (!PyArg_ParseTuple(args, "Un:skip", &s.str, &pos)) {
+        return NULL;
+    }
+#if PY_VERSION_HEX < 0x030C0000
+    if (PyUnicode_READY(s.str) < 0) {
+        return NULL;
+    }
+#endif
+    s.utf8 = 0;
+    s.kind = PyUnicode_KIND(s.str);
+    s.data = PyUnicode_DATA(s.str);
+    s.end = PyUnicode_GET_LENGTH(s.str);
+    if (pos < 0 || pos >= s.end ||
+        (CHAR(&s, pos) != '{' && CHAR(&s, pos) != '[')) {
+        Py_RETURN_NONE;
+    }
+    pos = skip_container(&s, pos);
+    if (pos == -2) {
+        return PyLong_FromLong(-1);
+    }
+    if (pos < 0) {
+        Py_RETURN_NONE;
+    }
+    return PyLong_FromSsize_t(pos);
+}
+
+PyDoc_STRVAR(scan_doc,
+"scan(s, pos, strict, consume_trailing, dictify, parse_float, parse_int,\n"
+"     parse_constant, listify, intern_table, intern_strings,\n"
+"     intern_keys)\n"
+"\n"
+"Decodes the JSON5 value in `s` starting at `pos`, returning a\n"
+"(value, end_position) tuple, or None if the value could not be decoded.\n"
+"`s` may be a str, or a bytes-like object holding UTF-8 text, in which\n"
+"case `pos` and `end_position` are byte offsets.");
+
+static PyObject *
+scan(PyObject *self, PyObject *args)
+{
+    Scanner s;
+    PyObject *doc;
+    Py_buffer view;
+    Py_ssize_t pos;
+    int consume_trailing;
+    PyObject *value = NULL;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "OnppOOOOOOnp:scan", &doc, &pos, &s.strict,
+                          &consume_trailing, &s.dictify, &s.parse_float,
+                          &s.parse_int, &s.parse_constant, &s.listify,
+                          &s.intern_table, &s.intern_strings,
+                          &s.intern_keys)) {
+        return NULL;
+    }
+    if (s.intern_table != Py_None && !PyDict_Check(s.intern_table)) {
+        PyErr_SetString(PyExc_TypeError, "intern_table must be a dict");
+        return NULL;
+    }
+    if (PyUnicode_Check(doc)) {
+#if PY_VERSION_HEX < 0x030C0000
+        if (PyUnicode_READY(doc) < 0) {
+            return NULL;
+        }
+#endif
+        s.str = doc;
+        s.utf8 = 0;
+        s.kind = PyUnicode_KIND(doc);
+        s.data = PyUnicode_DATA(doc);
+        s.end = PyUnicode_GET_LENGTH(doc);
+    }
+    else {
+        if (PyObject_GetBuffer(doc, &view, PyBUF_SIMPLE) < 0) {
+            return NULL;
+        }
+        s.str = NULL;
+        s.utf8 = 1;
+        s.kind = PyUnicode_1BYTE_KIND;
+        s.data = view.buf;
+        s.end = view.len;
+    }
+    if (pos < 0 || pos > s.end) {
+        goto done;
+    }
+
+    pos = skip_ws(&s, pos);
+    if (pos < 0) {
+        goto done;
+    }
+    value = scan_value(&s, pos, &pos);
+    if (value == NULL) {
+        goto done;
+    }
+    if (consume_trailing) {
+        pos = skip_ws(&s, pos);
+        if (pos != s.end) {
+            Py_CLEAR(value);
+            goto done;
+        }
+    }
+    result = Py_BuildValue("(Nn)", value, pos);
+
+done:
+    if (s.utf8) {
+        PyBuffer_Release(&view);
+    }
+    if (result == NULL && !PyErr_Occurred()) {
+        Py_RETURN_NONE;
+    }
+    return result;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"scan", scan, METH_VARARGS, scan_doc},
+    {"skip", skip, METH_VARARGS, skip_doc},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "json5._speedups",
+    "C implementation of the json5 decoder.",
+    -1,
+    speedups_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    PyObject *base = PyLong_FromLong(16);
+    if (base == NULL) {
+        return NULL;
+    }
+    base_16_kwargs = Py_BuildValue("{sN}", "base", base);
+    if (base_16_kwargs == NULL) {
+        return NULL;
+    }
+    return PyModule_Create(&speedups_module);
+}
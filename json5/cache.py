@@ -0,0 +1,149 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Caching of decoded files, for programs that read the same (rarely
+changing) files over and over again."""
+
+import collections
+import copy as copy_module
+import hashlib
+import os
+import threading
+from typing import Any, Tuple, Union
+
+from json5.lib import loads
+
+# What a file is checked against to see if it has changed: either the
+# digest of its contents, or its size and modification time.
+_Stamp = Union[bytes, Tuple[int, int]]
+
+
+class Cache:
+    """A least-recently-used cache of decoded files.
+
+    The cache holds at most `max_entries` values, decoded from files that
+    are at most `max_bytes` long in total. A file that is bigger than
+    `max_bytes` on its own is never cached.
+
+    A cached value is only used if the file hasn't changed since it was
+    read. By default, this is decided by the file's size and modification
+    time; if `digest` is True, the file is read each time and its
+    contents are compared instead, which catches changes that don't
+    update the modification time, but still saves decoding the file.
+
+    It is safe to use a cache from more than one thread.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        *,
+        digest: bool = False,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.digest = digest
+        self.nbytes = 0
+        self._lock = threading.Lock()
+
+        # Maps (path, options) to (stamp, value, nbytes), with the
+        # least recently used entry first.
+        self._entries: collections.OrderedDict[
+            Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[_Stamp, Any, int]
+        ] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Removes everything from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def load(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        copy: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Returns the value decoded from the file at `path`.
+
+        Takes the same keyword arguments as `json5.loads()`; values
+        decoded with different arguments are cached separately. All of
+        the arguments except `select` must be hashable.
+
+        The same value is returned each time the file is loaded until it
+        changes, so callers must not modify it. Either pass `frozen=True`
+        to get a value that can't be modified, or pass `copy=True` to get
+        a deep copy of the value instead.
+        """
+        path = os.path.abspath(os.fspath(path))
+        select = kwargs.get('select')
+        if select is not None and not isinstance(select, str):
+            kwargs['select'] = tuple(select)
+        key = (path, tuple(sorted(kwargs.items())))
+        with open(path, 'rb') as fp:
+            data = None
+            stamp: _Stamp
+            if self.digest:
+                data = fp.read()
+                stamp = hashlib.sha256(data).digest()
+            else:
+                st = os.fstat(fp.fileno())
+                stamp = (st.st_size, st.st_mtime_ns)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == stamp:
+                    self._entries.move_to_end(key)
+                    value = entry[1]
+                    return copy_module.deepcopy(value) if copy else value
+            if data is None:
+                data = fp.read()
+        value = loads(data, **kwargs)
+        self._add(key, stamp, value, len(data))
+        return copy_module.deepcopy(value) if copy else value
+
+    def _add(self, key, stamp, value, nbytes):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[2]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (stamp, value, nbytes)
+            self.nbytes += nbytes
+            while (
+                len(self._entries) > self.max_entries
+                or self.nbytes > self.max_bytes
+            ):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+
+_default_cache = Cache()
+
+
+def load_cached(
+    path: Union[str, os.PathLike],
+    *,
+    copy: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """Like `json5.load()`, but returns the value from a shared `Cache` if
+    the file hasn't changed since it was last loaded. See `Cache.load()`.
+    """
+    return _default_cache.load(path, copy=copy, **kwargs)
@@ -0,0 +1,122 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The exception raised for invalid JSON5 documents."""
+
+from typing import Any, Callable, FrozenSet, Optional, Tuple, Union
+
+from json5.lines import advance, line_index
+
+
+class JSON5DecodeError(ValueError):
+    """Raised when a document is not legal JSON5.
+
+    Attributes:
+        - `doc`: the text being decoded. When reading from a stream, this
+          is only the part of the stream that was in memory.
+        - `pos`: the zero-based offset in `doc` where the error was found.
+        - `lineno`, `colno`: the one-based line and column numbers of
+          `pos` in the document as a whole.
+        - `msg`: the error message, without its location.
+        - `expected`: a frozenset of what could have come next where the
+          document stopped being legal: any of ``'value'``, ``'key'``,
+          ``':'``, ``','``, ``']'``, ``'}'``, ``'end of line'`` and
+          ``'end of input'``. If the error is inside a token (e.g., an
+          unterminated string), this is what was expected where the token
+          started. It is None if that can't be worked out.
+
+    The message and the other derived attributes are only worked out when
+    they are first used, since callers that catch the error often never
+    look at them.
+    """
+
+    def __init__(
+        self,
+        doc: str,
+        pos: int,
+        *,
+        fname: str = '<string>',
+        origin: Tuple[int, int] = (1, 1),
+        expected: Union[
+            None, FrozenSet[str], Callable[[], Optional[FrozenSet[str]]]
+        ] = None,
+    ):
+        # `origin` is the line and column numbers of `doc[0]`, and
+        # `expected` may be a function that works out the real value.
+        super().__init__()
+        self.doc = doc
+        self.pos = pos
+        self.fname = fname
+        self._origin = origin
+        self._position: Optional[Tuple[int, int]] = None
+        self._expected = expected
+
+    def _lineno_colno(self) -> Tuple[int, int]:
+        if self._position is None:
+            if self._origin == (1, 1):
+                self._position = line_index(self.doc).position(self.pos)
+            else:
+                self._position = advance(self.doc, self.pos, *self._origin)
+        return self._position
+
+    @property
+    def lineno(self) -> int:
+        return self._lineno_colno()[0]
+
+    @property
+    def colno(self) -> int:
+        return self._lineno_colno()[1]
+
+    @property
+    def args(self) -> Tuple[Any, ...]:
+        # Like other ValueErrors, `args[0]` is the full message, but it is
+        # only formatted (and then kept) when it is first used.
+        if not super().args:
+            super().__init__(str(self))
+        return super().args
+
+    @args.setter
+    def args(self, value: Tuple[Any, ...]) -> None:
+        super().__init__(*value)
+
+    @property
+    def msg(self) -> str:
+        if self.pos >= len(self.doc):
+            return 'Unexpected end of input'
+        return f'Unexpected "{self.doc[self.pos]}"'
+
+    @property
+    def expected(self) -> Optional[FrozenSet[str]]:
+        if callable(self._expected):
+            self._expected = self._expected()
+        return self._expected
+
+    def __str__(self) -> str:
+        lineno, colno = self._lineno_colno()
+        return f'{self.fname}:{lineno} {self.msg} at column {colno}'
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({str(self)!r})'
+
+    def __reduce__(self):
+        return (
+            type(self),
+            (self.doc, self.pos),
+            {
+                'fname': self.fname,
+                '_origin': self._origin,
+                '_position': self._position,
+                '_expected': self.expected,
+            },
+        )
@@ -44,6 +44,10 @@ class Host:
     def rmtree(self, path):
         shutil.rmtree(path, ignore_errors=True)
 
+    def read_binary_file(self, path):
+        with open(path, 'rb') as fp:
+            return fp.read()
+
     def read_text_file(self, path):
         with open(path, 'rb') as fp:
             return fp.read().decode('utf8')
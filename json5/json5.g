@@ -16,30 +16,28 @@ eol            = '\u000D' '\u000A' | '\u000D' | '\u000A'
 comment        = '//' (~eol anything)*
                | '/*' (~'*/' anything)* '*/'
 
-value          = 'null'                               -> 'None'
-               | 'true'                               -> 'True'
-               | 'false'                              -> 'False'
+value          = string:v                             -> ['string', v]
+               | num_literal
                | object:v                             -> ['object', v]
                | array:v                              -> ['array', v]
-               | string:v                             -> ['string', v]
-               | num_literal:v                        -> ['number', v]
+               | 'null'                               -> 'None'
+               | 'true'                               -> 'True'
+               | 'false'                              -> 'False'
 
-object         = '{' sp member_list:v sp '}'          -> v
-               | '{' sp '}'                           -> []
+object         = '{' sp ( '}'                         -> []
+                        | member_list:v '}'           -> v )
 
-array          = '[' sp element_list:v sp ']'         -> v
-               | '[' sp ']'                           -> []
+array          = '[' sp ( ']'                         -> []
+                        | element_list:v ']'          -> v )
 
 string         = squote sqchar*:cs squote             -> join('', cs)
                | dquote dqchar*:cs dquote             -> join('', cs)
 
-sqchar         = bslash esc_char:c                    -> c
-               | bslash eol                           -> ''
+sqchar         = bslash ( esc_char | eol -> '' )
                | ~bslash ~squote ~eol anything:c      -> c
                | ~?(_strict) '\x00'..'\x1f'
 
-dqchar         = bslash esc_char:c                    -> c
-               | bslash eol                           -> ''
+dqchar         = bslash ( esc_char | eol -> '' )
                | ~bslash ~dquote ~eol anything:c      -> c
                | ~?( _strict ) '\x00'..'\x1f'
 
@@ -67,12 +65,13 @@ hex_esc        = 'x' hex:h1 hex:h2                   -> xtou(h1 + h2)
 
 unicode_esc    = 'u' hex:a hex:b hex:c hex:d         -> xtou(a + b + c + d)
 
-element_list   = value:v (sp ',' sp value)*:vs sp ','?   -> [v] + vs
+element_list   = value:v sp (',' sp value:e sp -> e)*:vs (',' sp)?
+                                                     -> [v] + vs
 
-member_list    = member:m (sp ',' sp member)*:ms sp ','? -> [m] + ms
+member_list    = member:m sp (',' sp member:e sp -> e)*:ms (',' sp)?
+                                                     -> [m] + ms
 
-member         = string:k sp ':' sp value:v          -> [k, v]
-               | ident:k sp ':' sp value:v           -> [k, v]
+member         = (string | ident):k sp ':' sp value:v -> [k, v]
 
 ident          = id_start:hd id_continue*:tl         -> join('', [hd] + tl)
 
@@ -103,21 +102,19 @@ id_continue    = ascii_id_start
                | '\u200C'
                | '\u200D'
 
-num_literal    = '-' unsigned_lit:n                  -> '-' + n
+num_literal    = '-' unsigned_lit:n                  -> [n[0], '-' + n[1]]
                | '+' unsigned_lit:n                  -> n
                | unsigned_lit:n                      -> n
 
-unsigned_lit   = dec_literal:d ~id_start             -> d
-               | hex_literal
-               | 'Infinity'
-               | 'NaN'
+unsigned_lit   = hex_literal:h                       -> ['hex', h]
+               | dec_literal:d ~id_start             -> d
+               | 'Infinity'                          -> ['const', 'Infinity']
+               | 'NaN'                               -> ['const', 'NaN']
 
-dec_literal    = dec_int_lit:d frac:f exp:e          -> d + f + e
-               | dec_int_lit:d frac:f                -> d + f
-               | dec_int_lit:d exp:e                 -> d + e
-               | dec_int_lit:d                       -> d
-               | frac:f exp:e                        -> f + e
-               | frac:f                              -> f
+dec_literal    = dec_int_lit:d ( frac:f exp?:e       -> ['float', d + f + join('', e)]
+                               | exp:e               -> ['float', d + e]
+                               |                     -> ['int', d] )
+               | frac:f exp?:e                       -> ['float', f + join('', e)]
 
 dec_int_lit    = '0' ~digit                          -> '0'
                | nonzerodigit:d digit*:ds            -> d + join('', ds)
@@ -132,5 +129,5 @@ hex            = 'a'..'f' | 'A'..'F' | digit
 
 frac           = '.' digit*:ds                       -> '.' + join('', ds)
 
-exp            = ('e' | 'E') ('+' | '-'):s digit*:ds -> 'e' + s + join('', ds)
-               | ('e' | 'E') digit*:ds               -> 'e' + join('', ds)
+exp            = ('e' | 'E') ('+' | '-')?:s digit*:ds
+                                                     -> 'e' + join('', s) + join('', ds)
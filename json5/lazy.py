@@ -0,0 +1,96 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Read-only proxies for arrays and objects, used by `loads(lazy=True)`.
+
+A proxy only holds on to the scanner for the document and the position
+of its opening bracket. The first time it is used, it decodes its own
+members, replacing any arrays and objects among them with new proxies,
+and keeps the result.
+"""
+
+from collections.abc import Mapping, Sequence
+
+from json5.scanner import Scanner
+
+
+def parse(scanner: Scanner, global_vars):
+    """Returns `scanner.parse_lazy()` using the proxies below."""
+    return scanner.parse_lazy(_proxy_maker(scanner), global_vars)
+
+
+def _proxy_maker(scanner):
+    def make_proxy(pos):
+        if scanner.msg[pos] == '{':
+            return LazyObject(scanner, pos)
+        return LazyArray(scanner, pos)
+
+    return make_proxy
+
+
+class _LazyContainer:
+    __slots__ = ('_members', '_pos', '_scanner')
+
+    def __init__(self, scanner: Scanner, pos: int):
+        self._scanner = scanner
+        self._pos = pos
+        self._members = None
+
+    def _load(self):
+        if self._members is None:
+            self._members = self._scanner.members(
+                self._pos, _proxy_maker(self._scanner)
+            )
+        return self._members
+
+    def __repr__(self):
+        return repr(self._load())
+
+
+class LazyObject(_LazyContainer, Mapping):
+    """A read-only mapping that decodes an object when first used."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __contains__(self, key):
+        return key in self._load()
+
+
+class LazyArray(_LazyContainer, Sequence):
+    """A read-only sequence that decodes an array when first used."""
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyArray)):
+            return self._load() == list(other)
+        return NotImplemented
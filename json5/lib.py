@@ -12,16 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
+import codecs
 import enum
 import math
+import mmap as mmap_module
+import os
 import re
+import stat
 from typing import (
     Any,
     Callable,
+    Dict,
     IO,
     Iterable,
+    Iterator,
     Mapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -29,13 +37,53 @@ from typing import (
 )
 import unicodedata
 
-from json5.parser import Parser
+from json5 import lazy as _lazy
+from json5.errors import JSON5DecodeError
+from json5.lines import advance
+from json5.scanner import MAX_INTERNED, MAX_LOOKAHEAD, Scanner, decode_error
+from json5.tuned_parser import TunedParser
+
+try:
+    from json5 import _speedups  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    _speedups = None
 
 
 # Used when encoding keys, below.
 _reserved_word_re: Optional[re.Pattern] = None
 
 
+class FrozenDict(dict):
+    """An immutable, hashable dict, returned by `loads(frozen=True)`.
+
+    Any attempt to modify one raises a TypeError. Like a tuple, a
+    FrozenDict is only hashable if all of its values are.
+    """
+
+    __slots__ = ('_hash',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._hash = None
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self.items()))
+        return self._hash
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict.__repr__(self)})'
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f'{type(self).__name__} objects are immutable')
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
 class QuoteStyle(enum.Enum):
     """Controls how strings will be quoted during encoding.
 
@@ -86,6 +134,13 @@ def load(
     allow_duplicate_keys: bool = True,
     consume_trailing: bool = True,
     start: Optional[int] = None,
+    engine: Optional[str] = None,
+    select: Optional[Union[str, Sequence[str]]] = None,
+    lazy: bool = False,
+    frozen: bool = False,
+    intern_keys: Union[bool, Dict[str, str]] = False,
+    intern_strings: int = 0,
+    numeric_arrays: Optional[str] = None,
 ) -> Any:
     """Deserialize ``fp`` (a ``.read()``-supporting file-like object
     containing a JSON document) to a Python object.
@@ -110,22 +165,58 @@ def load(
           `load` will seek to zero and then read (and discard) the
           appropriate number of characters before beginning parsing;
           the file must be seekable for this to work correctly.
+        - an extra `engine` parameter selects the decoder implementation:
+          `'c'` is the optional C extension, `'scanner'` is a hand-written
+          single-pass decoder, and `'parser'` is the parser generated from
+          the grammar. All of them accept exactly the same documents and
+          report the same errors. By default, `'c'` is used if the
+          extension was built, and `'scanner'` otherwise.
+        - extra `select` and `lazy` parameters ask for only part of the
+          document to be decoded, as described below.
+        - an extra `frozen` parameter returns immutable, hashable values:
+          if it is True, objects are decoded to `FrozenDict`s and arrays
+          to tuples, so that the result can be shared and cached without
+          being copied. This can't be used with `lazy`.
+        - extra `intern_keys` and `intern_strings` parameters save memory
+          when the same strings occur many times in a document. If
+          `intern_keys` is True, equal object keys are decoded to the same
+          string object, and equal string values at most `intern_strings`
+          characters long are too, whether or not `intern_keys` is set.
+          `intern_keys` may also be a dict of strings to share between
+          calls (which also interns keys); at most 65536 strings will be
+          added to it.
+        - an extra `numeric_arrays` parameter saves memory when decoding
+          large arrays of numbers. If it is `'array'`, arrays of ints are
+          decoded to `array.array('q')`s, and arrays of floats (which may
+          also contain ints that a float can hold exactly) to
+          `array.array('d')`s. Other arrays, including empty ones and ones
+          with ints that don't fit in 64 bits, are still decoded to lists.
+          The arrays support the buffer protocol, so (for example)
+          `numpy.frombuffer()` can use them without copying them. This
+          can't be used with `frozen` or `lazy`.
 
     You can use `load(..., consume_trailing=False)` to repeatedly read
     values from a file. However, in the current implementation `load` does
     this by reading the entire file into memory before doing anything, so
-    it is not very efficient.
+    it is not very efficient; use `iterload()` instead.
+
+    See `loads()` for a description of `select` and `lazy`.
 
     Raises
-        - `ValueError` if given an invalid document. This is different
-          from the `json` module, which raises `json.JSONDecodeError`.
+        - `JSON5DecodeError` (a subclass of `ValueError`) if given a
+          document that isn't legal JSON5. This is like the `json`
+          module's `json.JSONDecodeError`, but also says what was
+          expected; see `JSON5DecodeError`.
+        - `ValueError` for other problems, e.g., if one of the hooks
+          rejects a value, or if `allow_duplicate_keys` is False and there
+          is a duplicate key.
         - `UnicodeDecodeError` if given a byte string that is not a
           legal UTF-8 document (or the equivalent, if using a different
           `encoding`). This matches the `json` module.
     """
 
     s = fp.read()
-    val, err, _ = parse(
+    val, err, _ = _parse(
         s,
         encoding=encoding,
         cls=cls,
@@ -138,14 +229,401 @@ def load(
         allow_duplicate_keys=allow_duplicate_keys,
         consume_trailing=consume_trailing,
         start=start,
+        engine=engine,
+        select=select,
+        lazy=lazy,
+        frozen=frozen,
+        intern_keys=intern_keys,
+        intern_strings=intern_strings,
+        numeric_arrays=numeric_arrays,
+        keep_bytes=True,
     )
     if err:
-        raise ValueError(err)
+        raise err
     return val
 
 
+# `load_path()` reads files smaller than this rather than mapping them;
+# mapping them isn't any faster, and saves little memory.
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def load_path(
+    path: Union[str, os.PathLike],
+    *,
+    mmap: bool = True,
+    start: int = 0,
+    **kwargs: Any,
+) -> Any:
+    """Deserialize the JSON5 document in the file at `path` to a Python
+    object.
+
+    Takes the same keyword arguments as `loads()`, except that `start` is
+    the offset in bytes in the file to start decoding at. Line and column
+    numbers in errors are counted from `start`.
+
+    If `mmap` is True, large regular files are memory-mapped instead of
+    being read. A UTF-8 file is then decoded straight from the mapped
+    pages (when the C extension is used), without the whole document
+    being copied into memory first. Small files, and files that can't be
+    mapped (such as pipes), are read as usual.
+    """
+    with open(path, 'rb') as fp:
+        mapped = _mmap_file(fp) if mmap else None
+        if mapped is not None:
+            with mapped, memoryview(mapped) as view, view[start:] as data:
+                return loads(data, **kwargs)
+        if start:
+            fp.seek(start)
+        return loads(fp.read(), **kwargs)
+
+
+def _mmap_file(fp):
+    """Returns a read-only map of the file `fp`, or None if it is too small
+    or can't be mapped."""
+    try:
+        st = os.fstat(fp.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size < _MMAP_MIN_SIZE:
+            return None
+        return mmap_module.mmap(fp.fileno(), 0, access=mmap_module.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def iterload(
+    fp: IO,
+    *,
+    encoding: Optional[str] = None,
+    cls: Any = None,
+    object_hook: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+    parse_float: Optional[Callable[[str], Any]] = None,
+    parse_int: Optional[Callable[[str], Any]] = None,
+    parse_constant: Optional[Callable[[str], Any]] = None,
+    strict: bool = True,
+    object_pairs_hook: Optional[
+        Callable[[Iterable[Tuple[str, Any]]], Any]
+    ] = None,
+    allow_duplicate_keys: bool = True,
+    engine: Optional[str] = None,
+    chunk_size: int = 65536,
+    lines: bool = False,
+    frozen: bool = False,
+    intern_keys: Union[bool, Dict[str, str]] = False,
+    intern_strings: int = 0,
+    numeric_arrays: Optional[str] = None,
+) -> Iterator[Any]:
+    """Deserialize a series of JSON5 values from ``fp`` (a
+    ``.read()``-supporting file-like object), yielding each value as soon
+    as it has been read.
+
+    The values may be separated by any amount of whitespace and comments
+    (or by nothing at all, if that is unambiguous, as in ``[1][2]``). If
+    `lines` is True, the values must be separated by line terminators, as
+    in [JSON Lines](https://jsonlines.org) files. Values may still span
+    multiple lines, and blank lines and comments are still allowed.
+
+    Unlike `load()`, this does not read the whole file into memory. It
+    reads `chunk_size` characters (or bytes) at a time, and only keeps
+    around the text of the value currently being decoded. Values may span
+    chunk boundaries.
+
+    The file may contain either text or bytes; bytes are decoded
+    incrementally using `encoding` (UTF-8 by default).
+
+    Supports the same other arguments as `load()`.
+
+    Raises
+        - `JSON5DecodeError` if the stream contains an invalid value. Line
+          and column numbers in the error are relative to where `fp` was
+          positioned when `iterload()` was called, and its `doc` is only
+          the part of the stream that was in memory. Any values before the
+          invalid one will have already been yielded.
+        - `UnicodeDecodeError` if given a byte stream that is not legal
+          UTF-8 (or the equivalent, if using a different `encoding`).
+    """
+    assert cls is None, 'Custom decoders are not supported'
+
+    decode = _engine(engine)
+    hooks = _hooks(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        object_pairs_hook=object_pairs_hook,
+        allow_duplicate_keys=allow_duplicate_keys,
+        frozen=frozen,
+        intern_keys=intern_keys,
+        intern_strings=intern_strings,
+        numeric_arrays=numeric_arrays,
+    )
+    global_vars = {'_strict': strict, '_consume_trailing': False}
+
+    read = _text_reader(fp, encoding)
+    buf = ''
+    pos = 0
+    eof = False
+    need_eol = False
+
+    # The 1-based line and column numbers of the start of `buf` in the
+    # stream as a whole, so that errors can be reported correctly.
+    lineno = 1
+    colno = 1
+
+    def _read(size):
+        nonlocal buf, pos, lineno, colno, eof
+        # Drop everything that has already been consumed.
+        lineno, colno = advance(buf, pos, lineno, colno)
+        buf = buf[pos:]
+        pos = 0
+
+        text = read(size)
+        eof = not text
+        buf += text
+
+    while True:
+        scanner = Scanner(buf, '<string>')
+        if scanner.at_end(pos):
+            if eof:
+                return
+            if buf and buf[-1] in _EOL_CHARS:
+                # Nothing but whitespace and complete comments are left
+                # (a '//' comment might continue into the next chunk
+                # otherwise), so all of it can be dropped.
+                pos = len(buf)
+                need_eol = False
+            _read(chunk_size)
+            continue
+
+        if need_eol:
+            next_pos = scanner.skip_ws(pos)
+            if not eof and next_pos == len(buf) - 1:
+                # A '/' might be the start of a comment.
+                _read(chunk_size)
+                continue
+            if next_pos is not None and not _EOL_RE.search(buf, pos, next_pos):
+                raise JSON5DecodeError(
+                    buf,
+                    next_pos,
+                    origin=(lineno, colno),
+                    expected=_END_OF_LINE,
+                )
+
+        val, err, end = decode(buf, pos, global_vars, hooks)
+        if not eof and end + MAX_LOOKAHEAD > len(buf):
+            # The value might be incomplete (or, in the case of a number,
+            # might continue), so read more and try again. Reading at
+            # least as much as we already have keeps the total amount of
+            # rescanning proportional to the size of the value.
+            _read(max(chunk_size, len(buf) - pos))
+            continue
+        if err:
+            if isinstance(err, JSON5DecodeError):
+                # `decode()` only knew about `buf`.
+                err = _with_origin(err, (lineno, colno))
+            raise err
+        yield val
+        pos = end
+        need_eol = lines
+
+
+def _with_origin(err, origin):
+    """Returns a copy of `err` in which `err.doc[0]` is at `origin`."""
+    return JSON5DecodeError(
+        err.doc,
+        err.pos,
+        fname=err.fname,
+        origin=origin,
+        expected=lambda: err.expected,
+    )
+
+
+def _text_reader(fp, encoding):
+    """Returns a function that reads text from `fp`, which may contain
+    either text or bytes; bytes are decoded incrementally using `encoding`.
+
+    The function returns an empty string only at the end of the file."""
+    decoder = None
+
+    def read(size):
+        nonlocal decoder
+        while True:
+            chunk = fp.read(size)
+            if not isinstance(chunk, bytes):
+                return chunk
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding or 'utf-8')()
+            text = decoder.decode(chunk, final=not chunk)
+            # Keep reading if the chunk ended partway through a character.
+            if text or not chunk:
+                return text
+
+    return read
+
+
+def iterloads(
+    s: Union[str, bytes],
+    *,
+    encoding: Optional[str] = None,
+    cls: Any = None,
+    object_hook: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+    parse_float: Optional[Callable[[str], Any]] = None,
+    parse_int: Optional[Callable[[str], Any]] = None,
+    parse_constant: Optional[Callable[[str], Any]] = None,
+    strict: bool = True,
+    object_pairs_hook: Optional[
+        Callable[[Iterable[Tuple[str, Any]]], Any]
+    ] = None,
+    allow_duplicate_keys: bool = True,
+    engine: Optional[str] = None,
+    lines: bool = False,
+    frozen: bool = False,
+    intern_keys: Union[bool, Dict[str, str]] = False,
+    intern_strings: int = 0,
+    numeric_arrays: Optional[str] = None,
+) -> Iterator[Any]:
+    """Deserialize a series of JSON5 values from ``s`` (a string containing
+    zero or more JSON5 documents), yielding each value in turn.
+
+    This works like `iterload()`, except that it reads from a string. It
+    is equivalent to (but faster than) repeatedly calling `parse()` with
+    `consume_trailing=False`, as shown in the `parse()` documentation.
+
+    Raises
+        - `JSON5DecodeError` if the string contains an invalid value. Any
+          values before the invalid one will have already been yielded.
+        - `UnicodeDecodeError` if given a byte string that is not a
+          legal UTF-8 document (or the equivalent, if using a different
+          `encoding`).
+    """
+    assert cls is None, 'Custom decoders are not supported'
+
+    if isinstance(s, bytes):
+        s = s.decode(encoding or 'utf-8')
+
+    decode = _engine(engine)
+    hooks = _hooks(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        object_pairs_hook=object_pairs_hook,
+        allow_duplicate_keys=allow_duplicate_keys,
+        frozen=frozen,
+        intern_keys=intern_keys,
+        intern_strings=intern_strings,
+        numeric_arrays=numeric_arrays,
+    )
+    global_vars = {'_strict': strict, '_consume_trailing': False}
+    return _iterdecode(s, decode, global_vars, hooks, lines)
+
+
+def _iterdecode(s, decode, global_vars, hooks, lines):
+    scanner = Scanner(s, '<string>')
+    pos = 0
+    need_eol = False
+    while True:
+        next_pos = scanner.skip_ws(pos)
+        if next_pos == len(s):
+            return
+        if (
+            need_eol
+            and next_pos is not None
+            and not _EOL_RE.search(s, pos, next_pos)
+        ):
+            raise JSON5DecodeError(s, next_pos, expected=_END_OF_LINE)
+        val, err, pos = decode(s, pos, global_vars, hooks)
+        if err:
+            raise err
+        yield val
+        need_eol = lines
+
+
+def events(
+    source: Union[str, bytes, IO],
+    *,
+    encoding: Optional[str] = None,
+    parse_float: Optional[Callable[[str], Any]] = None,
+    parse_int: Optional[Callable[[str], Any]] = None,
+    parse_constant: Optional[Callable[[str], Any]] = None,
+    strict: bool = True,
+    chunk_size: int = 65536,
+) -> Iterator[Tuple[str, Any, int]]:
+    """Yields an ``(event, value, position)`` tuple for each token in the
+    JSON5 document in `source`, which may be a string, a byte string, or a
+    ``.read()``-supporting file-like object.
+
+    This lets you process a document without building the whole thing
+    in memory. When reading from a file, only the current token is kept
+    in memory; the file is read `chunk_size` characters (or bytes) at a
+    time.
+
+    The events are:
+        - ``'start_map'`` and ``'end_map'``, at the start and end of an
+          object.
+        - ``'map_key'``, for each key in an object; `value` is the key.
+        - ``'start_array'`` and ``'end_array'``, at the start and end of an
+          array.
+        - ``'string'``, ``'number'``, ``'boolean'``, and ``'null'``, for
+          each scalar value; `value` is the value. Numbers are converted
+          using `parse_float`, `parse_int`, and `parse_constant`, as in
+          `loads()`.
+
+    `position` is the zero-based offset of the token in the document, and
+    `value` is None for the events that don't have one.
+
+    >>> import json5
+    >>> for event in json5.events('{a: [1, true]}'):
+    ...     print(event)
+    ('start_map', None, 0)
+    ('map_key', 'a', 1)
+    ('start_array', None, 4)
+    ('number', 1, 5)
+    ('boolean', True, 8)
+    ('end_array', None, 12)
+    ('end_map', None, 13)
+
+    Raises
+        - `JSON5DecodeError` if the document is invalid, with the same
+          message that `loads()` would produce. Any events before the error
+          will have already been yielded.
+        - `UnicodeDecodeError` if given a byte string that is not a
+          legal UTF-8 document (or the equivalent, if using a different
+          `encoding`).
+    """
+    _, parse_float, parse_int, parse_constant, *_ = _hooks(
+        object_hook=None,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        object_pairs_hook=None,
+        allow_duplicate_keys=True,
+    )
+    if isinstance(source, bytes):
+        source = source.decode(encoding or 'utf-8')
+    if isinstance(source, str):
+        msg, read = source, None
+    else:
+        msg, read = '', _text_reader(source, encoding)
+    scanner = Scanner(
+        msg,
+        '<string>',
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+    )
+    return scanner.events(strict=strict, read=read, chunk_size=chunk_size)
+
+
+# How many bytes `JSON5Decoder.raw_decode()` first decodes from a buffer.
+_RAW_DECODE_WINDOW = 1024
+
+_EOL_CHARS = '\n\r\u2028\u2029'
+_EOL_RE = re.compile(f'[{_EOL_CHARS}]')
+_END_OF_LINE = frozenset({'end of line'})
+
+
 def loads(
-    s: str,
+    s: Union[str, bytes, bytearray, memoryview],
     *,
     encoding: Optional[str] = None,
     cls: Any = None,
@@ -160,10 +638,23 @@ def loads(
     allow_duplicate_keys: bool = True,
     consume_trailing: bool = True,
     start: Optional[int] = None,
+    engine: Optional[str] = None,
+    select: Optional[Union[str, Sequence[str]]] = None,
+    lazy: bool = False,
+    frozen: bool = False,
+    intern_keys: Union[bool, Dict[str, str]] = False,
+    intern_strings: int = 0,
+    numeric_arrays: Optional[str] = None,
 ) -> Any:
     """Deserialize ``s`` (a string containing a JSON5 document) to a Python
     object.
 
+    `s` may also be a bytes-like object, such as `bytes`, `bytearray`,
+    `memoryview`, or `mmap.mmap`. If it holds UTF-8 (the default
+    `encoding`) and the C extension is used, it is decoded in place
+    rather than being converted to a `str` first, which saves making a
+    copy of the whole document.
+
     Supports the same arguments as ``json.loads()`` except that:
         - the `cls` keyword is ignored.
         - an extra `allow_duplicate_keys` parameter supports checking for
@@ -178,17 +669,90 @@ def loads(
           trailing characters in the string will be ignored.
         - an extra `start` parameter specifies the zero-based offset into the
           string to start parsing at.
+        - an extra `engine` parameter selects the decoder implementation:
+          `'c'` is the optional C extension, `'scanner'` is a hand-written
+          single-pass decoder, and `'parser'` is the parser generated from
+          the grammar. All of them accept exactly the same documents and
+          report the same errors. By default, `'c'` is used if the
+          extension was built, and `'scanner'` otherwise.
+        - extra `select` and `lazy` parameters ask for only part of the
+          document to be decoded, as described below.
+        - an extra `frozen` parameter returns immutable, hashable values:
+          if it is True, objects are decoded to `FrozenDict`s and arrays
+          to tuples, so that the result can be shared and cached without
+          being copied. This can't be used with `lazy`.
+        - extra `intern_keys` and `intern_strings` parameters save memory
+          when the same strings occur many times in a document. If
+          `intern_keys` is True, equal object keys are decoded to the same
+          string object, and equal string values at most `intern_strings`
+          characters long are too, whether or not `intern_keys` is set.
+          `intern_keys` may also be a dict of strings to share between
+          calls (which also interns keys); at most 65536 strings will be
+          added to it.
+        - an extra `numeric_arrays` parameter saves memory when decoding
+          large arrays of numbers. If it is `'array'`, arrays of ints are
+          decoded to `array.array('q')`s, and arrays of floats (which may
+          also contain ints that a float can hold exactly) to
+          `array.array('d')`s. Other arrays, including empty ones and ones
+          with ints that don't fit in 64 bits, are still decoded to lists.
+          The arrays support the buffer protocol, so (for example)
+          `numpy.frombuffer()` can use them without copying them. This
+          can't be used with `frozen` or `lazy`.
+
+    If `select` is given, only the values at the given paths are built,
+    which can be much faster than decoding the whole document when only
+    a small part of it is needed. A path is a series of object keys and
+    array indexes such as `'a.b[3].c'`; a key that contains '.', '[' or
+    ']' can be written as `["a.b"]`, and the empty path `''` selects the
+    whole document. If `select` is a single path, the value at that path
+    is returned, and it is an error if there isn't one. If it is a list
+    of paths, a dict is returned that maps each path in the list that is
+    in the document to its value.
+
+    >>> import json5
+    >>> json5.loads('{a: {b: [1, 2, {c: 3}]}}', select='a.b[2].c')
+    3
+    >>> json5.loads('{a: 1, b: 2}', select=['a', 'c'])
+    {'a': 1}
+
+    The values that aren't selected are skipped over without being
+    built or fully checked: only their strings and comments are checked
+    to be terminated and their brackets to be balanced, so an invalid
+    document may not be reported as such. The hooks and the check for
+    duplicate keys only apply to the values that are selected, and
+    `engine` is ignored.
+
+    If `lazy` is True, arrays and objects are returned as read-only
+    `Sequence` and `Mapping` proxies that only decode their members the
+    first time they are used, and then keep them. This can be much faster
+    and use less memory than decoding the whole document when only some
+    of it will be used. Errors in an array or object are only reported
+    (as a `JSON5DecodeError`) once it is used, and, as with `select`, only the
+    brackets, strings and comments of the document are checked up front.
+    `object_hook`, `object_pairs_hook` and `frozen` can't be used with
+    `lazy`, and `engine` is ignored.
+
+    >>> config = json5.loads('{a: [1, 2], b: {c: true}}', lazy=True)
+    >>> config['b']['c']
+    True
+    >>> config['a'] == [1, 2]
+    True
 
     Raises
-        - `ValueError` if given an invalid document. This is different
-          from the `json` module, which raises `json.JSONDecodeError`.
+        - `JSON5DecodeError` (a subclass of `ValueError`) if given a
+          document that isn't legal JSON5. This is like the `json`
+          module's `json.JSONDecodeError`, but also says what was
+          expected; see `JSON5DecodeError`.
+        - `ValueError` for other problems, e.g., if one of the hooks
+          rejects a value, or if `allow_duplicate_keys` is False and there
+          is a duplicate key.
         - `UnicodeDecodeError` if given a byte string that is not a
           legal UTF-8 document (or the equivalent, if using a different
           `encoding`). This matches the `json` module.
     """
 
-    val, err, _ = parse(
-        s=s,
+    val, err, _ = _parse(
+        s,
         encoding=encoding,
         cls=cls,
         object_hook=object_hook,
@@ -200,14 +764,22 @@ def loads(
         allow_duplicate_keys=allow_duplicate_keys,
         consume_trailing=consume_trailing,
         start=start,
+        engine=engine,
+        select=select,
+        lazy=lazy,
+        frozen=frozen,
+        intern_keys=intern_keys,
+        intern_strings=intern_strings,
+        numeric_arrays=numeric_arrays,
+        keep_bytes=True,
     )
     if err:
-        raise ValueError(err)
+        raise err
     return val
 
 
 def parse(
-    s: str,
+    s: Union[str, bytes, bytearray, memoryview],
     *,
     encoding: Optional[str] = None,
     cls: Any = None,
@@ -222,6 +794,13 @@ def parse(
     allow_duplicate_keys: bool = True,
     consume_trailing: bool = True,
     start: Optional[int] = None,
+    engine: Optional[str] = None,
+    select: Optional[Union[str, Sequence[str]]] = None,
+    lazy: bool = False,
+    frozen: bool = False,
+    intern_keys: Union[bool, Dict[str, str]] = False,
+    intern_strings: int = 0,
+    numeric_arrays: Optional[str] = None,
 ) -> Union[Tuple[Any, None, int], Tuple[None, str, int]]:
     """Parse ```s``, returning positional information along with a value.
 
@@ -233,8 +812,12 @@ def parse(
     (the default), any trailing characters must be whitespace. If False,
     parsing stops when a valid value has been reached, (c) it takes an
     optional `start` parameter that specifies a zero-based offset to start
-    parsing from in the string, and (d) the return value is different, as
-    described below.
+    parsing from in the string, (d) it takes optional `engine`, `select`
+    and `lazy` parameters, as described in `loads()`, and (e) the return
+    value is different, as described below.
+
+    `s` may also be a bytes-like object, as with `loads()`, but it is
+    always decoded to a `str` first, so `position` is an offset into that.
 
     `parse()` is useful if you have a string that might contain multiple
     values and you need to extract all of them; you can do so by repeatedly
@@ -260,7 +843,8 @@ def parse(
     returned as the second value in the tuple.
 
     You can use this method to read in a series of values from a string
-    `s` as follows:
+    `s` as follows (although `iterloads()` does this for you, more
+    efficiently):
 
     >>> import json5
     >>> s = '1 2 3 4'
@@ -281,45 +865,549 @@ def parse(
     [1, 2, 3, 4]
 
     """
+    val, err, pos = _parse(
+        s,
+        encoding=encoding,
+        cls=cls,
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        object_pairs_hook=object_pairs_hook,
+        allow_duplicate_keys=allow_duplicate_keys,
+        consume_trailing=consume_trailing,
+        start=start,
+        engine=engine,
+        select=select,
+        lazy=lazy,
+        frozen=frozen,
+        intern_keys=intern_keys,
+        intern_strings=intern_strings,
+        numeric_arrays=numeric_arrays,
+    )
+    if err:
+        return None, str(err), pos
+    return val, None, pos
+
+
+class JSON5Decoder:
+    def __init__(
+        self,
+        *,
+        object_hook: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+        parse_float: Optional[Callable[[str], Any]] = None,
+        parse_int: Optional[Callable[[str], Any]] = None,
+        parse_constant: Optional[Callable[[str], Any]] = None,
+        strict: bool = True,
+        object_pairs_hook: Optional[
+            Callable[[Iterable[Tuple[str, Any]]], Any]
+        ] = None,
+        allow_duplicate_keys: bool = True,
+        engine: Optional[str] = None,
+        frozen: bool = False,
+        intern_keys: Union[bool, Dict[str, str]] = False,
+        intern_strings: int = 0,
+        numeric_arrays: Optional[str] = None,
+    ):
+        """Decodes JSON5 documents using a fixed set of options. The
+        keyword args are the same as for `loads()`.
+
+        All of the work of checking and setting up the options is done
+        once, here, rather than on every call as `loads()` does, which
+        makes a difference when decoding lots of small documents. If
+        `intern_keys` is True, one intern table is shared by every
+        document that the decoder decodes.
+
+        >>> import json5
+        >>> decoder = json5.JSON5Decoder(parse_int=str)
+        >>> decoder.decode('{a: 1}')
+        {'a': '1'}
+        >>> decoder.raw_decode('x = [2] // two', 4)
+        (['2'], 7)
+        >>> list(decoder.iterdecode('3 4'))
+        ['3', '4']
+        """
+        self.object_hook = object_hook
+        self.parse_float = parse_float
+        self.parse_int = parse_int
+        self.parse_constant = parse_constant
+        self.strict = strict
+        self.object_pairs_hook = object_pairs_hook
+        self.allow_duplicate_keys = allow_duplicate_keys
+        self.engine = engine
+        self.frozen = frozen
+        self.intern_keys = intern_keys
+        self.intern_strings = intern_strings
+        self.numeric_arrays = numeric_arrays
+
+        self._decode = _engine(engine)
+        self._hooks = _hooks(
+            object_hook=object_hook,
+            parse_float=parse_float,
+            parse_int=parse_int,
+            parse_constant=parse_constant,
+            object_pairs_hook=object_pairs_hook,
+            allow_duplicate_keys=allow_duplicate_keys,
+            frozen=frozen,
+            intern_keys=intern_keys,
+            intern_strings=intern_strings,
+            numeric_arrays=numeric_arrays,
+        )
+        self._global_vars = {'_strict': strict, '_consume_trailing': True}
+        self._raw_global_vars = {'_strict': strict, '_consume_trailing': False}
+
+    def decode(self, s: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """Returns the value of the JSON5 document in `s`, which may also
+        be a bytes-like object holding UTF-8 text, as in `loads()`.
+
+        Raises the same exceptions as `loads()`.
+        """
+        if not isinstance(s, str) and self._decode is not _parse_with_speedups:
+            s = str(s, 'utf-8')
+        if not s:
+            raise ValueError('Empty strings are not legal JSON5')
+        val, err, _ = self._decode(s, 0, self._global_vars, self._hooks)
+        if err:
+            raise err
+        return val
+
+    def raw_decode(
+        self, s: Union[str, bytes, bytearray, memoryview], idx: int = 0
+    ) -> Tuple[Any, int]:
+        """Decodes the JSON5 value that starts at `s[idx]` (after any
+        whitespace and comments), ignoring whatever follows it.
+
+        Returns the value and the index just past its end. Raises the
+        same exceptions as `loads()`.
+
+        `s` may also be a bytes-like object (e.g., `bytes`, `memoryview`
+        or `mmap.mmap`) holding UTF-8 text, in which case `idx` and the
+        returned index are byte offsets. Only as much of `s` as the value
+        needs is decoded, so this is cheap even on a large buffer, but
+        the line and column numbers of any error are counted from `idx`
+        rather than from the start of `s`.
+
+        Raises ValueError if `idx` is outside of `s`.
+        """
+        size = len(s) if isinstance(s, str) else memoryview(s).nbytes
+        if not 0 <= idx <= size:
+            raise ValueError(f'idx must be between 0 and {size}, not {idx}')
+        if isinstance(s, str):
+            val, err, end = self._decode(
+                s, idx, self._raw_global_vars, self._hooks
+            )
+            if err:
+                raise err
+            return val, end
+
+        if self._decode is _parse_with_speedups:
+            try:
+                result = _speedups.scan(
+                    s,
+                    idx,
+                    self._raw_global_vars['_strict'],
+                    False,
+                    *self._hooks,
+                )
+            except ValueError:
+                result = None
+            if result is not None:
+                return result
+
+        # Decode the text a bit at a time, so that errors can be reported.
+        buf = memoryview(s).cast('B')
+        size = _RAW_DECODE_WINDOW
+        while True:
+            final = idx + size >= len(buf)
+            # Slicing a memoryview doesn't copy anything.
+            text, _ = codecs.utf_8_decode(buf[idx : idx + size], None, final)
+            if not final and _runs_past(text):
+                size *= 2
+                continue
+            val, err, end = self._decode(
+                text, 0, self._raw_global_vars, self._hooks
+            )
+            if not final and end + MAX_LOOKAHEAD > len(text):
+                # The value (or the error) might only be there because
+                # the text was cut off, so try again with more of it.
+                size *= 2
+                continue
+            if err:
+                raise err
+            if not text.isascii():
+                end = len(text[:end].encode('utf-8'))
+            return val, idx + end
+
+    def iterdecode(
+        self,
+        s: Union[str, bytes, bytearray, memoryview],
+        *,
+        lines: bool = False,
+    ) -> Iterator[Any]:
+        """Yields each of the JSON5 values in `s`, as `iterloads()` does.
+
+        `s` may also be a bytes-like object holding UTF-8 text, as in
+        `decode()`.
+        """
+        if not isinstance(s, str):
+            s = str(s, 'utf-8')
+        return _iterdecode(
+            s, self._decode, self._raw_global_vars, self._hooks, lines
+        )
+
+
+def _runs_past(text):
+    """Returns whether the array or object at the start of `text` (if
+    that's what is there) definitely continues past the end of it.
+
+    This is much quicker to find out than by decoding the value."""
+    if not _speedups:
+        return False
+    pos = Scanner(text, '<string>').skip_ws(0)
+    if pos is None or pos == len(text) or text[pos] not in '[{':
+        return False
+    end = _speedups.skip(text, pos)
+    return end == -1 or (end is not None and end + MAX_LOOKAHEAD > len(text))
+
+
+def _parse(
+    s,
+    *,
+    encoding,
+    cls,
+    object_hook,
+    parse_float,
+    parse_int,
+    parse_constant,
+    strict,
+    object_pairs_hook,
+    allow_duplicate_keys,
+    consume_trailing,
+    start,
+    engine,
+    select,
+    lazy,
+    frozen,
+    intern_keys,
+    intern_strings,
+    numeric_arrays,
+    keep_bytes=False,
+):
+    """Does the work for `parse()`, `load()` and `loads()`, returning any
+    error as the exception to raise rather than as a string.
+
+    If `keep_bytes` is True, a UTF-8 buffer may be decoded without being
+    converted to a str first, in which case the returned position is a
+    byte offset."""
     assert cls is None, 'Custom decoders are not supported'
 
-    if isinstance(s, bytes):
-        encoding = encoding or 'utf-8'
-        s = s.decode(encoding)
+    decode = _engine(engine)
+    if not isinstance(s, str) and not (
+        keep_bytes
+        and decode is _parse_with_speedups
+        and not start
+        and select is None
+        and not lazy
+        and _is_utf8(encoding)
+    ):
+        s = str(s, encoding or 'utf-8')
 
     if not s:
         raise ValueError('Empty strings are not legal JSON5')
+    if lazy and any(
+        (
+            object_hook,
+            object_pairs_hook,
+            select is not None,
+            numeric_arrays,
+            frozen,
+        )
+    ):
+        raise ValueError(
+            "`lazy` can't be used with `object_hook`, `object_pairs_hook`, "
+            '`select`, `numeric_arrays`, or `frozen`'
+        )
     start = start or 0
-    parser = Parser(s, '<string>', pos=start)
-    ast, err, pos = parser.parse(
-        global_vars={'_strict': strict, '_consume_trailing': consume_trailing}
+    hooks = _hooks(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        object_pairs_hook=object_pairs_hook,
+        allow_duplicate_keys=allow_duplicate_keys,
+        frozen=frozen,
+        intern_keys=intern_keys,
+        intern_strings=intern_strings,
+        numeric_arrays=numeric_arrays,
     )
+    global_vars = {'_strict': strict, '_consume_trailing': consume_trailing}
+    if select is not None:
+        return _parse_selected(s, start, select, global_vars, hooks)
+    if lazy:
+        return _parse_lazily(s, start, global_vars, hooks)
+    return decode(s, start, global_vars, hooks)
+
+
+def _engine(engine):
+    if engine is None:
+        engine = 'c' if _speedups else 'scanner'
+    if engine not in _ENGINES:
+        raise ValueError(
+            f'Unknown engine {engine!r}; expected one of '
+            f'{", ".join(sorted(_ENGINES))}'
+        )
+    return _ENGINES[engine]
+
+
+class _Parser(TunedParser):
+    def _err_str(self):
+        # `_parse_with_parser()` makes the error itself, so that the
+        # message is only formatted if it is used.
+        return None
+
+
+def _parse_with_parser(s, start, global_vars, hooks):
+    parser = _Parser(s, '<string>', pos=start)
+    ast, _, pos = parser.parse(global_vars=global_vars)
+    if parser.failed:
+        return None, decode_error(s, pos, start, global_vars['_strict']), pos
+
+    try:
+        return _walk_ast(ast, *hooks), None, pos
+    except ValueError as e:
+        return None, e, pos
+
+
+def _parse_with_scanner(s, start, global_vars, hooks):
+    (
+        dictify,
+        parse_float,
+        parse_int,
+        parse_constant,
+        listify,
+        intern_table,
+        intern_strings,
+        intern_keys,
+    ) = hooks
+    scanner = Scanner(
+        s,
+        '<string>',
+        pos=start,
+        dictify=dictify,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        listify=listify,
+        intern_table=intern_table,
+        intern_strings=intern_strings,
+        intern_keys=intern_keys,
+    )
+    try:
+        return scanner.parse(global_vars=global_vars)
+    except Exception as e:
+        # One of the hooks rejected a value or failed. Syntax errors
+        # anywhere in the document take precedence over that (as they do
+        # with the parser, which doesn't call any hooks until it is done),
+        # so check the rest of the document before reporting it.
+        scanner = _hookless_scanner(s, start)
+        _, err, pos = scanner.parse(global_vars=global_vars)
+        if err:
+            return None, err, pos
+        if not isinstance(e, ValueError):
+            raise
+        return None, e, pos
+
+
+def _hookless_scanner(s, start):
+    """Returns a Scanner that only checks the syntax of `s`."""
+    return Scanner(
+        s,
+        '<string>',
+        pos=start,
+        dictify=_ignore,
+        parse_float=_ignore,
+        parse_int=_ignore,
+        parse_constant=_ignore,
+    )
+
+
+def _is_utf8(encoding):
+    return encoding is None or codecs.lookup(encoding).name == 'utf-8'
+
+
+def _parse_with_speedups(s, start, global_vars, hooks):
+    # `s` may also be a UTF-8 buffer, if `start` is 0.
+    try:
+        result = _speedups.scan(
+            s,
+            start,
+            global_vars['_strict'],
+            global_vars['_consume_trailing'],
+            *hooks,
+        )
+    except ValueError:
+        # Let the scanner decide which error to report.
+        result = None
+    except Exception:
+        # A hook failed some other way. As in `_parse_with_scanner()`,
+        # syntax errors take precedence.
+        if not isinstance(s, str):
+            s = str(s, 'utf-8')
+        scanner = _hookless_scanner(s, start)
+        _, err, pos = scanner.parse(global_vars=global_vars)
+        if err:
+            return None, err, pos
+        raise
+    if result is None:
+        # The document has an error in it or uses something that the
+        # C extension doesn't handle itself. Note that this means that
+        # hooks may be called more than once for a given value.
+        if not isinstance(s, str):
+            s = str(s, 'utf-8')
+        return _parse_with_scanner(s, start, global_vars, hooks)
+    value, pos = result
+    return value, None, pos
+
+
+def _parse_selected(s, start, select, global_vars, hooks):
+    if isinstance(select, str):
+        paths = {_parse_path(select): select}
+    else:
+        paths = {_parse_path(path): path for path in select}
+    (
+        dictify,
+        parse_float,
+        parse_int,
+        parse_constant,
+        listify,
+        intern_table,
+        intern_strings,
+        intern_keys,
+    ) = hooks
+    scanner = Scanner(
+        s,
+        '<string>',
+        pos=start,
+        dictify=dictify,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        listify=listify,
+        intern_table=intern_table,
+        intern_strings=intern_strings,
+        intern_keys=intern_keys,
+        skip_container=_speedups.skip if _speedups else None,
+    )
+    try:
+        found, err, pos = scanner.select(paths, global_vars=global_vars)
+    except Exception as e:
+        # As in `_parse_with_scanner()`, syntax errors take precedence.
+        scanner = _hookless_scanner(s, start)
+        _, err, pos = scanner.select(paths, global_vars=global_vars)
+        if err:
+            return None, err, pos
+        if not isinstance(e, ValueError):
+            raise
+        return None, e, pos
     if err:
         return None, err, pos
+    if isinstance(select, str):
+        path = next(iter(paths))
+        if path not in found:
+            return None, ValueError(f'Nothing found at {select!r}'), pos
+        return found[path], None, pos
+    return (
+        {orig: found[path] for path, orig in paths.items() if path in found},
+        None,
+        pos,
+    )
+
 
+def _parse_lazily(s, start, global_vars, hooks):
+    (
+        dictify,
+        parse_float,
+        parse_int,
+        parse_constant,
+        listify,
+        intern_table,
+        intern_strings,
+        intern_keys,
+    ) = hooks
+    scanner = Scanner(
+        s,
+        '<string>',
+        pos=start,
+        dictify=dictify,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        listify=listify,
+        intern_table=intern_table,
+        intern_strings=intern_strings,
+        intern_keys=intern_keys,
+        skip_container=_speedups.skip if _speedups else None,
+    )
     try:
-        value = _convert(
-            ast,
-            object_hook=object_hook,
-            parse_float=parse_float,
-            parse_int=parse_int,
-            parse_constant=parse_constant,
-            object_pairs_hook=object_pairs_hook,
-            allow_duplicate_keys=allow_duplicate_keys,
-        )
-        return value, None, pos
+        return _lazy.parse(scanner, global_vars)
     except ValueError as e:
-        return None, str(e), pos
+        # A number hook rejected a top-level value.
+        return None, e, scanner.pos
+
+
+# Matches one step of a path passed to `select`.
+_PATH_STEP_RE = re.compile(
+    r'\[(?:(\d+)|"([^"]*)"|\'([^\']*)\')\]|(^|\.)([^.\[\]]+)'
+)
+
+
+def _parse_path(path):
+    """Splits a path like 'a.b[3]' into a tuple like ('a', 'b', 3)."""
+    steps = []
+    pos = 0
+    while pos < len(path):
+        m = _PATH_STEP_RE.match(path, pos)
+        if m is None:
+            raise ValueError(f'Invalid path {path!r}')
+        index, dquoted, squoted, _, key = m.groups()
+        if index is not None:
+            steps.append(int(index))
+        elif dquoted is not None:
+            steps.append(dquoted)
+        elif squoted is not None:
+            steps.append(squoted)
+        else:
+            steps.append(key)
+        pos = m.end()
+    return tuple(steps)
 
 
-def _convert(
-    ast,
+def _ignore(*_args, **_kwargs):
+    return None
+
+
+# The decoder implementations that `load()`, `loads()`, and `parse()` can
+# use.
+_ENGINES = {
+    'parser': _parse_with_parser,
+    'scanner': _parse_with_scanner,
+}
+if _speedups:
+    _ENGINES['c'] = _parse_with_speedups
+
+
+def _hooks(
     object_hook,
     parse_float,
     parse_int,
     parse_constant,
     object_pairs_hook,
     allow_duplicate_keys,
+    frozen=False,
+    intern_keys=False,
+    intern_strings=0,
+    numeric_arrays=None,
 ):
     def _fp_constant_parser(s):
         return float(s.replace('Infinity', 'inf').replace('NaN', 'nan'))
@@ -335,14 +1423,68 @@ def _convert(
         if object_pairs_hook:
             return object_pairs_hook(pairs)
         if object_hook:
-            return object_hook(dict(pairs))
-        return dict(pairs)
+            return object_hook(mapping(pairs))
+        return mapping(pairs)
 
+    if numeric_arrays not in (None, 'array'):
+        raise ValueError(
+            f'Invalid value for numeric_arrays: {numeric_arrays!r}'
+        )
+    if numeric_arrays and frozen:
+        raise ValueError("`numeric_arrays` can't be used with `frozen`")
+
+    mapping = FrozenDict if frozen else dict
+    if frozen:
+        listify = tuple
+    elif numeric_arrays:
+        listify = _numeric_array
+    else:
+        listify = None
+    if isinstance(intern_keys, dict):
+        intern_table = intern_keys
+        intern_keys = True
+    elif intern_keys or intern_strings:
+        intern_table = {}
+    else:
+        intern_table = None
+    rest = (listify, intern_table, intern_strings, bool(intern_keys))
     parse_float = parse_float or float
     parse_int = parse_int or int
     parse_constant = parse_constant or _fp_constant_parser
 
-    return _walk_ast(ast, _dictify, parse_float, parse_int, parse_constant)
+    if allow_duplicate_keys and not object_pairs_hook and not object_hook:
+        return (mapping, parse_float, parse_int, parse_constant) + rest
+    return (_dictify, parse_float, parse_int, parse_constant) + rest
+
+
+# The range of integers that can be stored in a double exactly.
+_MAX_EXACT_FLOAT_INT = 2**53
+
+
+def _numeric_array(values):
+    """Returns `values` as an `array.array` of 64-bit ints ('q') or of
+    doubles ('d') if it is a non-empty list of just ints, or of floats
+    and ints that fit in a double exactly. Otherwise returns `values`."""
+    # bool is a subclass of int, so this checks for the exact types.
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return array.array('q', values)
+        except OverflowError:
+            return values
+    if types == {float} or (
+        types == {int, float}
+        and all(
+            -_MAX_EXACT_FLOAT_INT <= v <= _MAX_EXACT_FLOAT_INT
+            for v in values
+            if type(v) is int
+        )
+    ):
+        return array.array('d', values)
+    return values
+
+
+_SMALL_INTS = {str(i): i for i in range(-256, 1024)}
 
 
 def _walk_ast(
@@ -351,39 +1493,61 @@ def _walk_ast(
     parse_float,
     parse_int,
     parse_constant,
+    listify=None,
+    intern_table=None,
+    intern_strings=0,
+    intern_keys=False,
 ):
-    if el == 'None':
-        return None
-    if el == 'True':
-        return True
-    if el == 'False':
-        return False
-    ty, v = el
-    if ty == 'number':
-        unsigned = v[1:] if v.startswith('-') else v
-        if unsigned.startswith('0x') or unsigned.startswith('0X'):
-            return parse_int(v, base=16)
-        if '.' in v or 'e' in v or 'E' in v:
+    def intern(s):
+        interned = intern_table.get(s)
+        if interned is None:
+            if len(intern_table) >= MAX_INTERNED:
+                return s
+            intern_table[s] = interned = s
+        return interned
+
+    # The parser has already worked out what kind of number each one is,
+    # so all that's left is to convert it. Small integers are common
+    # enough (counts, indexes, flags) that looking them up is worthwhile.
+    small_ints = _SMALL_INTS if parse_int is int else None
+
+    def walk(el):
+        if el == 'None':
+            return None
+        if el == 'True':
+            return True
+        if el == 'False':
+            return False
+        ty, v = el
+        if ty == 'int':
+            if small_ints is not None:
+                n = small_ints.get(v)
+                if n is not None:
+                    return n
+            return parse_int(v)
+        if ty == 'string':
+            if intern_table is not None and len(v) <= intern_strings:
+                return intern(v)
+            return v
+        if ty == 'float':
             return parse_float(v)
-        if 'Infinity' in v or 'NaN' in v:
+        if ty == 'hex':
+            return parse_int(v, base=16)
+        if ty == 'const':
             return parse_constant(v)
-        return parse_int(v)
-    if ty == 'string':
-        return v
-    if ty == 'object':
-        pairs = []
-        for key, val_expr in v:
-            val = _walk_ast(
-                val_expr, dictify, parse_float, parse_int, parse_constant
-            )
-            pairs.append((key, val))
-        return dictify(pairs)
-    if ty == 'array':
-        return [
-            _walk_ast(el, dictify, parse_float, parse_int, parse_constant)
-            for el in v
-        ]
-    raise ValueError('unknown el: ' + el)  # pragma: no cover
+        if ty == 'object':
+            pairs = []
+            for key, val_expr in v:
+                if intern_keys:
+                    key = intern(key)
+                pairs.append((key, walk(val_expr)))
+            return dictify(pairs)
+        if ty == 'array':
+            values = [walk(el) for el in v]
+            return values if listify is None else listify(values)
+        raise ValueError('unknown el: ' + el)  # pragma: no cover
+
+    return walk(el)
 
 
 def dump(
@@ -0,0 +1,109 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Mapping offsets in a document to line and column numbers."""
+
+import array
+import bisect
+import collections
+import re
+import threading
+from typing import Optional, Tuple
+
+_NEWLINE_RE = re.compile('\n')
+
+
+class LineIndex:
+    """Maps zero-based offsets in `text` to one-based (line, column) pairs
+    and back again, the same way that error messages do: only '\\n' starts
+    a new line, and every other character is one column wide.
+
+    The index is built the first time it is used, after which each lookup
+    takes O(log(number of lines)) time. It doesn't keep a reference to the
+    text once it has been built.
+
+    >>> index = LineIndex('{\\n  a: 1,\\n}')
+    >>> index.position(5)
+    (2, 4)
+    >>> index.offset(2, 4)
+    5
+    """
+
+    def __init__(self, text: str):
+        self._text = text
+        self._starts: Optional[array.array] = None
+
+    def _line_starts(self) -> array.array:
+        if self._starts is None:
+            # This finds the newlines without copying any of the text.
+            starts = array.array('q', [0])
+            starts.extend(m.end() for m in _NEWLINE_RE.finditer(self._text))
+            self._starts = starts
+            self._text = ''
+        return self._starts
+
+    def __len__(self) -> int:
+        """Returns the number of lines in the text."""
+        return len(self._line_starts())
+
+    def position(self, pos: int) -> Tuple[int, int]:
+        """Returns the line and column numbers of `text[pos]`."""
+        starts = self._line_starts()
+        i = bisect.bisect_right(starts, pos) - 1
+        return i + 1, pos - starts[i] + 1
+
+    def offset(self, lineno: int, colno: int) -> int:
+        """Returns the offset of the given line and column in the text."""
+        return self._line_starts()[lineno - 1] + colno - 1
+
+
+def advance(text: str, pos: int, lineno: int, colno: int) -> Tuple[int, int]:
+    """Returns the line and column numbers of `text[pos]`, given those of
+    `text[0]`. Unlike `LineIndex`, this doesn't build anything, so it's
+    better when `text` is only looked at once."""
+    newlines = text.count('\n', 0, pos)
+    if newlines:
+        return lineno + newlines, pos - text.rfind('\n', 0, pos)
+    return lineno, colno + pos
+
+
+_MAX_CACHED = 8
+_cache: 'collections.OrderedDict[Tuple[int, int], Tuple[str, LineIndex]]' = (
+    collections.OrderedDict()
+)
+_cache_lock = threading.Lock()
+
+
+def line_index(text: str) -> LineIndex:
+    """Returns a `LineIndex` for `text`.
+
+    The indexes for the last few strings passed in are cached, so that
+    (for example) reporting several errors in the same large document
+    only scans it for line breaks once.
+    """
+    # Strings cache their own hashes, so this only looks at all of `text`
+    # the first time. Different strings can have the same length and
+    # hash, so the text is kept to check that it is the same; usually it
+    # is the very same string, which is quick to check.
+    key = (len(text), hash(text))
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and (entry[0] is text or entry[0] == text):
+            _cache.move_to_end(key)
+            return entry[1]
+        index = LineIndex(text)
+        _cache[key] = (text, index)
+        if len(_cache) > _MAX_CACHED:
+            _cache.popitem(last=False)
+        return index
@@ -328,7 +328,7 @@ class Parser:
         self._choose(
             [
                 self._value__c0_,
-                self._value__c1_,
+                self._num_literal_,
                 self._value__c2_,
                 self._value__c3_,
                 self._value__c4_,
@@ -338,105 +338,91 @@ class Parser:
         )
 
     def _value__c0_(self):
-        self._seq([lambda: self._str('null'), lambda: self._succeed('None')])
-
-    def _value__c1_(self):
-        self._seq([lambda: self._str('true'), lambda: self._succeed('True')])
+        self._push('value__c0')
+        self._seq(
+            [
+                lambda: self._bind(self._string_, 'v'),
+                lambda: self._succeed(['string', self._get('v')]),
+            ]
+        )
+        self._pop('value__c0')
 
     def _value__c2_(self):
-        self._seq([lambda: self._str('false'), lambda: self._succeed('False')])
-
-    def _value__c3_(self):
-        self._push('value__c3')
+        self._push('value__c2')
         self._seq(
             [
                 lambda: self._bind(self._object_, 'v'),
                 lambda: self._succeed(['object', self._get('v')]),
             ]
         )
-        self._pop('value__c3')
+        self._pop('value__c2')
 
-    def _value__c4_(self):
-        self._push('value__c4')
+    def _value__c3_(self):
+        self._push('value__c3')
         self._seq(
             [
                 lambda: self._bind(self._array_, 'v'),
                 lambda: self._succeed(['array', self._get('v')]),
             ]
         )
-        self._pop('value__c4')
+        self._pop('value__c3')
+
+    def _value__c4_(self):
+        self._seq([lambda: self._str('null'), lambda: self._succeed('None')])
 
     def _value__c5_(self):
-        self._push('value__c5')
-        self._seq(
-            [
-                lambda: self._bind(self._string_, 'v'),
-                lambda: self._succeed(['string', self._get('v')]),
-            ]
-        )
-        self._pop('value__c5')
+        self._seq([lambda: self._str('true'), lambda: self._succeed('True')])
 
     def _value__c6_(self):
-        self._push('value__c6')
-        self._seq(
-            [
-                lambda: self._bind(self._num_literal_, 'v'),
-                lambda: self._succeed(['number', self._get('v')]),
-            ]
-        )
-        self._pop('value__c6')
+        self._seq([lambda: self._str('false'), lambda: self._succeed('False')])
 
     def _object_(self):
-        self._choose([self._object__c0_, self._object__c1_])
-
-    def _object__c0_(self):
-        self._push('object__c0')
+        self._push('object')
         self._seq(
             [
                 lambda: self._ch('{'),
                 self._sp_,
-                lambda: self._bind(self._member_list_, 'v'),
-                self._sp_,
-                lambda: self._ch('}'),
-                lambda: self._succeed(self._get('v')),
+                lambda: self._choose(
+                    [self._object__s2__c0_, self._object__s2__c1_]
+                ),
             ]
         )
-        self._pop('object__c0')
+        self._pop('object')
+
+    def _object__s2__c0_(self):
+        self._seq([lambda: self._ch('}'), lambda: self._succeed([])])
 
-    def _object__c1_(self):
+    def _object__s2__c1_(self):
         self._seq(
             [
-                lambda: self._ch('{'),
-                self._sp_,
+                lambda: self._bind(self._member_list_, 'v'),
                 lambda: self._ch('}'),
-                lambda: self._succeed([]),
+                lambda: self._succeed(self._get('v')),
             ]
         )
 
     def _array_(self):
-        self._choose([self._array__c0_, self._array__c1_])
-
-    def _array__c0_(self):
-        self._push('array__c0')
+        self._push('array')
         self._seq(
             [
                 lambda: self._ch('['),
                 self._sp_,
-                lambda: self._bind(self._element_list_, 'v'),
-                self._sp_,
-                lambda: self._ch(']'),
-                lambda: self._succeed(self._get('v')),
+                lambda: self._choose(
+                    [self._array__s2__c0_, self._array__s2__c1_]
+                ),
             ]
         )
-        self._pop('array__c0')
+        self._pop('array')
+
+    def _array__s2__c0_(self):
+        self._seq([lambda: self._ch(']'), lambda: self._succeed([])])
 
-    def _array__c1_(self):
+    def _array__s2__c1_(self):
         self._seq(
             [
-                lambda: self._ch('['),
-                self._sp_,
+                lambda: self._bind(self._element_list_, 'v'),
                 lambda: self._ch(']'),
-                lambda: self._succeed([]),
+                lambda: self._succeed(self._get('v')),
             ]
         )
 
@@ -474,31 +460,23 @@ class Parser:
         self._bind(lambda: self._star(self._dqchar_), 'cs')
 
     def _sqchar_(self):
-        self._choose(
-            [
-                self._sqchar__c0_,
-                self._sqchar__c1_,
-                self._sqchar__c2_,
-                self._sqchar__c3_,
-            ]
-        )
+        self._choose([self._sqchar__c0_, self._sqchar__c1_, self._sqchar__c2_])
 
     def _sqchar__c0_(self):
-        self._push('sqchar__c0')
         self._seq(
             [
                 self._bslash_,
-                lambda: self._bind(self._esc_char_, 'c'),
-                lambda: self._succeed(self._get('c')),
+                lambda: self._choose(
+                    [self._esc_char_, self._sqchar__c0__s1__c1_]
+                ),
             ]
         )
-        self._pop('sqchar__c0')
 
-    def _sqchar__c1_(self):
-        self._seq([self._bslash_, self._eol_, lambda: self._succeed('')])
+    def _sqchar__c0__s1__c1_(self):
+        self._seq([self._eol_, lambda: self._succeed('')])
 
-    def _sqchar__c2_(self):
-        self._push('sqchar__c2')
+    def _sqchar__c1_(self):
+        self._push('sqchar__c1')
         self._seq(
             [
                 lambda: self._not(self._bslash_),
@@ -508,17 +486,17 @@ class Parser:
                 lambda: self._succeed(self._get('c')),
             ]
         )
-        self._pop('sqchar__c2')
+        self._pop('sqchar__c1')
 
-    def _sqchar__c3_(self):
+    def _sqchar__c2_(self):
         self._seq(
             [
-                lambda: self._not(self._sqchar__c3__s0_n_),
+                lambda: self._not(self._sqchar__c2__s0_n_),
                 lambda: self._range('\x00', '\x1f'),
             ]
         )
 
-    def _sqchar__c3__s0_n_(self):
+    def _sqchar__c2__s0_n_(self):
         v = self._get('_strict')
         if v:
             self._succeed(v)
@@ -526,31 +504,23 @@ class Parser:
             self._fail()
 
     def _dqchar_(self):
-        self._choose(
-            [
-                self._dqchar__c0_,
-                self._dqchar__c1_,
-                self._dqchar__c2_,
-                self._dqchar__c3_,
-            ]
-        )
+        self._choose([self._dqchar__c0_, self._dqchar__c1_, self._dqchar__c2_])
 
     def _dqchar__c0_(self):
-        self._push('dqchar__c0')
         self._seq(
             [
                 self._bslash_,
-                lambda: self._bind(self._esc_char_, 'c'),
-                lambda: self._succeed(self._get('c')),
+                lambda: self._choose(
+                    [self._esc_char_, self._dqchar__c0__s1__c1_]
+                ),
             ]
         )
-        self._pop('dqchar__c0')
 
-    def _dqchar__c1_(self):
-        self._seq([self._bslash_, self._eol_, lambda: self._succeed('')])
+    def _dqchar__c0__s1__c1_(self):
+        self._seq([self._eol_, lambda: self._succeed('')])
 
-    def _dqchar__c2_(self):
-        self._push('dqchar__c2')
+    def _dqchar__c1_(self):
+        self._push('dqchar__c1')
         self._seq(
             [
                 lambda: self._not(self._bslash_),
@@ -560,17 +530,17 @@ class Parser:
                 lambda: self._succeed(self._get('c')),
             ]
         )
-        self._pop('dqchar__c2')
+        self._pop('dqchar__c1')
 
-    def _dqchar__c3_(self):
+    def _dqchar__c2_(self):
         self._seq(
             [
-                lambda: self._not(self._dqchar__c3__s0_n_),
+                lambda: self._not(self._dqchar__c2__s0_n_),
                 lambda: self._range('\x00', '\x1f'),
             ]
         )
 
-    def _dqchar__c3__s0_n_(self):
+    def _dqchar__c2__s0_n_(self):
         v = self._get('_strict')
         if v:
             self._succeed(v)
@@ -731,67 +701,66 @@ class Parser:
         self._seq(
             [
                 lambda: self._bind(self._value_, 'v'),
-                self._element_list__s1_,
                 self._sp_,
-                self._element_list__s3_,
+                self._element_list__s2_,
+                lambda: self._opt(self._element_list__s3_p_),
                 lambda: self._succeed([self._get('v')] + self._get('vs')),
             ]
         )
         self._pop('element_list')
 
-    def _element_list__s1_(self):
-        self._bind(lambda: self._star(self._element_list__s1_l_p_), 'vs')
+    def _element_list__s2_(self):
+        self._bind(lambda: self._star(self._element_list__s2_l_p_), 'vs')
 
-    def _element_list__s1_l_p_(self):
-        self._seq([self._sp_, lambda: self._ch(','), self._sp_, self._value_])
+    def _element_list__s2_l_p_(self):
+        self._seq(
+            [
+                lambda: self._ch(','),
+                self._sp_,
+                lambda: self._bind(self._value_, 'e'),
+                self._sp_,
+                lambda: self._succeed(self._get('e')),
+            ]
+        )
 
-    def _element_list__s3_(self):
-        self._opt(lambda: self._ch(','))
+    def _element_list__s3_p_(self):
+        self._seq([lambda: self._ch(','), self._sp_])
 
     def _member_list_(self):
         self._push('member_list')
         self._seq(
             [
                 lambda: self._bind(self._member_, 'm'),
-                self._member_list__s1_,
                 self._sp_,
-                self._member_list__s3_,
+                self._member_list__s2_,
+                lambda: self._opt(self._member_list__s3_p_),
                 lambda: self._succeed([self._get('m')] + self._get('ms')),
             ]
         )
         self._pop('member_list')
 
-    def _member_list__s1_(self):
-        self._bind(lambda: self._star(self._member_list__s1_l_p_), 'ms')
+    def _member_list__s2_(self):
+        self._bind(lambda: self._star(self._member_list__s2_l_p_), 'ms')
 
-    def _member_list__s1_l_p_(self):
-        self._seq([self._sp_, lambda: self._ch(','), self._sp_, self._member_])
-
-    def _member_list__s3_(self):
-        self._opt(lambda: self._ch(','))
-
-    def _member_(self):
-        self._choose([self._member__c0_, self._member__c1_])
-
-    def _member__c0_(self):
-        self._push('member__c0')
+    def _member_list__s2_l_p_(self):
         self._seq(
             [
-                lambda: self._bind(self._string_, 'k'),
+                lambda: self._ch(','),
                 self._sp_,
-                lambda: self._ch(':'),
+                lambda: self._bind(self._member_, 'e'),
                 self._sp_,
-                lambda: self._bind(self._value_, 'v'),
-                lambda: self._succeed([self._get('k'), self._get('v')]),
+                lambda: self._succeed(self._get('e')),
             ]
         )
-        self._pop('member__c0')
 
-    def _member__c1_(self):
-        self._push('member__c1')
+    def _member_list__s3_p_(self):
+        self._seq([lambda: self._ch(','), self._sp_])
+
+    def _member_(self):
+        self._push('member')
         self._seq(
             [
-                lambda: self._bind(self._ident_, 'k'),
+                self._member__s0_,
                 self._sp_,
                 lambda: self._ch(':'),
                 self._sp_,
@@ -799,7 +768,10 @@ class Parser:
                 lambda: self._succeed([self._get('k'), self._get('v')]),
             ]
         )
-        self._pop('member__c1')
+        self._pop('member')
+
+    def _member__s0_(self):
+        self._bind(lambda: self._choose([self._string_, self._ident_]), 'k')
 
     def _ident_(self):
         self._push('ident')
@@ -1079,7 +1051,9 @@ class Parser:
             [
                 lambda: self._ch('-'),
                 lambda: self._bind(self._unsigned_lit_, 'n'),
-                lambda: self._succeed('-' + self._get('n')),
+                lambda: self._succeed(
+                    [self._get('n')[0], '-' + self._get('n')[1]]
+                ),
             ]
         )
         self._pop('num_literal__c0')
@@ -1109,7 +1083,7 @@ class Parser:
         self._choose(
             [
                 self._unsigned_lit__c0_,
-                self._hex_literal_,
+                self._unsigned_lit__c1_,
                 self._unsigned_lit__c2_,
                 self._unsigned_lit__c3_,
             ]
@@ -1117,6 +1091,16 @@ class Parser:
 
     def _unsigned_lit__c0_(self):
         self._push('unsigned_lit__c0')
+        self._seq(
+            [
+                lambda: self._bind(self._hex_literal_, 'h'),
+                lambda: self._succeed(['hex', self._get('h')]),
+            ]
+        )
+        self._pop('unsigned_lit__c0')
+
+    def _unsigned_lit__c1_(self):
+        self._push('unsigned_lit__c1')
         self._seq(
             [
                 lambda: self._bind(self._dec_literal_, 'd'),
@@ -1124,92 +1108,87 @@ class Parser:
                 lambda: self._succeed(self._get('d')),
             ]
         )
-        self._pop('unsigned_lit__c0')
+        self._pop('unsigned_lit__c1')
 
     def _unsigned_lit__c2_(self):
-        self._str('Infinity')
+        self._seq(
+            [
+                lambda: self._str('Infinity'),
+                lambda: self._succeed(['const', 'Infinity']),
+            ]
+        )
 
     def _unsigned_lit__c3_(self):
-        self._str('NaN')
+        self._seq(
+            [lambda: self._str('NaN'), lambda: self._succeed(['const', 'NaN'])]
+        )
 
     def _dec_literal_(self):
-        self._choose(
-            [
-                self._dec_literal__c0_,
-                self._dec_literal__c1_,
-                self._dec_literal__c2_,
-                self._dec_literal__c3_,
-                self._dec_literal__c4_,
-                self._dec_literal__c5_,
-            ]
-        )
+        self._choose([self._dec_literal__c0_, self._dec_literal__c1_])
 
     def _dec_literal__c0_(self):
         self._push('dec_literal__c0')
         self._seq(
             [
                 lambda: self._bind(self._dec_int_lit_, 'd'),
-                lambda: self._bind(self._frac_, 'f'),
-                lambda: self._bind(self._exp_, 'e'),
-                lambda: self._succeed(
-                    self._get('d') + self._get('f') + self._get('e')
-                ),
+                self._dec_literal__c0__s1_,
             ]
         )
         self._pop('dec_literal__c0')
 
-    def _dec_literal__c1_(self):
-        self._push('dec_literal__c1')
-        self._seq(
+    def _dec_literal__c0__s1_(self):
+        self._choose(
             [
-                lambda: self._bind(self._dec_int_lit_, 'd'),
-                lambda: self._bind(self._frac_, 'f'),
-                lambda: self._succeed(self._get('d') + self._get('f')),
+                self._dec_literal__c0__s1__c0_,
+                self._dec_literal__c0__s1__c1_,
+                lambda: self._succeed(['int', self._get('d')]),
             ]
         )
-        self._pop('dec_literal__c1')
 
-    def _dec_literal__c2_(self):
-        self._push('dec_literal__c2')
+    def _dec_literal__c0__s1__c0_(self):
         self._seq(
             [
-                lambda: self._bind(self._dec_int_lit_, 'd'),
-                lambda: self._bind(self._exp_, 'e'),
-                lambda: self._succeed(self._get('d') + self._get('e')),
+                lambda: self._bind(self._frac_, 'f'),
+                self._dec_literal__c0__s1__c0__s1_,
+                lambda: self._succeed(
+                    [
+                        'float',
+                        self._get('d')
+                        + self._get('f')
+                        + self._join('', self._get('e')),
+                    ]
+                ),
             ]
         )
-        self._pop('dec_literal__c2')
 
-    def _dec_literal__c3_(self):
-        self._push('dec_literal__c3')
-        self._seq(
-            [
-                lambda: self._bind(self._dec_int_lit_, 'd'),
-                lambda: self._succeed(self._get('d')),
-            ]
-        )
-        self._pop('dec_literal__c3')
+    def _dec_literal__c0__s1__c0__s1_(self):
+        self._bind(lambda: self._opt(self._exp_), 'e')
 
-    def _dec_literal__c4_(self):
-        self._push('dec_literal__c4')
+    def _dec_literal__c0__s1__c1_(self):
         self._seq(
             [
-                lambda: self._bind(self._frac_, 'f'),
                 lambda: self._bind(self._exp_, 'e'),
-                lambda: self._succeed(self._get('f') + self._get('e')),
+                lambda: self._succeed(
+                    ['float', self._get('d') + self._get('e')]
+                ),
             ]
         )
-        self._pop('dec_literal__c4')
 
-    def _dec_literal__c5_(self):
-        self._push('dec_literal__c5')
+    def _dec_literal__c1_(self):
+        self._push('dec_literal__c1')
         self._seq(
             [
                 lambda: self._bind(self._frac_, 'f'),
-                lambda: self._succeed(self._get('f')),
+                self._dec_literal__c1__s1_,
+                lambda: self._succeed(
+                    ['float', self._get('f') + self._join('', self._get('e'))]
+                ),
             ]
         )
-        self._pop('dec_literal__c5')
+        self._pop('dec_literal__c1')
+
+    def _dec_literal__c1__s1_(self):
+        self._bind(lambda: self._opt(self._exp_), 'e')
 
     def _dec_int_lit_(self):
         self._choose([self._dec_int_lit__c0_, self._dec_int_lit__c1_])
@@ -1286,46 +1265,31 @@ class Parser:
         self._bind(lambda: self._star(self._digit_), 'ds')
 
     def _exp_(self):
-        self._choose([self._exp__c0_, self._exp__c1_])
-
-    def _exp__c0_(self):
-        self._push('exp__c0')
+        self._push('exp')
         self._seq(
             [
-                self._exp__c0__s0_,
-                lambda: self._bind(self._exp__c0__s1_l_, 's'),
-                self._exp__c0__s2_,
+                self._exp__s0_,
+                self._exp__s1_,
+                self._exp__s2_,
                 lambda: self._succeed(
-                    'e' + self._get('s') + self._join('', self._get('ds'))
+                    'e'
+                    + self._join('', self._get('s'))
+                    + self._join('', self._get('ds'))
                 ),
             ]
         )
-        self._pop('exp__c0')
+        self._pop('exp')
 
-    def _exp__c0__s0_(self):
+    def _exp__s0_(self):
         self._choose([lambda: self._ch('e'), lambda: self._ch('E')])
 
-    def _exp__c0__s1_l_(self):
-        self._choose([lambda: self._ch('+'), lambda: self._ch('-')])
+    def _exp__s1_(self):
+        self._bind(lambda: self._opt(self._exp__s1_l_p_), 's')
 
-    def _exp__c0__s2_(self):
-        self._bind(lambda: self._star(self._digit_), 'ds')
-
-    def _exp__c1_(self):
-        self._push('exp__c1')
-        self._seq(
-            [
-                self._exp__c1__s0_,
-                self._exp__c1__s1_,
-                lambda: self._succeed('e' + self._join('', self._get('ds'))),
-            ]
-        )
-        self._pop('exp__c1')
-
-    def _exp__c1__s0_(self):
-        self._choose([lambda: self._ch('e'), lambda: self._ch('E')])
+    def _exp__s1_l_p_(self):
+        self._choose([lambda: self._ch('+'), lambda: self._ch('-')])
 
-    def _exp__c1__s1_(self):
+    def _exp__s2_(self):
         self._bind(lambda: self._star(self._digit_), 'ds')
 
     def _anything_(self):
@@ -0,0 +1,1033 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A hand-written, single-pass recursive-descent parser for JSON5.
+
+`Scanner` is an alternative to the `Parser` class generated from
+`json5.g`: it accepts exactly the same documents and reports errors at
+exactly the same positions. Rather than trying each alternative of a
+rule in turn and backtracking when one fails, it looks at the first
+character of each value to decide what to parse.
+
+Rather than returning an AST that must then be walked a second time,
+the scanner builds the Python values directly, calling the `dictify`,
+`listify` (if any) and number-parsing hooks it is given as each value
+is completed.
+Exceptions raised by the hooks are not caught.
+
+Reporting errors at the same positions takes some care, because the
+generated parser reports the farthest position at which *any* attempted
+match failed, and a couple of its rules look one character past the
+point where a successful parse stops:
+
+- The `id_start` and `id_continue` rules are tried after every decimal
+  literal and every unquoted key, and at the start of every object key.
+  For most characters they consume the character and then check its
+  Unicode category, so when they fail they do so one character past
+  the character that didn't match.
+- The `comment` rule (tried whenever whitespace is allowed) consumes a
+  '/' before checking for a second '/' or a '*'.
+
+The `_fail_*` methods below account for these cases.
+"""
+
+import collections.abc
+import functools
+import re
+import unicodedata
+
+from json5.errors import JSON5DecodeError
+from json5.lines import advance
+
+_ASCII_ID_START = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ$_'
+)
+_ASCII_ID_CONTINUE = _ASCII_ID_START | frozenset('0123456789')
+_ID_START_CATEGORIES = frozenset(('Ll', 'Lm', 'Lo', 'Lt', 'Lu', 'Nl'))
+_ID_CONTINUE_CATEGORIES = _ID_START_CATEGORIES | frozenset(
+    ('Mn', 'Mc', 'Nd', 'Pc')
+)
+
+_DIGITS = frozenset('0123456789')
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+_EOL_CHARS = frozenset('\n\r\u2028\u2029')
+
+_ESCAPES = {
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+    'v': '\v',
+    "'": "'",
+    '"': '"',
+    '\\': '\\',
+}
+
+_NUMBER_START = frozenset('0123456789.+-IN')
+
+# These match the longest runs of characters that need no special
+# handling, so that the common cases can be consumed in a single step.
+# Anything they stop at (a backslash, a line terminator, or a non-ASCII
+# character that might be whitespace or part of an identifier) is then
+# handled one character at a time.
+_WS_RUN_RE = re.compile('[ \t\n\v\f\r\xa0\ufeff\u2028\u2029]*')
+_LINE_COMMENT_RE = re.compile('[^\n\r\u2028\u2029]*')
+_STRING_RUN_RES = {
+    '"': re.compile('[^"\\\\\n\r\u2028\u2029]*'),
+    "'": re.compile("[^'\\\\\n\r\u2028\u2029]*"),
+}
+_ID_CONTINUE_RUN_RE = re.compile('[a-zA-Z0-9$_]*')
+
+# Groups are: sign, hex literal, decimal mantissa, decimal exponent, and
+# named constant. This matches the same text as the `num_literal` rule
+# except that it doesn't check that a decimal literal isn't immediately
+# followed by an identifier.
+_NUMBER_RE = re.compile(
+    r'([-+]?)(?:'
+    r'(0[xX][0-9a-fA-F]+)'
+    r'|((?:0(?![0-9])|[1-9][0-9]*)(?:\.[0-9]*)?|\.[0-9]*)([eE][-+]?[0-9]*)?'
+    r'|(Infinity|NaN))'
+)
+
+
+# Used by `select()` to skip over values without building them. These
+# don't check that what they skip is valid JSON5, only that strings and
+# comments are terminated and that brackets are balanced.
+_SKIP_STRING_RES = {
+    '"': re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL),
+    "'": re.compile(r"'[^'\\]*(?:\\.[^'\\]*)*'", re.DOTALL),
+}
+_SKIP_RUN_RE = re.compile(
+    r'(?:[^"\'/\[\]{}]+|'
+    + '|'.join(r.pattern for r in _SKIP_STRING_RES.values())
+    + ')*',
+    re.DOTALL,
+)
+_SKIP_SCALAR_RE = re.compile(r'[^,\]}/\s]*')
+_CLOSERS = {'{': '}', '[': ']'}
+
+_END_EVENTS = {'}': 'end_map', ']': 'end_array'}
+
+# The most strings that will be added to an intern table (see `Scanner`).
+# Must match MAX_INTERNED in _speedups.c.
+MAX_INTERNED = 65536
+
+# The farthest past the end of a token that the scanner looks, in order
+# to check that a number isn't followed by an escaped identifier character
+# (e.g., `\u0041`).
+MAX_LOOKAHEAD = 6
+
+
+class _ParseError(Exception):
+    def __init__(self, errpos):
+        super().__init__(errpos)
+        self.errpos = errpos
+
+
+def _parse_constant(s):
+    return float(s.replace('Infinity', 'inf').replace('NaN', 'nan'))
+
+
+def _ignore_number(*_args, **_kwargs):
+    return None
+
+
+def _expected_tokens(msg, start, strict, errpos):
+    """Returns what `events()` expected next when it found an error at
+    `msg[errpos]` in the value at `msg[start]`, or None if it didn't find
+    one there."""
+    scanner = Scanner(
+        msg,
+        '<string>',
+        start,
+        parse_float=_ignore_number,
+        parse_int=_ignore_number,
+        parse_constant=_ignore_number,
+    )
+    try:
+        for _ in scanner.events(strict=strict):
+            pass
+    except JSON5DecodeError as e:
+        if e.pos == errpos:
+            return e.expected
+    return None
+
+
+def decode_error(msg, errpos, start, strict, fname='<string>', origin=(1, 1)):
+    """Returns a JSON5DecodeError for a syntax error at `msg[errpos]`,
+    found while decoding the value at `msg[start]`."""
+    return JSON5DecodeError(
+        msg,
+        errpos,
+        fname=fname,
+        origin=origin,
+        expected=functools.partial(
+            _expected_tokens, msg, start, strict, errpos
+        ),
+    )
+
+
+def _lookup(val, path, depth, found):
+    """Adds the value at `path[depth:]` in `val`, if any, to `found`.
+
+    The containers in `val` may have been made by hooks (e.g., an
+    `OrderedDict` or an `array.array`), so any mapping is indexed by key
+    and anything else but a string by position."""
+    for step in path[depth:]:
+        if isinstance(step, int):
+            if step < 0 or isinstance(val, (str, collections.abc.Mapping)):
+                return
+        elif not isinstance(val, collections.abc.Mapping):
+            return
+        try:
+            val = val[step]
+        except (LookupError, TypeError):
+            return
+    found[path] = val
+
+
+class Scanner:
+    def __init__(
+        self,
+        msg,
+        fname,
+        pos=0,
+        *,
+        dictify=dict,
+        parse_float=float,
+        parse_int=int,
+        parse_constant=_parse_constant,
+        listify=None,
+        intern_table=None,
+        intern_strings=0,
+        intern_keys=False,
+        skip_container=None,
+    ):
+        self.msg = msg
+        self.fname = fname
+        self.end = len(msg)
+        self.pos = pos
+        self.errpos = pos
+        self.val = None
+        self._strict = True
+        self._dictify = dictify
+        self._parse_float = parse_float
+        self._parse_int = parse_int
+        self._parse_constant = parse_constant
+        self._listify = listify
+
+        # If `intern_table` is a dict, string values that are at most
+        # `intern_strings` characters long (and object keys, if
+        # `intern_keys` is True) are replaced by the equal string in the
+        # table, if any, so that repeated strings share one object.
+        # Strings are added to the table as they are seen, until it holds
+        # MAX_INTERNED of them.
+        self._intern_table = intern_table
+        self._intern_strings = intern_strings
+        self._intern_keys = intern_keys
+
+        # An optional faster way for `select()` to skip over arrays and
+        # objects: `skip_container(msg, pos)` returns the same thing as
+        # `_skip_value(pos)` when that succeeds, or None or -1 if it
+        # fails.
+        self._skip_container = skip_container
+
+        # The position just past the most recent decimal literal or
+        # unquoted key, i.e., the last place that `id_start` or
+        # `id_continue` would've been tried by the generated parser.
+        self._id_probe = -1
+
+        # Used by `events()` when reading from a stream: `msg` holds the
+        # part of the document that starts at `_offset`, which is at the
+        # given line and column.
+        self._read = None
+        self._chunk_size = 0
+        self._offset = 0
+        self._lineno = 1
+        self._colno = 1
+
+        # Set by `events()` when it fails, to what it expected next.
+        self._expected = None
+
+    def parse(self, global_vars=None):
+        global_vars = global_vars or {}
+        self._strict = global_vars.get('_strict', True)
+        consume_trailing = global_vars.get('_consume_trailing', True)
+        try:
+            pos = self._skip_ws(self.pos)
+            val, pos = self._value(pos)
+            if consume_trailing:
+                pos = self._skip_ws(pos)
+                if pos != self.end:
+                    self._fail_after_ws(pos)
+        except _ParseError as e:
+            self.errpos = max(self.errpos, e.errpos)
+            return None, self._error(self.pos), self.errpos
+        self.val = val
+        self.pos = pos
+        return val, None, pos
+
+    def select(self, paths, global_vars=None):
+        """Like `parse()`, but only builds the values at the given paths.
+
+        Each path is a tuple of object keys (strings) and array indexes
+        (ints); the empty tuple selects the whole document. Returns a
+        (found, err, pos) tuple, where `found` maps each path that is in
+        the document to its value.
+
+        Values that aren't on any of the paths are skipped without being
+        built, and without being fully checked: all that is checked is
+        that their strings and comments are terminated and that their
+        brackets are balanced.
+        """
+        global_vars = global_vars or {}
+        self._strict = global_vars.get('_strict', True)
+        consume_trailing = global_vars.get('_consume_trailing', True)
+        found = {}
+        try:
+            pos = self._skip_ws(self.pos)
+            pos = self._select(pos, 0, list(paths), found)
+            if consume_trailing:
+                pos = self._skip_ws(pos)
+                if pos != self.end:
+                    self._fail_after_ws(pos)
+        except _ParseError as e:
+            self.errpos = max(self.errpos, e.errpos)
+            return None, self._error(self.pos), self.errpos
+        self.pos = pos
+        return found, None, pos
+
+    def parse_lazy(self, make_proxy, global_vars=None):
+        """Like `parse()`, but if the value is an array or an object,
+        returns `make_proxy(pos)` instead of building it, where `pos` is
+        the position of the opening bracket.
+
+        Only as much of the array or object is checked as `select()`
+        checks of the values it skips; `members()` checks the rest.
+        """
+        global_vars = global_vars or {}
+        self._strict = global_vars.get('_strict', True)
+        consume_trailing = global_vars.get('_consume_trailing', True)
+        try:
+            pos = self._skip_ws(self.pos)
+            if pos < self.end and self.msg[pos] in _CLOSERS:
+                val = make_proxy(pos)
+                pos = self._skip_value(pos)
+            else:
+                val, pos = self._value(pos)
+            if consume_trailing:
+                pos = self._skip_ws(pos)
+                if pos != self.end:
+                    self._fail_after_ws(pos)
+        except _ParseError as e:
+            self.errpos = max(self.errpos, e.errpos)
+            return None, self._error(self.pos), self.errpos
+        self.pos = pos
+        return val, None, pos
+
+    def members(self, pos, make_proxy):
+        """Returns the members of the array or object at `pos`.
+
+        For an array, this is a list of its elements; for an object, it
+        is the result of calling `dictify` on its (key, value) pairs. As
+        in `parse_lazy()`, arrays and objects are replaced by proxies.
+
+        Raises JSON5DecodeError for syntax errors.
+        """
+        try:
+            return self._members(pos, make_proxy)
+        except _ParseError as e:
+            self.errpos = e.errpos
+            raise self._error(pos) from None
+
+    def _members(self, pos, make_proxy):
+        msg = self.msg
+        end = self.end
+        closer = _CLOSERS[msg[pos]]
+        items = []
+        pos = self._skip_ws(pos + 1)
+        while pos == end or msg[pos] != closer:
+            if closer == '}':
+                key, pos = self._key(pos)
+                if self._intern_keys:
+                    key = self._intern(key)
+                pos = self._skip_ws(pos)
+                if pos == end or msg[pos] != ':':
+                    self._fail_after_ws(pos)
+                pos = self._skip_ws(pos + 1)
+            if pos < end and msg[pos] in _CLOSERS:
+                val = make_proxy(pos)
+                pos = self._skip_value(pos)
+            else:
+                val, pos = self._value(pos)
+            items.append((key, val) if closer == '}' else val)
+            pos = self._skip_ws(pos)
+            if pos < end:
+                c = msg[pos]
+                if c == ',':
+                    pos = self._skip_ws(pos + 1)
+                    continue
+                if c == closer:
+                    break
+            self._fail_after_ws(pos)
+        if closer == '}':
+            return self._dictify(items)
+        return items
+
+    def skip_ws(self, pos):
+        """Returns the position of the first character at or after `pos`
+        that isn't whitespace or part of a comment, or None if there is an
+        unterminated comment."""
+        try:
+            return self._skip_ws(pos)
+        except _ParseError:
+            return None
+
+    def at_end(self, pos):
+        """Returns whether only whitespace and comments follow `pos`."""
+        return self.skip_ws(pos) == self.end
+
+    def events(self, *, strict=True, read=None, chunk_size=65536):
+        """Yields an (event, value, position) tuple for each token in the
+        document, without building any containers.
+
+        The events are 'start_map', 'map_key', 'end_map', 'start_array',
+        'end_array', 'string', 'number', 'boolean', and 'null'; `value` is
+        the key or scalar value for 'map_key' and the scalar events, and
+        None otherwise, and `position` is the offset of the token in the
+        document.
+
+        If `read` is given, `msg` only needs to hold the start of the
+        document. `read(size)` is called to get more of it whenever a token
+        might continue past the end of what has been read so far, and
+        should return '' at the end of the document. Text that has been
+        consumed is discarded, so only the current token needs to be held
+        in memory.
+
+        Raises JSON5DecodeError for syntax errors, with the same message
+        that `parse()` would return.
+        """
+        self._strict = strict
+        self._read = read
+        self._chunk_size = chunk_size
+        try:
+            yield from self._events()
+        except _ParseError as e:
+            self.errpos = e.errpos
+            raise JSON5DecodeError(
+                self.msg,
+                self.errpos,
+                fname=self.fname,
+                origin=(self._lineno, self._colno),
+                expected=self._expected,
+            ) from None
+
+    def _events(self):
+        # Each entry in `stack` is the character that closes an open
+        # container. `can_close` says whether that character may come
+        # next instead of a key or value (i.e., after a '{', '[' or ',').
+        stack = []
+        state = 'value'
+        can_close = False
+        try:
+            pos = self._ws(self.pos)
+            while True:
+                if state == 'value':
+                    if pos == self.end:
+                        self._fail(pos)
+                    c = self.msg[pos]
+                    if c in ('{', '['):
+                        if c == '{':
+                            yield 'start_map', None, self._offset + pos
+                            closer = '}'
+                        else:
+                            yield 'start_array', None, self._offset + pos
+                            closer = ']'
+                        stack.append(closer)
+                        state = 'key' if closer == '}' else 'value'
+                        can_close = True
+                        pos = self._ws(pos + 1)
+                        if pos < self.end and self.msg[pos] == closer:
+                            stack.pop()
+                            yield _END_EVENTS[closer], None, self._offset + pos
+                            pos += 1
+                            state = 'after_value'
+                        continue
+                    # `_token()` may move things around in `msg`.
+                    start = self._offset + pos
+                    event, val, end = self._token(self._scalar, pos)
+                    yield event, val, start
+                    pos = end
+                    state = 'after_value'
+                elif state == 'key':
+                    start = self._offset + pos
+                    _, key, end = self._token(self._map_key, pos)
+                    yield 'map_key', key, start
+                    state = ':'
+                    pos = self._ws(end)
+                    if pos == self.end or self.msg[pos] != ':':
+                        self._fail_after_ws(pos)
+                    state = 'value'
+                    can_close = False
+                    pos = self._ws(pos + 1)
+                else:
+                    pos = self._ws(pos)
+                    if not stack:
+                        if pos != self.end:
+                            self._fail_after_ws(pos)
+                        return
+                    closer = stack[-1]
+                    c = self.msg[pos] if pos < self.end else ''
+                    if c == ',':
+                        state = 'key' if closer == '}' else 'value'
+                        can_close = True
+                        pos = self._ws(pos + 1)
+                        if pos < self.end and self.msg[pos] == closer:
+                            c = closer
+                            state = 'after_value'
+                        else:
+                            continue
+                    if c != closer:
+                        self._fail_after_ws(pos)
+                    stack.pop()
+                    yield _END_EVENTS[closer], None, self._offset + pos
+                    pos += 1
+        except _ParseError:
+            closer = stack[-1] if stack else None
+            if state == 'after_value':
+                expected = {',', closer} if closer else {'end of input'}
+            elif state == ':':
+                expected = {':'}
+            else:
+                expected = {state}
+                if can_close:
+                    expected.add(closer)
+            self._expected = frozenset(expected)
+            raise
+
+    def _scalar(self, pos):
+        c = self.msg[pos]
+        if c in ('"', "'"):
+            return ('string',) + self._string(pos)
+        if c in _NUMBER_START:
+            return ('number',) + self._number(pos)
+        if c == 'n':
+            return 'null', None, self._keyword('null', pos)
+        if c == 't':
+            return 'boolean', True, self._keyword('true', pos)
+        if c == 'f':
+            return 'boolean', False, self._keyword('false', pos)
+        return self._fail_after_ws(pos)
+
+    def _map_key(self, pos):
+        return ('map_key',) + self._key(pos)
+
+    def _token(self, fn, pos):
+        """Returns `fn(pos)`, reading more of the document first if the
+        token at `pos` might continue past the end of what we have."""
+        while True:
+            try:
+                result = fn(pos)
+            except _ParseError as e:
+                if self._read and e.errpos + MAX_LOOKAHEAD > self.end:
+                    pos = self._refill(pos)
+                    continue
+                raise
+            except ValueError:
+                # A number hook rejected what might be a partial number.
+                m = _NUMBER_RE.match(self.msg, pos)
+                if self._read and m and m.end() + MAX_LOOKAHEAD > self.end:
+                    pos = self._refill(pos)
+                    continue
+                raise
+            if self._read and result[-1] + MAX_LOOKAHEAD > self.end:
+                pos = self._refill(pos)
+                continue
+            return result
+
+    def _ws(self, pos):
+        """Skips whitespace and comments, reading more as needed."""
+        while True:
+            try:
+                end = self._skip_ws(pos)
+            except _ParseError:
+                if self._read:
+                    pos = self._refill(pos)
+                    continue
+                raise
+            if not self._read or end + MAX_LOOKAHEAD <= self.end:
+                return end
+            if end and end == self.end and self.msg[-1] in _EOL_CHARS:
+                # Everything we have is complete whitespace and comments,
+                # so none of it needs to be kept.
+                pos = end
+            pos = self._refill(pos)
+
+    def _refill(self, pos):
+        """Discards everything before `pos` and reads more of the document.
+
+        Returns the new position of `pos`."""
+        self._lineno, self._colno = advance(
+            self.msg, pos, self._lineno, self._colno
+        )
+        self.msg = self.msg[pos:]
+        self._offset += pos
+        self._id_probe -= pos
+        text = self._read(max(self._chunk_size, len(self.msg)))
+        if text:
+            self.msg += text
+        else:
+            self._read = None
+        self.end = len(self.msg)
+        return 0
+
+    def _error(self, start):
+        return decode_error(
+            self.msg,
+            self.errpos,
+            start,
+            self._strict,
+            fname=self.fname,
+            origin=(self._lineno, self._colno),
+        )
+
+    def _fail(self, errpos):
+        raise _ParseError(errpos)
+
+    def _fail_after_ws(self, pos):
+        """Fails at `pos`, where whitespace was just skipped."""
+        if pos < self.end:
+            if self._id_probe == pos:
+                self._fail(self._id_errpos(pos))
+            if self.msg[pos] == '/':
+                self._fail(pos + 1)
+        self._fail(pos)
+
+    def _id_errpos(self, pos):
+        """Returns where `id_start` or `id_continue` fails at `pos`."""
+        if pos == self.end:
+            return pos
+        if self.msg[pos] == '\\':
+            return max(pos + 1, self._unicode_esc_end(pos + 1))
+        return pos + 1
+
+    def _unsigned_errpos(self, pos):
+        """Returns where the `unsigned_lit` rule fails at `pos`."""
+        msg = self.msg
+        end = self.end
+        errpos = pos
+        if pos < end and msg[pos] == '0':
+            # Either '0' was followed by a digit, or a hex literal is
+            # missing its 'x' or its digits.
+            errpos = pos + 1
+            if pos + 1 < end and msg[pos + 1] in 'xX':
+                errpos = pos + 2
+        for word in ('Infinity', 'NaN'):
+            i = pos
+            while i < end and i - pos < len(word) and msg[i] == word[i - pos]:
+                i += 1
+            errpos = max(errpos, i)
+        return errpos
+
+    def _skip_ws(self, pos):
+        msg = self.msg
+        end = self.end
+        while True:
+            pos = _WS_RUN_RE.match(msg, pos).end()
+            if pos == end:
+                return pos
+            c = msg[pos]
+            if c == '/':
+                if pos + 1 == end:
+                    return pos
+                c = msg[pos + 1]
+                if c == '/':
+                    pos = _LINE_COMMENT_RE.match(msg, pos + 2).end()
+                elif c == '*':
+                    pos = msg.find('*/', pos + 2)
+                    if pos == -1:
+                        self._fail(end)
+                    pos += 2
+                else:
+                    return pos
+            elif c > '\x7f' and unicodedata.category(c) == 'Zs':
+                pos += 1
+            else:
+                return pos
+
+    def _value(self, pos):
+        if pos == self.end:
+            self._fail(pos)
+        c = self.msg[pos]
+        if c == '{':
+            return self._object(pos)
+        if c == '[':
+            return self._array(pos)
+        if c in ('"', "'"):
+            if self._intern_table is None:
+                return self._string(pos)
+            val, pos = self._string(pos)
+            if len(val) <= self._intern_strings:
+                val = self._intern(val)
+            return val, pos
+        if c in _NUMBER_START:
+            return self._number(pos)
+        if c == 'n':
+            return None, self._keyword('null', pos)
+        if c == 't':
+            return True, self._keyword('true', pos)
+        if c == 'f':
+            return False, self._keyword('false', pos)
+        return self._fail_after_ws(pos)
+
+    def _intern(self, s):
+        table = self._intern_table
+        interned = table.get(s)
+        if interned is None:
+            if len(table) >= MAX_INTERNED:
+                return s
+            table[s] = interned = s
+        return interned
+
+    def _keyword(self, word, pos):
+        msg = self.msg
+        if msg.startswith(word, pos):
+            return pos + len(word)
+        i = pos
+        while i < self.end and msg[i] == word[i - pos]:
+            i += 1
+        return self._fail(i)
+
+    def _object(self, pos):
+        msg = self.msg
+        end = self.end
+        pairs = []
+        pos = self._skip_ws(pos + 1)
+        if pos < end and msg[pos] == '}':
+            return self._dictify(pairs), pos + 1
+        while True:
+            key, pos = self._key(pos)
+            if self._intern_keys:
+                key = self._intern(key)
+            pos = self._skip_ws(pos)
+            if pos == end or msg[pos] != ':':
+                self._fail_after_ws(pos)
+            val, pos = self._value(self._skip_ws(pos + 1))
+            pairs.append((key, val))
+            pos = self._skip_ws(pos)
+            if pos < end:
+                c = msg[pos]
+                if c == ',':
+                    pos = self._skip_ws(pos + 1)
+                    if pos < end and msg[pos] == '}':
+                        return self._dictify(pairs), pos + 1
+                    continue
+                if c == '}':
+                    return self._dictify(pairs), pos + 1
+            self._fail_after_ws(pos)
+
+    def _key(self, pos):
+        if pos < self.end:
+            if self.msg[pos] in ('"', "'"):
+                return self._string(pos)
+            if self._id_char(pos, _ASCII_ID_START, _ID_START_CATEGORIES):
+                return self._ident(pos)
+        return self._fail(self._id_errpos(pos))
+
+    def _array(self, pos):
+        msg = self.msg
+        end = self.end
+        values = []
+        pos = self._skip_ws(pos + 1)
+        while pos == end or msg[pos] != ']':
+            val, pos = self._value(pos)
+            values.append(val)
+            pos = self._skip_ws(pos)
+            if pos < end:
+                c = msg[pos]
+                if c == ',':
+                    pos = self._skip_ws(pos + 1)
+                    continue
+                if c == ']':
+                    break
+            self._fail_after_ws(pos)
+        if self._listify is not None:
+            values = self._listify(values)
+        return values, pos + 1
+
+    def _select(self, pos, depth, paths, found):
+        """Scans the value at `pos`, which is at the first `depth` steps
+        of each of `paths`, and adds any selected values to `found`."""
+        if any(len(path) == depth for path in paths):
+            val, pos = self._value(pos)
+            for path in paths:
+                _lookup(val, path, depth, found)
+            return pos
+        if pos < self.end:
+            c = self.msg[pos]
+            if c == '{':
+                return self._select_object(pos, depth, paths, found)
+            if c == '[':
+                return self._select_array(pos, depth, paths, found)
+        return self._skip_value(pos)
+
+    def _select_object(self, pos, depth, paths, found):
+        msg = self.msg
+        end = self.end
+        pos = self._skip_ws(pos + 1)
+        if pos < end and msg[pos] == '}':
+            return pos + 1
+        while True:
+            key, pos = self._key(pos)
+            if self._intern_keys:
+                key = self._intern(key)
+            pos = self._skip_ws(pos)
+            if pos == end or msg[pos] != ':':
+                self._fail_after_ws(pos)
+            pos = self._skip_ws(pos + 1)
+            matches = [path for path in paths if path[depth] == key]
+            if matches:
+                # A later duplicate key replaces anything found under an
+                # earlier one.
+                for path in matches:
+                    found.pop(path, None)
+                pos = self._select(pos, depth + 1, matches, found)
+            else:
+                pos = self._skip_value(pos)
+            pos = self._skip_ws(pos)
+            if pos < end:
+                c = msg[pos]
+                if c == ',':
+                    pos = self._skip_ws(pos + 1)
+                    if pos < end and msg[pos] == '}':
+                        return pos + 1
+                    continue
+                if c == '}':
+                    return pos + 1
+            self._fail_after_ws(pos)
+
+    def _select_array(self, pos, depth, paths, found):
+        msg = self.msg
+        end = self.end
+        index = 0
+        pos = self._skip_ws(pos + 1)
+        if pos < end and msg[pos] == ']':
+            return pos + 1
+        while True:
+            matches = [
+                path
+                for path in paths
+                if isinstance(path[depth], int) and path[depth] == index
+            ]
+            if matches:
+                pos = self._select(pos, depth + 1, matches, found)
+            else:
+                pos = self._skip_value(pos)
+            index += 1
+            pos = self._skip_ws(pos)
+            if pos < end:
+                c = msg[pos]
+                if c == ',':
+                    pos = self._skip_ws(pos + 1)
+                    if pos < end and msg[pos] == ']':
+                        return pos + 1
+                    continue
+                if c == ']':
+                    return pos + 1
+            self._fail_after_ws(pos)
+
+    def _skip_value(self, pos):
+        msg = self.msg
+        end = self.end
+        if pos == end:
+            self._fail(pos)
+        c = msg[pos]
+        if c in ('"', "'"):
+            return self._skip_string(pos)
+        if c not in _CLOSERS:
+            new_pos = _SKIP_SCALAR_RE.match(msg, pos).end()
+            if new_pos == pos:
+                self._fail_after_ws(pos)
+            return new_pos
+        if self._skip_container:
+            new_pos = self._skip_container(msg, pos)
+            if new_pos is not None and new_pos >= 0:
+                return new_pos
+        closers = []
+        while True:
+            if c in _CLOSERS:
+                closers.append(_CLOSERS[c])
+                pos += 1
+            elif c in (']', '}'):
+                if c != closers.pop():
+                    self._fail(pos)
+                pos += 1
+                if not closers:
+                    return pos
+            elif c == '/':
+                new_pos = self._skip_ws(pos)
+                pos = new_pos if new_pos > pos else pos + 1
+            else:
+                pos = self._skip_string(pos)
+            pos = _SKIP_RUN_RE.match(msg, pos).end()
+            if pos == end:
+                self._fail(pos)
+            c = msg[pos]
+
+    def _skip_string(self, pos):
+        m = _SKIP_STRING_RES[self.msg[pos]].match(self.msg, pos)
+        if m is None:
+            self._fail(self.end)
+        return m.end()
+
+    def _string(self, pos):
+        msg = self.msg
+        end = self.end
+        quote = msg[pos]
+        run_re = _STRING_RUN_RES[quote]
+        pos += 1
+        run_end = run_re.match(msg, pos).end()
+        if run_end < end and msg[run_end] == quote:
+            return msg[pos:run_end], run_end + 1
+
+        strict = self._strict
+        chars = []
+        while True:
+            chars.append(msg[pos:run_end])
+            pos = run_end
+            if pos == end:
+                self._fail(end)
+            c = msg[pos]
+            if c == quote:
+                return ''.join(chars), pos + 1
+            if c == '\\':
+                c, pos = self._escape(pos + 1)
+                chars.append(c)
+            elif strict or c in '\u2028\u2029':
+                self._fail(pos)
+            else:
+                chars.append(c)
+                pos += 1
+            run_end = run_re.match(msg, pos).end()
+
+    def _escape(self, pos):
+        msg = self.msg
+        end = self.end
+        if pos == end:
+            self._fail(pos)
+        c = msg[pos]
+        if c in _ESCAPES:
+            return _ESCAPES[c], pos + 1
+        if c == 'x':
+            return self._hex_esc(pos, 2)
+        if c == 'u':
+            return self._hex_esc(pos, 4)
+        if c == '0':
+            if pos + 1 < end and msg[pos + 1] in _DIGITS:
+                self._fail(pos + 1)
+            return '\x00', pos + 1
+        if c in _DIGITS:
+            self._fail(pos)
+        if c in _EOL_CHARS:
+            if msg.startswith('\r\n', pos):
+                return '', pos + 2
+            return '', pos + 1
+        return c, pos + 1
+
+    def _hex_esc(self, pos, ndigits):
+        msg = self.msg
+        start = pos + 1
+        for i in range(start, start + ndigits):
+            if i == self.end or msg[i] not in _HEX_DIGITS:
+                self._fail(i)
+        return chr(int(msg[start : start + ndigits], base=16)), start + ndigits
+
+    def _unicode_esc_end(self, pos):
+        """Returns where the `unicode_esc` rule stops matching at `pos`."""
+        msg = self.msg
+        end = self.end
+        if pos == end or msg[pos] != 'u':
+            return pos
+        i = pos + 1
+        while i < end and i < pos + 5 and msg[i] in _HEX_DIGITS:
+            i += 1
+        return i
+
+    def _id_char(self, pos, ascii_chars, categories):
+        """Returns the length of the identifier character at `pos`, or 0."""
+        c = self.msg[pos]
+        if c in ascii_chars:
+            return 1
+        if c == '\\':
+            return 6 if self._unicode_esc_end(pos + 1) == pos + 6 else 0
+        if c < '\x80':
+            return 0
+        if c in ('\u200c', '\u200d'):
+            return int(categories is _ID_CONTINUE_CATEGORIES)
+        return int(unicodedata.category(c) in categories)
+
+    def _ident(self, pos):
+        msg = self.msg
+        end = self.end
+        chars = []
+        n = self._id_char(pos, _ASCII_ID_START, _ID_START_CATEGORIES)
+        while n:
+            if n == 1:
+                run_end = _ID_CONTINUE_RUN_RE.match(msg, pos + 1).end()
+                chars.append(msg[pos:run_end])
+                pos = run_end
+            else:
+                chars.append(chr(int(msg[pos + 2 : pos + 6], base=16)))
+                pos += n
+            if pos == end:
+                break
+            n = self._id_char(pos, _ASCII_ID_CONTINUE, _ID_CONTINUE_CATEGORIES)
+        self._id_probe = pos
+        return ''.join(chars), pos
+
+    def _number(self, pos):
+        msg = self.msg
+        m = _NUMBER_RE.match(msg, pos)
+        start = pos + 1 if msg[pos] in '+-' else pos
+        if m is None:
+            self._fail(self._unsigned_errpos(start))
+        sign, hex_lit, mantissa, exponent, name = m.groups()
+        pos = m.end()
+        if mantissa is not None:
+            if pos < self.end and self._id_char(
+                pos, _ASCII_ID_START, _ID_START_CATEGORIES
+            ):
+                self._fail(max(pos, self._unsigned_errpos(start)))
+            self._id_probe = pos
+            if exponent is not None:
+                s = mantissa + 'e' + exponent[1:]
+            elif '.' in mantissa:
+                s = mantissa
+            else:
+                if sign == '-':
+                    mantissa = '-' + mantissa
+                return self._parse_int(mantissa), pos
+            if sign == '-':
+                s = '-' + s
+            return self._parse_float(s), pos
+        if hex_lit is not None:
+            s = '0x' + hex_lit[2:]
+            if sign == '-':
+                s = '-' + s
+            return self._parse_int(s, base=16), pos
+        if sign == '-':
+            name = '-' + name
+        return self._parse_constant(name), pos
@@ -50,7 +50,9 @@ def main(argv=None, host=None):
     elif args.file == '-':
         inp = host.stdin.read()
     else:
-        inp = host.read_text_file(args.file)
+        # The file is passed to `loads()` as bytes, so that it can be
+        # decoded as it is parsed instead of all at once up front.
+        inp = host.read_binary_file(args.file)
 
     if args.indent == 'None':
         args.indent = None
@@ -0,0 +1,562 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A hand-written version of the parser generated from `json5.g`.
+
+`Parser`, in `parser.py`, is generated by glop. Each of its rules is
+built out of lists of lambdas that are handed to helpers like `_seq()`
+and `_choose()`, and each rule that binds a variable (as in `value:v`)
+pushes a new dict onto a stack of scopes to hold it. For a large
+document, that adds up to millions of short-lived objects.
+
+`TunedParser` has one method for each rule in the grammar, written as
+straight-line code that keeps its bindings and its position in local
+variables, and reads the `_strict` and `_consume_trailing` global
+variables from attributes set by `parse()`. Each method starts at
+`self.pos` and, like the generated ones, sets `self.failed`, and on
+success `self.val` and `self.pos`.
+
+It matches the same documents and produces the same values as `Parser`,
+and reports errors at the same positions, which isn't always where the
+error actually is: the generated parser reports the furthest position
+at which any rule failed, including those inside negative lookaheads
+(like the `~id_start` after a number) that failed one character past
+where they started. Where a rule fails at a position that its caller is
+certain to get past anyway, that failure isn't recorded here, since it
+can't change the result. `tests/tuned_parser_test.py` checks all of
+this against `Parser` itself, so if the grammar changes, this needs to
+be changed to match.
+"""
+
+import re
+import unicodedata
+
+from json5.parser import Parser
+from json5.scanner import (
+    _ASCII_ID_CONTINUE,
+    _ASCII_ID_START,
+    _DIGITS,
+    _EOL_CHARS,
+    _ESCAPES,
+    _HEX_DIGITS,
+    _ID_CONTINUE_CATEGORIES,
+    _ID_START_CATEGORIES,
+    _NUMBER_START,
+)
+
+_NONZERO_DIGITS = frozenset('123456789')
+
+# The characters that `ws` matches on their own, other than the ones in
+# the 'Zs' category.
+_WS_CHARS = frozenset(' \t\v\f\xa0\ufeff\r\n\u2028\u2029')
+
+# The longest runs of characters in a string that `sqchar` and `dqchar`
+# match as themselves.
+_STRING_RUN_RES = {
+    "'": re.compile("[^'\\\\\n\r\u2028\u2029]+"),
+    '"': re.compile('[^"\\\\\n\r\u2028\u2029]+'),
+}
+
+
+class TunedParser(Parser):
+    def __init__(self, msg, fname, pos=0):
+        super().__init__(msg, fname, pos)
+        self._strict = None
+        self._consume_trailing = None
+        # Where the last call to `_sp_()` started and ended.
+        self._sp_start = self._sp_end = -1
+
+    def parse(self, global_vars=None):
+        global_vars = global_vars or {}
+        self._strict = global_vars.get('_strict')
+        self._consume_trailing = global_vars.get('_consume_trailing')
+        self._sp_start = self._sp_end = -1
+        return super().parse(global_vars)
+
+    def _fail_at(self, pos):
+        self.val = None
+        self.failed = True
+        self.errpos = max(self.errpos, pos)
+
+    def _literal(self, s):
+        # Matches `s` the way that `_str()` does, failing at the first
+        # character that doesn't match.
+        msg, pos = self.msg, self.pos
+        if msg.startswith(s, pos):
+            self._succeed(s, pos + len(s))
+            return
+        for ch in s:
+            if pos == self.end or msg[pos] != ch:
+                break
+            pos += 1
+        self._fail_at(pos)
+
+    def _grammar_(self):
+        # grammar = sp value:v trailing -> v
+        # trailing = ?(_consume_trailing) sp end | ~?(_consume_trailing)
+        self._sp_()
+        self._value_()
+        if self.failed:
+            return
+        v = self.val
+        if self._consume_trailing:
+            self._sp_()
+            if self.pos != self.end:
+                self._fail_at(self.pos)
+                return
+        self._succeed(v)
+
+    def _sp_(self):
+        # sp = ws*
+        #
+        # After a trailing comma, `sp` is matched again at the same place
+        # once the value or member after it fails to match, so the last
+        # match is remembered. Any failures it records (see below) have
+        # already been recorded by then.
+        start = self.pos
+        if start == self._sp_start:
+            self._succeed(None, self._sp_end)
+            return
+        msg, end, pos = self.msg, self.end, start
+        while pos < end:
+            c = msg[pos]
+            if c in _WS_CHARS:
+                pos += 1
+            elif c == '/':
+                # comment = '//' (~eol anything)*
+                #         | '/*' (~'*/' anything)* '*/'
+                if msg.startswith('//', pos):
+                    pos += 2
+                    while pos < end and msg[pos] not in _EOL_CHARS:
+                        pos += 1
+                elif msg.startswith('/*', pos):
+                    close = msg.find('*/', pos + 2)
+                    if close == -1:
+                        # The comment fails at the end of the input.
+                        self._fail_at(end)
+                        break
+                    pos = close + 2
+                else:
+                    # The comment fails at the second character.
+                    self._fail_at(pos + 1)
+                    break
+            elif c > '\x7f' and unicodedata.category(c) == 'Zs':
+                pos += 1
+            else:
+                break
+        self._sp_start, self._sp_end = start, pos
+        self._succeed(None, pos)
+
+    def _value_(self):
+        # value = string:v -> ['string', v]
+        #       | num_literal
+        #       | object:v -> ['object', v]
+        #       | array:v -> ['array', v]
+        #       | 'null' -> 'None' | 'true' -> 'True' | 'false' -> 'False'
+        #
+        # Each alternative starts with a different set of characters, so
+        # only the one that the next character can start is tried; the
+        # others would all fail at this position.
+        pos = self.pos
+        c = self.msg[pos] if pos < self.end else ''
+        if c in ('"', "'"):
+            self._string_()
+            kind = 'string'
+        elif c == '{':
+            self._object_()
+            kind = 'object'
+        elif c == '[':
+            self._array_()
+            kind = 'array'
+        elif c in _NUMBER_START:
+            self._num_literal_()
+            return
+        elif c == 'n':
+            self._literal('null')
+            if not self.failed:
+                self.val = 'None'
+            return
+        elif c == 't':
+            self._literal('true')
+            if not self.failed:
+                self.val = 'True'
+            return
+        elif c == 'f':
+            self._literal('false')
+            if not self.failed:
+                self.val = 'False'
+            return
+        else:
+            self._fail_at(pos)
+            return
+        if not self.failed:
+            self.val = [kind, self.val]
+
+    def _object_(self):
+        # object = '{' sp ( '}' -> [] | member_list:v '}' -> v )
+        msg, end, pos = self.msg, self.end, self.pos
+        if pos == end or msg[pos] != '{':
+            self._fail_at(pos)
+            return
+        self.pos = pos + 1
+        self._sp_()
+        pos = self.pos
+        if pos < end and msg[pos] == '}':
+            self._succeed([], pos + 1)
+            return
+        self._member_list_()
+        if self.failed:
+            return
+        pos = self.pos
+        if pos < end and msg[pos] == '}':
+            self._succeed(self.val, pos + 1)
+        else:
+            self._fail_at(pos)
+
+    def _array_(self):
+        # array = '[' sp ( ']' -> [] | element_list:v ']' -> v )
+        msg, end, pos = self.msg, self.end, self.pos
+        if pos == end or msg[pos] != '[':
+            self._fail_at(pos)
+            return
+        self.pos = pos + 1
+        self._sp_()
+        pos = self.pos
+        if pos < end and msg[pos] == ']':
+            self._succeed([], pos + 1)
+            return
+        self._element_list_()
+        if self.failed:
+            return
+        pos = self.pos
+        if pos < end and msg[pos] == ']':
+            self._succeed(self.val, pos + 1)
+        else:
+            self._fail_at(pos)
+
+    def _string_(self):
+        # string = squote sqchar*:cs squote -> join('', cs)
+        #        | dquote dqchar*:cs dquote -> join('', cs)
+        # sqchar = bslash ( esc_char | eol -> '' )
+        #        | ~bslash ~squote ~eol anything:c -> c
+        #        | ~?(_strict) '\x00'..'\x1f'
+        # (and dqchar is the same with `dquote` in place of `squote`).
+        msg, end, pos = self.msg, self.end, self.pos
+        quote = msg[pos] if pos < end else ''
+        if quote not in ("'", '"'):
+            self._fail_at(pos)
+            return
+        run_re = _STRING_RUN_RES[quote]
+        chars = []
+        pos += 1
+        while pos < end:
+            c = msg[pos]
+            if c == quote:
+                self._succeed(''.join(chars), pos + 1)
+                return
+            if c == '\\':
+                self.pos = pos + 1
+                self._esc_char_()
+                if not self.failed:
+                    chars.append(self.val)
+                    pos = self.pos
+                    continue
+                if msg[pos + 1 : pos + 2] in _EOL_CHARS:
+                    if msg.startswith('\r\n', pos + 1):
+                        pos += 3
+                    else:
+                        pos += 2
+                    continue
+                # `esc_char` has already failed further along than the
+                # closing quote that is expected here.
+                return
+            if c in _EOL_CHARS:
+                if self._strict or c > '\x1f':
+                    break
+                chars.append(c)
+                pos += 1
+                continue
+            m = run_re.match(msg, pos)
+            chars.append(m.group())
+            pos = m.end()
+        self._fail_at(pos)
+
+    def _esc_char_(self):
+        # esc_char = 'b' -> '\u0008' | ... | bslash -> '\'
+        #          | ~('x'|'u'|digit|eol) anything:c -> c
+        #          | '0' ~digit -> '\u0000'
+        #          | hex_esc:c -> c
+        #          | unicode_esc:c -> c
+        msg, end, pos = self.msg, self.end, self.pos
+        if pos == end:
+            self._fail_at(pos)
+            return
+        c = msg[pos]
+        if c in _ESCAPES:
+            self._succeed(_ESCAPES[c], pos + 1)
+        elif c == 'x':
+            self._hex_esc_()
+        elif c == 'u':
+            self._unicode_esc_()
+        elif c == '0':
+            if pos + 1 < end and msg[pos + 1] in _DIGITS:
+                self._fail_at(pos + 1)
+            else:
+                self._succeed('\x00', pos + 1)
+        elif c in _DIGITS or c in _EOL_CHARS:
+            self._fail_at(pos)
+        else:
+            self._succeed(c, pos + 1)
+
+    def _hex_esc_(self):
+        # hex_esc = 'x' hex:h1 hex:h2 -> xtou(h1 + h2)
+        self._xtou_esc('x', 2)
+
+    def _unicode_esc_(self):
+        # unicode_esc = 'u' hex:a hex:b hex:c hex:d -> xtou(a + b + c + d)
+        self._xtou_esc('u', 4)
+
+    def _xtou_esc(self, prefix, n):
+        msg, end, pos = self.msg, self.end, self.pos
+        if pos == end or msg[pos] != prefix:
+            self._fail_at(pos)
+            return
+        for i in range(pos + 1, pos + 1 + n):
+            if i == end or msg[i] not in _HEX_DIGITS:
+                self._fail_at(i)
+                return
+        self._succeed(self._xtou(msg[pos + 1 : pos + 1 + n]), pos + 1 + n)
+
+    def _element_list_(self):
+        # element_list = value:v sp (',' sp value:e sp -> e)*:vs (',' sp)?
+        #                -> [v] + vs
+        self._value_()
+        if self.failed:
+            return
+        values = [self.val]
+        self._sp_()
+        msg, end, pos = self.msg, self.end, self.pos
+        while pos < end and msg[pos] == ',':
+            self.pos = pos + 1
+            self._sp_()
+            self._value_()
+            if self.failed:
+                break
+            values.append(self.val)
+            self._sp_()
+            pos = self.pos
+        if pos < end and msg[pos] == ',':
+            self.pos = pos + 1
+            self._sp_()
+            pos = self.pos
+        self._succeed(values, pos)
+
+    def _member_list_(self):
+        # member_list = member:m sp (',' sp member:e sp -> e)*:ms (',' sp)?
+        #               -> [m] + ms
+        self._member_()
+        if self.failed:
+            return
+        members = [self.val]
+        self._sp_()
+        msg, end, pos = self.msg, self.end, self.pos
+        while pos < end and msg[pos] == ',':
+            self.pos = pos + 1
+            self._sp_()
+            self._member_()
+            if self.failed:
+                break
+            members.append(self.val)
+            self._sp_()
+            pos = self.pos
+        if pos < end and msg[pos] == ',':
+            self.pos = pos + 1
+            self._sp_()
+            pos = self.pos
+        self._succeed(members, pos)
+
+    def _member_(self):
+        # member = (string | ident):k sp ':' sp value:v -> [k, v]
+        pos = self.pos
+        self._string_()
+        if self.failed:
+            self.pos = pos
+            self._ident_()
+            if self.failed:
+                return
+        k = self.val
+        self._sp_()
+        pos = self.pos
+        if pos == self.end or self.msg[pos] != ':':
+            self._fail_at(pos)
+            return
+        self.pos = pos + 1
+        self._sp_()
+        self._value_()
+        if not self.failed:
+            self.val = [k, self.val]
+
+    def _ident_(self):
+        # ident = id_start:hd id_continue*:tl -> join('', [hd] + tl)
+        self._id_start_()
+        if self.failed:
+            return
+        chars = [self.val]
+        pos = self.pos
+        while True:
+            self._id_continue_()
+            if self.failed:
+                break
+            chars.append(self.val)
+            pos = self.pos
+        self._succeed(''.join(chars), pos)
+
+    def _id_start_(self):
+        # id_start = ascii_id_start | other_id_start | bslash unicode_esc
+        #
+        # other_id_start (like the similar alternatives of id_continue)
+        # consumes the next character before checking its category, so
+        # when nothing matches, this fails one character past `pos`.
+        msg, pos = self.msg, self.pos
+        if pos == self.end:
+            self._fail_at(pos)
+            return
+        c = msg[pos]
+        if c in _ASCII_ID_START:
+            self._succeed(c, pos + 1)
+        elif c == '\\':
+            self.pos = pos + 1
+            self._unicode_esc_()
+        elif unicodedata.category(c) in _ID_START_CATEGORIES:
+            self._succeed(c, pos + 1)
+        else:
+            self._fail_at(pos + 1)
+
+    def _id_continue_(self):
+        # id_continue = ascii_id_start | digit | other_id_start
+        #             | anything:x ?(is_unicat(x, 'Mn')) -> x | ...
+        #             | bslash unicode_esc | '\u200c' | '\u200d'
+        msg, pos = self.msg, self.pos
+        if pos == self.end:
+            self._fail_at(pos)
+            return
+        c = msg[pos]
+        if c in _ASCII_ID_CONTINUE:
+            self._succeed(c, pos + 1)
+        elif c == '\\':
+            self.pos = pos + 1
+            self._unicode_esc_()
+        elif (
+            c == '\u200c'
+            or c == '\u200d'
+            or unicodedata.category(c) in _ID_CONTINUE_CATEGORIES
+        ):
+            self._succeed(c, pos + 1)
+        else:
+            self._fail_at(pos + 1)
+
+    def _num_literal_(self):
+        # num_literal = '-' unsigned_lit:n -> [n[0], '-' + n[1]]
+        #             | '+' unsigned_lit:n -> n
+        #             | unsigned_lit:n -> n
+        pos = self.pos
+        sign = self.msg[pos] if pos < self.end else ''
+        if sign in ('-', '+'):
+            self.pos = pos + 1
+        self._unsigned_lit_()
+        if sign == '-' and not self.failed:
+            kind, text = self.val
+            self.val = [kind, '-' + text]
+
+    def _unsigned_lit_(self):
+        # unsigned_lit = hex_literal:h -> ['hex', h]
+        #              | dec_literal:d ~id_start -> d
+        #              | 'Infinity' -> ['const', 'Infinity']
+        #              | 'NaN' -> ['const', 'NaN']
+        msg, end, pos = self.msg, self.end, self.pos
+        c = msg[pos] if pos < end else ''
+        if c == '0' and msg[pos + 1 : pos + 2] in ('x', 'X'):
+            # hex_literal = ('0x' | '0X') hex+:hs -> '0x' + join('', hs)
+            start = pos = pos + 2
+            while pos < end and msg[pos] in _HEX_DIGITS:
+                pos += 1
+            if pos == start:
+                self._fail_at(pos)
+            else:
+                self._succeed(['hex', '0x' + msg[start:pos]], pos)
+        elif c in _DIGITS or c == '.':
+            self._dec_literal_()
+            if self.failed:
+                return
+            d = self.val
+            pos = self.pos
+            errpos = self.errpos
+            self._id_start_()
+            if self.failed:
+                # As with `_not()`, the failure is still recorded.
+                self._succeed(d, pos)
+            else:
+                self.errpos = errpos
+                self._fail_at(pos)
+        elif c in ('I', 'N'):
+            self._literal('Infinity' if c == 'I' else 'NaN')
+            if not self.failed:
+                self.val = ['const', self.val]
+        else:
+            self._fail_at(pos)
+
+    def _dec_literal_(self):
+        # dec_literal = dec_int_lit:d ( frac:f exp?:e
+        #                                 -> ['float', d + f + join('', e)]
+        #                             | exp:e -> ['float', d + e]
+        #                             | -> ['int', d] )
+        #             | frac:f exp?:e -> ['float', f + join('', e)]
+        # dec_int_lit = '0' ~digit -> '0'
+        #             | nonzerodigit:d digit*:ds -> d + join('', ds)
+        # frac = '.' digit*:ds -> '.' + join('', ds)
+        # exp = ('e' | 'E') ('+' | '-')?:s digit*:ds
+        #       -> 'e' + join('', s) + join('', ds)
+        msg, end = self.msg, self.end
+        start = pos = self.pos
+        c = msg[pos] if pos < end else ''
+        if c == '0':
+            pos += 1
+            if pos < end and msg[pos] in _DIGITS:
+                self._fail_at(pos)
+                return
+        elif c in _NONZERO_DIGITS:
+            pos += 1
+            while pos < end and msg[pos] in _DIGITS:
+                pos += 1
+        elif c != '.':
+            self._fail_at(pos)
+            return
+        kind = 'int'
+        if pos < end and msg[pos] == '.':
+            kind = 'float'
+            pos += 1
+            while pos < end and msg[pos] in _DIGITS:
+                pos += 1
+        if pos < end and msg[pos] in ('e', 'E'):
+            kind = 'float'
+            exp = pos
+            pos += 1
+            if pos < end and msg[pos] in ('+', '-'):
+                pos += 1
+            while pos < end and msg[pos] in _DIGITS:
+                pos += 1
+            text = msg[start:exp] + 'e' + msg[exp + 1 : pos]
+        else:
+            text = msg[start:pos]
+        self._succeed([kind, text], pos)
@@ -0,0 +1,30 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# All of the package metadata is in pyproject.toml; this file only exists
+# to declare the optional C extension, which setuptools can't do from
+# pyproject.toml. If the extension fails to build, json5 falls back to
+# the pure-Python decoder.
+
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension(
+            'json5._speedups',
+            sources=['json5/_speedups.c'],
+            optional=True,
+        ),
+    ],
+)
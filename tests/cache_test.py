@@ -0,0 +1,112 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import json5
+
+
+class CacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, contents, mtime_ns=None):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'w', encoding='utf-8') as fp:
+            fp.write(contents)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_hits_and_misses(self):
+        cache = json5.Cache()
+        path = self.write('a.json5', '{a: [1]}', mtime_ns=10**18)
+        val = cache.load(path)
+        self.assertEqual(val, {'a': [1]})
+        self.assertIs(cache.load(path), val)
+
+        # Different options are cached separately.
+        self.assertEqual(cache.load(path, parse_int=str), {'a': ['1']})
+        self.assertEqual(len(cache), 2)
+
+        # A copy is made if asked for.
+        copied = cache.load(path, copy=True)
+        self.assertEqual(copied, val)
+        self.assertIsNot(copied['a'], val['a'])
+
+        # Changing the file invalidates the entry.
+        self.write('a.json5', '{a: [2]}', mtime_ns=2 * 10**18)
+        self.assertEqual(cache.load(path), {'a': [2]})
+        self.assertEqual(len(cache), 2)
+
+    def test_digest(self):
+        cache = json5.Cache(digest=True)
+        path = self.write('a.json5', '[1]', mtime_ns=10**18)
+        val = cache.load(path)
+        self.assertIs(cache.load(path), val)
+
+        # The file changed, but its size and mtime didn't.
+        self.write('a.json5', '[2]', mtime_ns=10**18)
+        self.assertEqual(cache.load(path), [2])
+
+    def test_limits(self):
+        cache = json5.Cache(max_entries=2, max_bytes=10)
+        a = self.write('a.json5', '[1]')
+        b = self.write('b.json5', '[2]')
+        c = self.write('c.json5', '[3]')
+        big = self.write('big.json5', '[1, 2, 3, 4]')
+
+        val = cache.load(a)
+        cache.load(b)
+        cache.load(a)
+        cache.load(c)  # Evicts b, the least recently used.
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.nbytes, 6)
+        self.assertIs(cache.load(a), val)
+
+        self.assertEqual(cache.load(big), [1, 2, 3, 4])
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_errors(self):
+        cache = json5.Cache()
+        path = self.write('a.json5', '[1')
+        self.assertRaises(ValueError, cache.load, path)
+        self.assertEqual(len(cache), 0)
+        self.assertRaises(FileNotFoundError, cache.load, path + '.missing')
+
+    def test_load_cached(self):
+        path = self.write('a.json5', '{a: 1}')
+        val = json5.load_cached(path)
+        self.assertEqual(val, {'a': 1})
+        self.assertIs(json5.load_cached(path), val)
+
+    def test_select(self):
+        path = self.write('a.json5', '{a: 1, b: 2}')
+        cache = json5.Cache()
+        val = cache.load(path, select=['a'])
+        self.assertEqual(val, {'a': 1})
+        self.assertIs(cache.load(path, select=['a']), val)
+        self.assertIs(cache.load(path, select=('a',)), val)
+        self.assertEqual(cache.load(path, select='a'), 1)
+        self.assertEqual(len(cache), 2)
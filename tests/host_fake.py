@@ -97,6 +97,9 @@ class FakeHost:
         file.write(msg + end)
         file.flush()
 
+    def read_binary_file(self, *comps):
+        return self._read(comps).encode('utf8')
+
     def read_text_file(self, *comps):
         return self._read(comps)
 
@@ -31,6 +31,8 @@ class HostTest(unittest.TestCase):
             h.write_text_file('foo', 'bar')
             contents = h.read_text_file('foo')
             self.assertEqual(contents, 'bar')
+            contents = h.read_binary_file('foo')
+            self.assertEqual(contents, b'bar')
             h.chdir('..')
             h.rmtree(d)
         finally:
@@ -0,0 +1,116 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from collections.abc import Mapping, Sequence
+
+import json5
+from json5.lazy import LazyArray, LazyObject
+
+
+class LazyTest(unittest.TestCase):
+    maxDiff = None
+
+    def test_scalars(self):
+        self.assertEqual(json5.loads('1', lazy=True), 1)
+        self.assertEqual(json5.loads('"a"', lazy=True), 'a')
+        self.assertIsNone(json5.loads('null', lazy=True))
+
+    def test_containers(self):
+        doc = """{
+            a: [1, 'two', {b: 3}],
+            c: {d: {}, e: []},  // a comment with a } in it
+        }"""
+        val = json5.loads(doc, lazy=True)
+        self.assertIsInstance(val, LazyObject)
+        self.assertIsInstance(val, Mapping)
+        self.assertIsInstance(val['a'], LazyArray)
+        self.assertIsInstance(val['a'], Sequence)
+        self.assertEqual(len(val), 2)
+        self.assertEqual(list(val), ['a', 'c'])
+        self.assertIn('c', val)
+        self.assertNotIn('x', val)
+        self.assertEqual(val['a'][1], 'two')
+        self.assertEqual(val['a'][-1]['b'], 3)
+        self.assertEqual(val['a'][:2], [1, 'two'])
+        self.assertEqual(val, json5.loads(doc))
+        self.assertEqual(json5.loads(doc), val)
+        self.assertEqual(repr(val['a']), "[1, 'two', {'b': 3}]")
+        self.assertRaises(KeyError, lambda: val['x'])
+        self.assertRaises(IndexError, lambda: val['a'][3])
+        self.assertRaises(TypeError, hash, val['a'])
+
+    def test_members_are_cached(self):
+        val = json5.loads('{a: {b: 1}}', lazy=True)
+        self.assertIs(val['a'], val['a'])
+
+    def test_hooks(self):
+        val = json5.loads('[1, 1.5, NaN]', lazy=True, parse_float=str)
+        self.assertEqual(val[1], '1.5')
+        self.assertRaises(
+            ValueError,
+            json5.loads,
+            '{}',
+            lazy=True,
+            object_hook=dict,
+        )
+        self.assertRaises(
+            ValueError,
+            json5.loads,
+            '{}',
+            lazy=True,
+            select='a',
+        )
+        # The proxies aren't hashable, so they can't be returned for
+        # `frozen`.
+        self.assertRaises(
+            ValueError,
+            json5.loads,
+            '{a: [1]}',
+            lazy=True,
+            frozen=True,
+        )
+
+    def test_errors(self):
+        # Unbalanced brackets are caught right away.
+        self.assertEqual(
+            json5.parse('{a: [1}', lazy=True),
+            (None, '<string>:1 Unexpected "}" at column 7', 6),
+        )
+        self.assertEqual(
+            json5.parse('[1] x', lazy=True),
+            (None, '<string>:1 Unexpected "x" at column 5', 4),
+        )
+
+        # Anything else is caught when the container is used.
+        val = json5.loads('{a: 1, b: [1 2]}', lazy=True)
+        self.assertEqual(val['a'], 1)
+        with self.assertRaises(ValueError) as cm:
+            _ = val['b'][0]
+        self.assertEqual(
+            str(cm.exception), '<string>:1 Unexpected "2" at column 14'
+        )
+
+        val = json5.loads(
+            '[{a: 1, a: 2}]', allow_duplicate_keys=False, lazy=True
+        )
+        with self.assertRaises(ValueError) as cm:
+            _ = val[0]['a']
+        self.assertEqual(
+            str(cm.exception), 'Duplicate key "a" found in object'
+        )
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
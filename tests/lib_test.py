@@ -12,13 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
+import copy
 import io
 import math
+import mmap
 import os
+import pickle
+import shutil
+import tempfile
+import threading
 import unittest
 from collections import OrderedDict
+from unittest import mock
 
 import json5
+from json5 import lib, scanner
+
+# Some of the tests run against each of the engines in `lib._ENGINES`, or
+# with and without `lib._speedups`.
+# pylint: disable=protected-access
 
 
 class TestLoads(unittest.TestCase):
@@ -85,6 +98,31 @@ class TestLoads(unittest.TestCase):
         with self.assertRaises(UnicodeDecodeError):
             json5.load(io.BytesIO(b'\xff'))
 
+    def test_buffers(self):
+        doc = '\ufeff{"é": ["日本", 1.5], /* ü */ a: \'\\u00e9\\\n😀\'}'
+        data = doc.encode('utf-8')
+        expected = json5.loads(doc)
+        for engine in lib._ENGINES:
+            for buf in (data, bytearray(data), memoryview(data)):
+                self.assertEqual(json5.loads(buf, engine=engine), expected)
+        with tempfile.TemporaryFile() as fp:
+            fp.write(data)
+            fp.flush()
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self.assertEqual(json5.loads(m), expected)
+                self.assertEqual(json5.JSON5Decoder().decode(m), expected)
+
+        # Errors are the same as for the decoded text.
+        self.check_fail(
+            '[\n"é", x]'.encode(),
+            '<string>:2 Unexpected "x" at column 6',
+        )
+        for data in (b'["\xff"]', b'[1] // \xe2\x80', b'{\xc3\xa9: 1}\xc0'):
+            self.assertRaises(UnicodeDecodeError, json5.loads, data)
+            self.assertRaises(
+                UnicodeDecodeError, json5.JSON5Decoder().decode, data
+            )
+
     def test_numbers(self):
         # decimal literals
         self.check('1', 1)
@@ -221,6 +259,91 @@ class TestLoads(unittest.TestCase):
 
         self.assertEqual(json5.loads('1', parse_int=hook), '1')
 
+    def test_number_hooks_by_engine(self):
+        def hook(kind):
+            return lambda x, base=10: (kind, x, base)
+
+        s = '[7, -7, 123456789012, +0x1F, -0X1f, 1.5E+3, -.5, -Infinity, NaN]'
+        for engine in lib._ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(
+                    json5.loads(s, engine=engine),
+                    [7, -7, 123456789012, 31, -31, 1500.0, -0.5]
+                    + [float('-inf'), mock.ANY],
+                )
+                self.assertEqual(
+                    json5.loads(
+                        s,
+                        engine=engine,
+                        parse_int=hook('int'),
+                        parse_float=hook('float'),
+                        parse_constant=hook('const'),
+                    ),
+                    [
+                        ('int', '7', 10),
+                        ('int', '-7', 10),
+                        ('int', '123456789012', 10),
+                        ('int', '0x1F', 16),
+                        ('int', '-0x1f', 16),
+                        ('float', '1.5e+3', 10),
+                        ('float', '-.5', 10),
+                        ('const', '-Infinity', 10),
+                        ('const', 'NaN', 10),
+                    ],
+                )
+
+    def test_numeric_arrays(self):
+        s = """{
+            ints: [1, -2, 3],
+            floats: [1.5, 2, -Infinity],
+            nested: [[1], [0.5]],
+            empty: [],
+            mixed: [1, 'a'],
+            bools: [true, 1],
+            big: [1, 9223372036854775808],
+            inexact: [0.5, 9007199254740993],
+        }"""
+        for engine in lib._ENGINES:
+            with self.subTest(engine=engine):
+                val = json5.loads(s, engine=engine, numeric_arrays='array')
+                self.assertEqual(val['ints'], array.array('q', [1, -2, 3]))
+                self.assertEqual(
+                    val['floats'], array.array('d', [1.5, 2.0, -math.inf])
+                )
+                self.assertEqual(
+                    val['nested'],
+                    [array.array('q', [1]), array.array('d', [0.5])],
+                )
+                self.assertEqual(val['empty'], [])
+                self.assertEqual(val['mixed'], [1, 'a'])
+                self.assertEqual(val['bools'], [True, 1])
+                self.assertEqual(val['big'], [1, 9223372036854775808])
+                self.assertEqual(val['inexact'], [0.5, 9007199254740993])
+
+        # The arrays can be used as buffers without copying them.
+        val = json5.loads('[1.5, 2.5]', numeric_arrays='array')
+        self.assertEqual(memoryview(val).tolist(), [1.5, 2.5])
+
+        # Hooks that don't return ints and floats give lists.
+        self.assertEqual(
+            json5.loads('[1, 2]', parse_int=str, numeric_arrays='array'),
+            ['1', '2'],
+        )
+
+        self.assertRaises(
+            ValueError, json5.loads, '[1]', numeric_arrays='numpy'
+        )
+        self.assertRaises(
+            ValueError, json5.loads, '[1]', numeric_arrays='array', lazy=True
+        )
+        self.assertRaises(
+            ValueError,
+            json5.loads,
+            '[1]',
+            numeric_arrays='array',
+            frozen=True,
+        )
+
     def test_sample_file(self):
         path = os.path.join(os.path.dirname(__file__), '..', 'sample.json5')
         with open(path, encoding='utf-8') as fp:
@@ -340,6 +463,552 @@ class TestLoads(unittest.TestCase):
         self.check_fail('0 a', '<string>:1 Unexpected "a" at column 3')
 
 
+class TestDecodeError(unittest.TestCase):
+    def check(self, s, pos, lineno, colno, expected, **kwargs):
+        for engine in lib._ENGINES:
+            with self.subTest(engine=engine):
+                with self.assertRaises(json5.JSON5DecodeError) as cm:
+                    json5.loads(s, engine=engine, **kwargs)
+                err = cm.exception
+                self.assertEqual(err.doc, s)
+                self.assertEqual(err.pos, pos)
+                self.assertEqual((err.lineno, err.colno), (lineno, colno))
+                self.assertEqual(err.expected, frozenset(expected))
+                self.assertEqual(
+                    str(err), f'<string>:{lineno} {err.msg} at column {colno}'
+                )
+
+    def test_attributes(self):
+        self.check('[1 2]', 3, 1, 4, {',', ']'})
+        self.check('{\n  a 1}', 6, 2, 5, {':'})
+        self.check('{a: }', 4, 1, 5, {'value'})
+        self.check('{a: 1,', 6, 1, 7, {'key', '}'})
+        self.check('[1,\n', 4, 2, 1, {'value', ']'})
+        self.check('1 2', 2, 1, 3, {'end of input'})
+        self.check('"abc', 4, 1, 5, {'value'})
+        self.check('x 1 [2 3]', 7, 1, 8, {',', ']'}, start=4)
+
+    def test_message(self):
+        err = json5.JSON5DecodeError('[1 2]', 3)
+        self.assertIsInstance(err, ValueError)
+        self.assertEqual(err.msg, 'Unexpected "2"')
+        self.assertEqual(str(err), '<string>:1 Unexpected "2" at column 4')
+        self.assertEqual(
+            repr(err),
+            'JSON5DecodeError(\'<string>:1 Unexpected "2" at column 4\')',
+        )
+        self.assertIsNone(err.expected)
+        self.assertEqual(err.args, (str(err),))
+        err = json5.JSON5DecodeError('[1', 5)
+        self.assertEqual(err.msg, 'Unexpected end of input')
+        err = json5.JSON5DecodeError('[', 1, origin=(3, 5))
+        self.assertEqual(
+            str(err), '<string>:3 Unexpected end of input at column 6'
+        )
+
+    def test_pickle(self):
+        with self.assertRaises(json5.JSON5DecodeError) as cm:
+            json5.loads('{a: 1 b: 2}')
+        self.assertEqual(cm.exception.args[0], str(cm.exception))
+        err = pickle.loads(pickle.dumps(cm.exception))
+        self.assertEqual(str(err), str(cm.exception))
+        self.assertEqual(err.args, cm.exception.args)
+        self.assertEqual(err.pos, 6)
+        self.assertEqual(err.expected, frozenset({',', '}'}))
+
+    def test_other_errors(self):
+        # Errors that aren't about the syntax of the document are plain
+        # ValueErrors, and `parse()` still returns strings.
+        with self.assertRaises(ValueError) as cm:
+            json5.loads('{a: 1, a: 2}', allow_duplicate_keys=False)
+        self.assertNotIsInstance(cm.exception, json5.JSON5DecodeError)
+        self.assertEqual(
+            json5.parse('[1 2]'),
+            (None, '<string>:1 Unexpected "2" at column 4', 3),
+        )
+
+    def test_streams(self):
+        with self.assertRaises(json5.JSON5DecodeError) as cm:
+            list(json5.iterloads('1\n2 3', lines=True))
+        self.assertEqual((cm.exception.lineno, cm.exception.colno), (2, 3))
+        self.assertEqual(cm.exception.expected, frozenset({'end of line'}))
+
+        fp = io.StringIO('1\n2\n[3\n4 x]')
+        with self.assertRaises(json5.JSON5DecodeError) as cm:
+            list(json5.iterload(fp, chunk_size=2))
+        self.assertEqual((cm.exception.lineno, cm.exception.colno), (4, 1))
+        self.assertEqual(cm.exception.expected, frozenset({',', ']'}))
+
+        fp = io.StringIO('[1,\n2\n{a:1 b}]')
+        with self.assertRaises(json5.JSON5DecodeError) as cm:
+            list(json5.events(fp, chunk_size=2))
+        self.assertEqual((cm.exception.lineno, cm.exception.colno), (3, 1))
+        self.assertEqual(cm.exception.expected, frozenset({',', ']'}))
+
+
+class TestLoadPath(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, contents):
+        path = os.path.join(self.tmpdir, 'doc.json5')
+        with open(path, 'wb') as fp:
+            fp.write(contents.encode('utf-8'))
+        return path
+
+    def test_small_and_large_files(self):
+        for n in (10, 10000):
+            doc = '{a: [' + ', '.join(['"é"'] * n) + ']}'
+            path = self.write(doc)
+            for mmap_file in (True, False):
+                self.assertEqual(
+                    json5.load_path(path, mmap=mmap_file), json5.loads(doc)
+                )
+            self.assertEqual(
+                json5.load_path(path, select='a[1]', parse_int=str), 'é'
+            )
+
+    @mock.patch.object(lib, '_MMAP_MIN_SIZE', 0)
+    def test_start(self):
+        path = self.write('ü = [1, 2] // trailing')
+        for mmap_file in (True, False):
+            self.assertEqual(
+                json5.load_path(path, mmap=mmap_file, start=5), [1, 2]
+            )
+            with self.assertRaises(json5.JSON5DecodeError) as cm:
+                json5.load_path(path, mmap=mmap_file, start=2)
+            self.assertEqual(
+                str(cm.exception), '<string>:1 Unexpected "=" at column 2'
+            )
+            self.assertRaises(
+                UnicodeDecodeError,
+                json5.load_path,
+                path,
+                mmap=mmap_file,
+                start=1,
+            )
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), 'needs named pipes')
+    def test_pipes(self):
+        path = os.path.join(self.tmpdir, 'pipe')
+        os.mkfifo(path)
+        writer = threading.Thread(target=self.write_pipe, args=(path,))
+        writer.start()
+        try:
+            self.assertEqual(json5.load_path(path), {'a': 1})
+        finally:
+            writer.join()
+
+    @staticmethod
+    def write_pipe(path):
+        with open(path, 'w', encoding='utf-8') as fp:
+            fp.write('{a: 1}')
+
+
+class TestIterload(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, objs, **kwargs):
+        self.assertEqual(objs, list(json5.iterloads(s, **kwargs)))
+        for chunk_size in (1, 2, 3, 5, 100):
+            self.assertEqual(
+                objs,
+                list(
+                    json5.iterload(
+                        io.StringIO(s), chunk_size=chunk_size, **kwargs
+                    )
+                ),
+            )
+            self.assertEqual(
+                objs,
+                list(
+                    json5.iterload(
+                        io.BytesIO(s.encode('utf-8')),
+                        chunk_size=chunk_size,
+                        **kwargs,
+                    )
+                ),
+            )
+
+    def check_fail(self, s, objs, err, **kwargs):
+        iterators = [json5.iterloads(s, **kwargs)]
+        for chunk_size in (1, 2, 3, 5, 100):
+            iterators.append(
+                json5.iterload(io.StringIO(s), chunk_size=chunk_size, **kwargs)
+            )
+        for it in iterators:
+            actual = []
+            with self.assertRaises(ValueError) as cm:
+                # This keeps the values that came before the error.
+                actual.extend(it)
+            self.assertEqual(objs, actual)
+            self.assertEqual(err, str(cm.exception))
+
+    def test_empty(self):
+        self.check('', [])
+        self.check(' // comment\n /* comment */ ', [])
+
+    def test_values(self):
+        self.check('1 2 3', [1, 2, 3])
+        self.check('[1][2]{a:3}', [[1], [2], {'a': 3}])
+        self.check(
+            '{"a": "b\\nc"}\n/* x */ [1.5e3, -0x1F]\n',
+            [{'a': 'b\nc'}, [1500.0, -31]],
+        )
+        self.check("'\u00e9t\u00e9' 12345", ['\u00e9t\u00e9', 12345])
+        self.check('1 2', ['1', '2'], parse_int=str)
+
+    def test_errors(self):
+        self.check_fail(
+            '1 2 x', [1, 2], '<string>:1 Unexpected "x" at column 5'
+        )
+        self.check_fail(
+            '[1]\n[2]\n [x]',
+            [[1], [2]],
+            '<string>:3 Unexpected "x" at column 3',
+        )
+        self.check_fail(
+            '[1, 2', [], '<string>:1 Unexpected end of input at column 6'
+        )
+        self.check_fail(
+            '1 /* x', [1], '<string>:1 Unexpected end of input at column 7'
+        )
+        self.check_fail(
+            '0\\u0041', [], '<string>:1 Unexpected "\\" at column 2'
+        )
+        self.check_fail('1 1e', [1], "could not convert string to float: '1e'")
+
+    def test_lines(self):
+        self.check(
+            '{"a": 1}\n{"a": 2}\n\n[\n  3,\n]  // comment\n4\r\n',
+            [{'a': 1}, {'a': 2}, [3], 4],
+            lines=True,
+        )
+        self.check('1 /* x\n */ 2', [1, 2], lines=True)
+        self.check_fail(
+            '1\n2 3\n',
+            [1, 2],
+            '<string>:2 Unexpected "3" at column 3',
+            lines=True,
+        )
+        self.check_fail(
+            '[1][2]',
+            [[1]],
+            '<string>:1 Unexpected "[" at column 4',
+            lines=True,
+        )
+
+
+class TestEvents(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, events, **kwargs):
+        self.assertEqual(events, list(json5.events(s, **kwargs)))
+        for chunk_size in (1, 2, 3, 5, 100):
+            self.assertEqual(
+                events,
+                list(
+                    json5.events(
+                        io.StringIO(s), chunk_size=chunk_size, **kwargs
+                    )
+                ),
+            )
+            self.assertEqual(
+                events,
+                list(
+                    json5.events(
+                        io.BytesIO(s.encode('utf-8')),
+                        chunk_size=chunk_size,
+                        **kwargs,
+                    )
+                ),
+            )
+
+    def check_fail(self, s, events, err):
+        for source in (s, io.StringIO(s)):
+            actual = []
+            with self.assertRaises(ValueError) as cm:
+                actual.extend(json5.events(source, chunk_size=2))
+            self.assertEqual(events, actual)
+            self.assertEqual(err, str(cm.exception))
+
+    def test_scalars(self):
+        self.check('null', [('null', None, 0)])
+        self.check(' true ', [('boolean', True, 1)])
+        self.check('false', [('boolean', False, 0)])
+        self.check('"foo"', [('string', 'foo', 0)])
+        self.check('-0x1F', [('number', -31, 0)])
+        self.check('1.5e3', [('number', 1500.0, 0)])
+        self.check('12345', [('number', '12345', 0)], parse_int=str)
+
+    def test_containers(self):
+        self.check('[]', [('start_array', None, 0), ('end_array', None, 1)])
+        self.check('{}', [('start_map', None, 0), ('end_map', None, 1)])
+        self.check(
+            '// comment\n{a: [1, "b\\n",], \'c\': {d: null}, }',
+            [
+                ('start_map', None, 11),
+                ('map_key', 'a', 12),
+                ('start_array', None, 15),
+                ('number', 1, 16),
+                ('string', 'b\n', 19),
+                ('end_array', None, 25),
+                ('map_key', 'c', 28),
+                ('start_map', None, 33),
+                ('map_key', 'd', 34),
+                ('null', None, 37),
+                ('end_map', None, 41),
+                ('end_map', None, 44),
+            ],
+        )
+
+    def test_errors(self):
+        self.check_fail(
+            '[1, x]',
+            [('start_array', None, 0), ('number', 1, 1)],
+            '<string>:1 Unexpected "x" at column 5',
+        )
+        self.check_fail(
+            '{a\n\n 1}',
+            [('start_map', None, 0), ('map_key', 'a', 1)],
+            '<string>:3 Unexpected "1" at column 2',
+        )
+        self.check_fail(
+            '[1]]',
+            [
+                ('start_array', None, 0),
+                ('number', 1, 1),
+                ('end_array', None, 2),
+            ],
+            '<string>:1 Unexpected "]" at column 4',
+        )
+        self.check_fail(
+            '', [], '<string>:1 Unexpected end of input at column 1'
+        )
+
+
+class TestFrozen(unittest.TestCase):
+    def test_frozen(self):
+        doc = '{a: [1, {b: [2]}], c: {}}'
+        for engine in lib._ENGINES:
+            val = json5.loads(doc, frozen=True, engine=engine)
+            self.assertIsInstance(val, json5.FrozenDict)
+            self.assertEqual(val, {'a': (1, {'b': (2,)}), 'c': {}})
+            self.assertIsInstance(val['a'], tuple)
+            self.assertIsInstance(val['a'][1], json5.FrozenDict)
+            self.assertEqual(
+                hash(val),
+                hash(json5.loads('{c: {}, a: [1, {b: [2]}]}', frozen=True)),
+            )
+        self.assertEqual(
+            list(json5.iterloads('[1] {a: [2]}', frozen=True)),
+            [(1,), {'a': (2,)}],
+        )
+        self.assertEqual(
+            json5.loads('{a: [[1, 2]]}', select='a[0]', frozen=True), (1, 2)
+        )
+
+    def test_frozen_dict(self):
+        d = json5.FrozenDict({'a': 1})
+        self.assertEqual(repr(d), "FrozenDict({'a': 1})")
+        for mutate in (
+            lambda: d.__setitem__('b', 2),
+            lambda: d.__delitem__('a'),
+            lambda: d.update(b=2),
+            lambda: d.setdefault('b', 2),
+            lambda: d.pop('a'),
+            d.popitem,
+            d.clear,
+        ):
+            self.assertRaises(TypeError, mutate)
+        self.assertEqual(d, {'a': 1})
+        self.assertEqual(copy.deepcopy(d), d)
+        self.assertIsInstance(copy.deepcopy(d), json5.FrozenDict)
+        self.assertEqual(pickle.loads(pickle.dumps(d)), d)
+        self.assertEqual(json5.dumps(d), '{a: 1}')
+        self.assertRaises(TypeError, hash, json5.FrozenDict({'a': [1]}))
+
+
+class TestIntern(unittest.TestCase):
+    def test_intern(self):
+        doc = '[{"key": "short", k2: "a longer string"}] [{key: "short"}]'
+        for engine in lib._ENGINES:
+            first, second = json5.iterloads(
+                doc, engine=engine, intern_keys=True, intern_strings=5
+            )
+            self.assertIs(next(iter(first[0])), next(iter(second[0])))
+            self.assertIs(first[0]['key'], second[0]['key'])
+
+            first, second = json5.iterloads(
+                doc, engine=engine, intern_keys=True
+            )
+            self.assertIs(next(iter(first[0])), next(iter(second[0])))
+            self.assertIsNot(first[0]['key'], second[0]['key'])
+
+            # Interning strings doesn't intern keys too.
+            first, second = json5.iterloads(
+                doc, engine=engine, intern_strings=5
+            )
+            self.assertIsNot(next(iter(first[0])), next(iter(second[0])))
+            self.assertIs(first[0]['key'], second[0]['key'])
+
+    def test_shared_table(self):
+        table = {}
+        for engine in lib._ENGINES:
+            a = json5.loads(
+                '{"some key": 1}', engine=engine, intern_keys=table
+            )
+            b = json5.loads(
+                '{"some key": 2}', engine=engine, intern_keys=table
+            )
+            self.assertIs(next(iter(a)), next(iter(b)))
+            self.assertEqual(table, {'some key': 'some key'})
+
+    def test_table_size_is_bounded(self):
+        for engine in lib._ENGINES:
+            table = {str(i): str(i) for i in range(scanner.MAX_INTERNED)}
+            val = json5.loads(
+                '{"a": "b"}',
+                engine=engine,
+                intern_keys=table,
+                intern_strings=1,
+            )
+            self.assertEqual(val, {'a': 'b'})
+            self.assertEqual(len(table), scanner.MAX_INTERNED)
+
+
+class TestSelect(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, select, expected, **kwargs):
+        self.assertEqual(expected, json5.loads(s, select=select, **kwargs))
+        # Also check the pure-Python way of skipping values.
+        with mock.patch.object(lib, '_speedups', None):
+            self.assertEqual(expected, json5.loads(s, select=select, **kwargs))
+
+    def check_fail(self, s, select, err):
+        for speedups in (lib._speedups, None):
+            with mock.patch.object(lib, '_speedups', speedups):
+                with self.assertRaises(ValueError) as cm:
+                    json5.loads(s, select=select)
+                self.assertEqual(err, str(cm.exception))
+
+    def test_single_path(self):
+        doc = """{
+            a: {b: [1, 'two', {c: 3, d: [4]}]},
+            // A comment with a ] in it.
+            e: ["}", '\\'', /* [ */ {f: null}],
+        }"""
+        self.check(doc, 'a.b[2].c', 3)
+        self.check(doc, 'a.b[2]', {'c': 3, 'd': [4]})
+        self.check(doc, 'e[2].f', None)
+        self.check(doc, '', json5.loads(doc))
+        self.check('[[1, 2], [3, 4]]', '[1][0]', 3)
+        self.check('{"x.y": {"[z]": 1}}', '["x.y"][\'[z]\']', 1)
+
+    def test_multiple_paths(self):
+        doc = '{a: {b: 1, c: [2, 3]}, d: 4}'
+        self.check(
+            doc, ['a.b', 'a.c[1]', 'd'], {'a.b': 1, 'a.c[1]': 3, 'd': 4}
+        )
+        self.check(doc, ['a.x', 'a.b[0]', 'd.e', 'a.c[2]'], {})
+        self.check(
+            doc, ['a', 'a.c'], {'a': {'b': 1, 'c': [2, 3]}, 'a.c': [2, 3]}
+        )
+        self.check(doc, (), {})
+
+    def test_duplicate_keys(self):
+        self.check('{a: {b: 1}, a: {c: 2}}', ['a.b', 'a.c'], {'a.c': 2})
+        with self.assertRaises(ValueError):
+            json5.loads(
+                '{a: 1, a: 2, b: {c: 3, c: 4}}',
+                select='b',
+                allow_duplicate_keys=False,
+            )
+        self.assertEqual(
+            {'c': 3},
+            json5.loads(
+                '{a: 1, a: 2, b: {c: 3}}',
+                select='b',
+                allow_duplicate_keys=False,
+            ),
+        )
+
+    def test_hooks(self):
+        self.check(
+            '{a: 1, b: {c: 1.5}}',
+            'b',
+            {'c': '1.5'},
+            parse_float=str,
+        )
+        self.check(
+            '{a: 1, b: {c: 1.5}}',
+            ['b', 'b.c'],
+            {'b': [('c', 1.5)]},
+            object_pairs_hook=list,
+        )
+
+    def test_overlapping_paths_with_hooks(self):
+        self.check(
+            '{a: [1, 2]}',
+            ['a', 'a[1]'],
+            {'a': array.array('q', [1, 2]), 'a[1]': 2},
+            numeric_arrays='array',
+        )
+        self.check(
+            '{a: {b: {c: 1}}}',
+            ['a', 'a.b.c'],
+            {
+                'a': OrderedDict([('b', OrderedDict([('c', 1)]))]),
+                'a.b.c': 1,
+            },
+            object_pairs_hook=OrderedDict,
+        )
+        self.check(
+            '{a: [[1.5]]}',
+            ['a', 'a[0][0]', 'a[0].x'],
+            {'a': ((1.5,),), 'a[0][0]': 1.5},
+            frozen=True,
+        )
+
+    def test_skipped_values_are_not_checked(self):
+        self.check('{a: [1 2 x], b: 1}', 'b', 1)
+
+    def test_errors(self):
+        self.check_fail('{a: 1}', 'b', "Nothing found at 'b'")
+        self.check_fail(
+            '{a: [1, 2}, b: 1}',
+            'b',
+            '<string>:1 Unexpected "}" at column 10',
+        )
+        self.check_fail(
+            '{a: "1, b: 1}',
+            'b',
+            '<string>:1 Unexpected end of input at column 14',
+        )
+        self.check_fail(
+            '{a: 1, b: 1} x',
+            'b',
+            '<string>:1 Unexpected "x" at column 14',
+        )
+        self.check_fail(
+            '{a: 1, b: [1, x]}',
+            'b',
+            '<string>:1 Unexpected "x" at column 15',
+        )
+        self.check_fail('{a: 1}', 'a..b', "Invalid path 'a..b'")
+        self.check_fail('{a: 1}', 'a[x]', "Invalid path 'a[x]'")
+
+    def test_parse(self):
+        self.assertEqual(
+            ([2], None, 8),
+            json5.parse('[1, [2]] 3', select='[1]', consume_trailing=False),
+        )
+
+
 class TestParse(unittest.TestCase):
     maxDiff = None
 
@@ -380,6 +1049,168 @@ class TestParse(unittest.TestCase):
         self.assertEqual(err, None)
         self.assertEqual(pos, 4)
 
+    def test_engine(self):
+        for engine in (None, 'scanner', 'parser'):
+            self.assertEqual(
+                json5.parse('{a: [1, 2.5]}', engine=engine),
+                ({'a': [1, 2.5]}, None, 13),
+            )
+            self.assertEqual(
+                json5.loads('[1, 2]', engine=engine),
+                [1, 2],
+            )
+        self.assertRaises(ValueError, json5.parse, '1', engine='bogus')
+
+    def test_parser_alternatives(self):
+        # These take different paths through the grammar's alternatives.
+        s = '[1, 2.5, -3e2, .5E1, 0x1f, 0, {}, [ ], { a: [] /**/ }, [4, ], ]'
+        for engine in lib._ENGINES:
+            self.assertEqual(
+                json5.loads(s, engine=engine),
+                [1, 2.5, -300.0, 5.0, 31, 0, {}, [], {'a': []}, [4]],
+            )
+            self.assertEqual(
+                json5.loads(
+                    '["a", \'b\', null, true, false, +1, -Infinity, 9]',
+                    engine=engine,
+                ),
+                ['a', 'b', None, True, False, 1, -math.inf, 9],
+            )
+            self.assertTrue(math.isnan(json5.loads('NaN', engine=engine)))
+            for doc in ('nul', 'x', '[', '-', '.', "'", '{ a'):
+                self.assertEqual(
+                    json5.parse(doc, engine=engine),
+                    json5.parse(doc, engine='scanner'),
+                )
+
+
+class TestDecoder(unittest.TestCase):
+    def test_decode(self):
+        for engine in lib._ENGINES:
+            decoder = json5.JSON5Decoder(engine=engine, parse_float=str)
+            self.assertEqual(decoder.decode('{a: [1.5]}'), {'a': ['1.5']})
+            self.assertEqual(decoder.decode('2.5'), '2.5')
+            self.assertRaises(json5.JSON5DecodeError, decoder.decode, '[1] x')
+            self.assertRaises(ValueError, decoder.decode, '')
+
+    def test_options(self):
+        decoder = json5.JSON5Decoder(
+            allow_duplicate_keys=False, frozen=True, strict=False
+        )
+        self.assertEqual(decoder.decode('["a\nb"]'), ('a\nb',))
+        self.assertRaises(ValueError, decoder.decode, '{a: 1, a: 2}')
+        self.assertIs(decoder.frozen, True)
+
+    def test_shared_intern_table(self):
+        decoder = json5.JSON5Decoder(intern_keys=True)
+        first = decoder.decode('{"abc" : 1}')
+        second = decoder.decode('{"abc" : 2}')
+        self.assertIs(next(iter(first)), next(iter(second)))
+
+    def test_raw_decode(self):
+        decoder = json5.JSON5Decoder()
+        self.assertEqual(decoder.raw_decode('[1] [2]'), ([1], 3))
+        self.assertEqual(decoder.raw_decode('[1] [2]', 3), ([2], 7))
+        with self.assertRaises(json5.JSON5DecodeError) as cm:
+            decoder.raw_decode('[1] [2', 3)
+        self.assertEqual(cm.exception.pos, 6)
+
+        for s in ('1', b'1'):
+            with self.subTest(s=s):
+                with self.assertRaises(json5.JSON5DecodeError) as cm:
+                    decoder.raw_decode(s, 1)
+                self.assertEqual(cm.exception.msg, 'Unexpected end of input')
+                with self.assertRaises(ValueError) as cm:
+                    decoder.raw_decode(s, 5)
+                self.assertEqual(
+                    str(cm.exception), 'idx must be between 0 and 1, not 5'
+                )
+                self.assertRaises(ValueError, decoder.raw_decode, s, -1)
+
+    def test_raw_decode_buffers(self):
+        decoder = json5.JSON5Decoder()
+        data = 'é = {a: ["ü", 2]} // rest'.encode()
+        for buf in (data, bytearray(data), memoryview(data)):
+            self.assertEqual(decoder.raw_decode(buf, 5), ({'a': ['ü', 2]}, 19))
+
+        with tempfile.TemporaryFile() as fp:
+            fp.write(b'x' * 5000 + data)
+            fp.flush()
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self.assertEqual(
+                    decoder.raw_decode(m, 5005), ({'a': ['ü', 2]}, 5019)
+                )
+
+        # Values bigger than the part of the buffer that is decoded at
+        # first, and values cut off by the end of the buffer.
+        big = json5.dumps([{'ü': i} for i in range(2000)]).encode('utf-8')
+        self.assertEqual(
+            decoder.raw_decode(b'  ' + big + b' 1', 2),
+            (json5.loads(big), len(big) + 2),
+        )
+        self.assertEqual(decoder.raw_decode(b'[1, 23]', 4), (23, 6))
+        with self.assertRaises(json5.JSON5DecodeError) as cm:
+            decoder.raw_decode(b'xyz\n[1,\n2 3]', 4)
+        self.assertEqual((cm.exception.lineno, cm.exception.colno), (2, 3))
+        self.assertRaises(
+            json5.JSON5DecodeError, decoder.raw_decode, big[:-1], 0
+        )
+        self.assertRaises(
+            UnicodeDecodeError, decoder.raw_decode, 'ü'.encode(), 1
+        )
+
+        # Both kinds of input use the settings the decoder was made with.
+        for strict in (True, False):
+            decoder = json5.JSON5Decoder(strict=strict)
+            for doc in ('"a\nb" 1', b'"a\nb" 1'):
+                if strict:
+                    self.assertRaises(ValueError, decoder.raw_decode, doc)
+                else:
+                    self.assertEqual(decoder.raw_decode(doc), ('a\nb', 5))
+
+    def test_raw_decode_non_ascii(self):
+        decoder = json5.JSON5Decoder()
+        for doc in ('[/* \u00e9 */ 1]', "['\u00e9]', 1]", '{"\u20ac": 1}'):
+            with self.subTest(doc=doc):
+                val = json5.loads(doc)
+                self.assertEqual(
+                    decoder.raw_decode(doc + ' x'), (val, len(doc))
+                )
+                data = (doc + ' x').encode('utf-8')
+                self.assertEqual(
+                    decoder.raw_decode(data), (val, len(doc.encode('utf-8')))
+                )
+
+        # An error in a value that is bigger than the part of the buffer
+        # that is decoded at first.
+        big = '[' + '/* \u00e9 */ 1, ' * 1000 + '1 2]'
+        with self.assertRaises(json5.JSON5DecodeError) as cm:
+            decoder.raw_decode(big.encode('utf-8'))
+        self.assertEqual(cm.exception.pos, len(big) - 2)
+
+    @unittest.skipUnless(lib._speedups, 'the C extension is not built')
+    def test_skip_non_ascii(self):
+        skip = lib._speedups.skip
+        self.assertEqual(skip('[/* \u00e9 */ 1]', 0), 11)
+        self.assertEqual(skip('x ["\u00e9]", // \u00fc\n 1] y', 2), 17)
+        self.assertEqual(skip('{a: "\u20ac}"} ', 0), 9)
+        self.assertEqual(skip('{a: "\U0001f600"', 0), -1)
+        self.assertEqual(skip('[/* \u00e9 */ 1', 0), -1)
+
+    def test_iterdecode(self):
+        decoder = json5.JSON5Decoder()
+        self.assertEqual(list(decoder.iterdecode('1 [2]\n3')), [1, [2], 3])
+        self.assertEqual(list(decoder.iterdecode(b'1 [2]\n3')), [1, [2], 3])
+        self.assertEqual(
+            list(decoder.iterdecode(memoryview('"\u00e9" 2'.encode()))),
+            ['\u00e9', 2],
+        )
+        self.assertRaises(
+            json5.JSON5DecodeError,
+            list,
+            decoder.iterdecode('1 [2]\n3', lines=True),
+        )
+
 
 class TestDump(unittest.TestCase):
     def test_basic(self):
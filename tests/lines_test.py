@@ -0,0 +1,62 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+import json5
+from json5 import lib, lines
+
+# The tests run against each of the engines in `lib._ENGINES`.
+# pylint: disable=protected-access
+
+
+class LineIndexTest(unittest.TestCase):
+    def test_position_and_offset(self):
+        for text in ('', 'abc', '\n', 'a\nbc\n', '\n\nx\r\ny'):
+            index = json5.LineIndex(text)
+            self.assertEqual(len(index), text.count('\n') + 1)
+            lineno, colno = 1, 1
+            for pos in range(len(text) + 1):
+                self.assertEqual(index.position(pos), (lineno, colno))
+                self.assertEqual(index.offset(lineno, colno), pos)
+                if pos < len(text) and text[pos] == '\n':
+                    lineno, colno = lineno + 1, 1
+                else:
+                    colno += 1
+
+    def test_line_index_is_cached(self):
+        text = '[\n' + '1,\n' * 1000 + ']'
+        self.assertIs(json5.line_index(text), json5.line_index(text))
+        self.assertIsNot(json5.line_index(text), json5.line_index('[]'))
+
+    def test_line_index_checks_the_text(self):
+        # Strings with the same length and hash don't share an index.
+        with mock.patch.object(lines, 'hash', create=True, return_value=1):
+            first = json5.line_index('a\nb')
+            second = json5.line_index('ab\n')
+        self.assertEqual(first.position(2), (2, 1))
+        self.assertEqual(second.position(2), (1, 3))
+
+    def test_errors(self):
+        text = '[\n' + '1,\n' * 1000 + 'x]'
+        for engine in lib._ENGINES:
+            self.assertEqual(
+                json5.parse(text, engine=engine),
+                (None, '<string>:1002 Unexpected "x" at column 1', 3002),
+            )
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
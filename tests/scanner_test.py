@@ -0,0 +1,185 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import json5
+from json5 import lib
+
+# The tests run against each of the engines in `lib._ENGINES`.
+# pylint: disable=protected-access
+
+# Inputs that exercise the corners of the grammar, including the
+# places where the generated parser reports errors past the character
+# it actually failed on.
+CASES = [
+    'null',
+    'true',
+    'false',
+    'nul',
+    'truex',
+    'Infinity',
+    '-Infinity',
+    '+NaN',
+    'Inf',
+    'NaNx',
+    '0',
+    '-0',
+    '00',
+    '0x',
+    '0x1F',
+    '0X1f',
+    '0xg',
+    '1.',
+    '.5',
+    '.',
+    '1e',
+    '1e+',
+    '1E-5',
+    '1.5e3',
+    '1a',
+    '1\\u0041',
+    '1\\u00',
+    '+-1',
+    '"abc"',
+    "'abc'",
+    '"a\\nb\\tc\\\\"',
+    '"\\x41\\u0042"',
+    '"\\x4"',
+    '"\\u12"',
+    '"\\0"',
+    '"\\01"',
+    '"\\1"',
+    '"a\\\nb"',
+    '"a\\\r\nb"',
+    '"a\nb"',
+    '"a\u2028b"',
+    '"\\q"',
+    '"abc',
+    '[]',
+    '[1, 2, 3,]',
+    '[,]',
+    '[1 2]',
+    '[1,,]',
+    '[1',
+    '{}',
+    '{a: 1}',
+    '{"a": 1, \'b\': 2,}',
+    '{$_a1: 1}',
+    '{\\u0061b: 1}',
+    '{a b: 1}',
+    '{a: 1 b: 2}',
+    '{1: 2}',
+    '{a 1}',
+    '{a: 1',
+    '{\u00e9t\u00e9: 1}',
+    '// comment\n1',
+    '/* block */ 1',
+    '/* unterminated',
+    '/ 1',
+    '1 /',
+    '1 //',
+    '1 /* x */ ',
+    '1 2',
+    '\u00a0\ufeff 1 \u2028',
+    '\u3000[\u2003]',
+]
+
+
+def _tag(kind):
+    def hook(*args, **kwargs):
+        return (kind, args, kwargs)
+
+    return hook
+
+
+class ScannerTest(unittest.TestCase):
+    maxDiff = None
+
+    # The engines to compare against the generated parser. The C extension
+    # is only tested if it has been built.
+    engines = sorted(set(lib._ENGINES) - {'parser'})
+
+    def check(self, s, strict=True, consume_trailing=True, start=0):
+        # The hooks record exactly what they were called with.
+        kwargs = {
+            'strict': strict,
+            'consume_trailing': consume_trailing,
+            'start': start,
+            'object_pairs_hook': _tag('object'),
+            'parse_float': _tag('float'),
+            'parse_int': _tag('int'),
+            'parse_constant': _tag('constant'),
+        }
+        expected = json5.parse(s, engine='parser', **kwargs)
+        for engine in self.engines:
+            actual = json5.parse(s, engine=engine, **kwargs)
+            self.assertEqual(expected, actual, f'{engine}: {s!r}')
+
+    def test_matches_parser(self):
+        for s in CASES:
+            with self.subTest(s=s):
+                self.check(s)
+                self.check(s, strict=False)
+                self.check(s, consume_trailing=False)
+
+    def test_start(self):
+        self.check('x [1, 2]', start=1)
+        self.check('[1] [2]', start=3, consume_trailing=False)
+        self.check('[1] x', start=3)
+
+    def test_hook_errors(self):
+        # Syntax errors take precedence over errors raised by hooks, no
+        # matter where in the document they are.
+        for engine in lib._ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(
+                    json5.parse('[1e, x]', engine=engine),
+                    (None, '<string>:1 Unexpected "x" at column 6', 5),
+                )
+                self.assertEqual(
+                    json5.parse('[1e, 2]', engine=engine),
+                    (None, "could not convert string to float: '1e'", 7),
+                )
+                self.assertEqual(
+                    json5.parse(
+                        '{a: 1, a: 2} ',
+                        engine=engine,
+                        allow_duplicate_keys=False,
+                    ),
+                    (None, 'Duplicate key "a" found in object', 13),
+                )
+
+                # That includes hooks that fail with other exceptions,
+                # which are raised as they are if there's no syntax error.
+                self.assertEqual(
+                    json5.parse('[0x10, x]', engine=engine, parse_int=str),
+                    (None, '<string>:1 Unexpected "x" at column 8', 7),
+                )
+                self.assertRaises(
+                    TypeError,
+                    json5.parse,
+                    '[0x10]',
+                    engine=engine,
+                    parse_int=str,
+                )
+                self.assertEqual(
+                    json5.parse(
+                        '{a: 0x10, b: 1 2}',
+                        engine=engine,
+                        parse_int=str,
+                        select='a',
+                    ),
+                    (None, '<string>:1 Unexpected "2" at column 16', 15),
+                )
@@ -173,6 +173,14 @@ class ToolTest(unittest.TestCase):
         }
         self.check(['foo.json5'], files=files, out='"foo"\n')
 
+    def test_read_utf8_from_a_file(self):
+        files = {
+            'foo.json5': '// \u00e9\n{"\u00e9": "\u20ac"}\n',
+        }
+        self.check(
+            ['foo.json5'], files=files, out='{\n    \u00e9: "\\u20ac",\n}\n'
+        )
+
     def test_trailing_commas(self):
         self.check(
             ['--trailing-commas', '-c', '{foo: 1}'],
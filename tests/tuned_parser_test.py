@@ -0,0 +1,84 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from json5.parser import Parser
+from json5.tuned_parser import TunedParser
+from tests.scanner_test import CASES
+
+DOC = '{a: [{b: [], c: {}}, [null, true, false]],\n// c\n d: "e",}'
+
+# More inputs, for the rules that `CASES` doesn't reach.
+EXTRA_CASES = [
+    DOC,
+    '"a\x01b"',
+    "'\x1f'",
+    "'a\\'b\"c'",
+    '{a\u0301\u0903\u0660\u203f: 1}',
+    '{\u2160: 1}',
+    '{a\u200c\u200d: 1}',
+    '{a\u00ab: 1}',
+    '{\\u00e9: 1}',
+    '{a\\u0030: 1}',
+    '[1e5, -.5E-3, +0x1f, 0.e1, 5e, NaN, -Infinity]',
+    '[\t\v\f\ufeff\u00a0 1\r\n]',
+    '[1, /]',
+    '[1 /* x',
+    '{"a" /: 1}',
+    '"a\\',
+    '-0x',
+    'Infinit',
+    '{a\\u00: 1}',
+    '{a\\x: 1}',
+    '[-01]',
+    '[1, /* a */ ]',
+    '{a: 1, // b\n}',
+    '[1, [2, /* c */ x]]',
+]
+
+
+class TunedParserTest(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, strict=True, consume_trailing=True, pos=0):
+        global_vars = {
+            '_strict': strict,
+            '_consume_trailing': consume_trailing,
+        }
+        expected = Parser(s, '<string>', pos=pos).parse(global_vars)
+        actual = TunedParser(s, '<string>', pos=pos).parse(global_vars)
+        self.assertEqual(expected, actual, repr(s))
+
+    def test_matches_parser(self):
+        for s in CASES + EXTRA_CASES:
+            with self.subTest(s=s):
+                self.check(s)
+                self.check(s, strict=False)
+                self.check(s, consume_trailing=False)
+
+    def test_pos(self):
+        self.check('x [1, 2]', pos=1)
+        self.check('[1] [2]', pos=3, consume_trailing=False)
+        self.check('[1] x', pos=3)
+
+    def test_prefixes(self):
+        # Every prefix of a valid document is invalid somewhere.
+        for i in range(len(DOC)):
+            with self.subTest(s=DOC[:i]):
+                self.check(DOC[:i])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()